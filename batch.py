@@ -0,0 +1,103 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext, redirect_stdout
+import glob
+import json
+import os
+import sys
+from typing import Any, Iterator
+
+import registry
+import runner
+
+
+def find_inputs(inputs: str, day: int) -> list[str]:
+    # either a glob which may contain '{day}' placeholder or a corpus directory
+    # with one subdirectory per day ('<dir>/day_<N>/...')
+    if os.path.isdir(inputs):
+        pattern = os.path.join(inputs, f'day_{day}', '*')
+    else:
+        pattern = inputs.format(day=day)
+    return sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+
+def job_key(day: int, part: int, input_file: str) -> tuple[int, int, str]:
+    return day, part, os.path.abspath(input_file)
+
+
+def load_finished_jobs(output_file: str) -> set[tuple[int, int, str]]:
+    finished = set()
+    try:
+        with open(output_file) as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # last line may be cut off when the batch was interrupted
+                    continue
+                # failed jobs are run again
+                if 'error' in record or 'answer' not in record:
+                    continue
+                finished.add(job_key(record['day'], record['part'], record['input']))
+    except FileNotFoundError:
+        pass
+    return finished
+
+
+def solve_job(day: int, part: int, input_file: str, is_batch_safe: bool) -> dict[str, Any]:
+    record = {'day': day, 'part': part, 'input': os.path.abspath(input_file)}
+    # results may be streamed to stdout, so days printing diagnostics get stderr instead
+    try:
+        with nullcontext() if is_batch_safe else redirect_stdout(sys.stderr):
+            result = runner.solve_part(day, part, input_file, use_cache=False)
+        record.update(answer=result.answer, wall_time=result.wall_time, cpu_time=result.cpu_time)
+    except Exception as e:
+        record['error'] = f'{type(e).__name__}: {e}'
+    return record
+
+
+def run_batch(jobs: list[tuple[int, int, str]], workers: int = None) -> Iterator[dict[str, Any]]:
+    # registry is read once per batch rather than once per job
+    available = registry.read_registry()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_job, *job, available[job[0]].is_batch_safe) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Solve a corpus of puzzle inputs')
+    parser.add_argument('--day', '-d', required=True, help="day number, range like '1-10' or 'all'")
+    parser.add_argument('--part', '-p', choices=['1', '2', 'both'], default='both')
+    parser.add_argument('--inputs', '-i', required=True,
+                        help="glob of input files which may contain '{day}' placeholder, "
+                             "or directory with day_<N> subdirectories")
+    parser.add_argument('--output', '-o', help='JSONL file to append results to, stdout by default')
+    parser.add_argument('--resume', action='store_true',
+                        help='skip jobs already solved in the output file, failed ones are run again')
+    parser.add_argument('--workers', '-w', type=int, help='size of process pool')
+    args = parser.parse_args(argv)
+
+    finished = load_finished_jobs(args.output) if args.resume and args.output else set()
+    jobs = [(day, part, input_file)
+            for day in runner.parse_days(args.day)
+            for input_file in find_inputs(args.inputs, day)
+            for part in runner.parse_parts(args.part)
+            if job_key(day, part, input_file) not in finished]
+    print(f'{len(jobs)} jobs to run, {len(finished)} already finished', file=sys.stderr)
+
+    out = open(args.output, 'a') if args.output else sys.stdout
+    failed = 0
+    try:
+        for record in run_batch(jobs, args.workers):
+            failed += 'error' in record
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import json
+import math
+import statistics
+import time
+from typing import Any, Callable, NamedTuple
+
+
+class PartStats(NamedTuple):
+    day: int
+    part: int
+    runs: int
+    min: float
+    median: float
+    p95: float
+    stddev: float
+    # bytes of input the solver scans, 0 when unknown
+    input_bytes: int = 0
+
+    def throughput(self) -> float:
+        # MB of input per second at the median
+        return self.input_bytes / self.median / 1e6 if self.median > 0 else 0.0
+
+
+class Regression(NamedTuple):
+    stats: PartStats
+    baseline_median: float
+    change_pct: float
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    rank = q / 100 * (len(ordered) - 1)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def time_solver(solver: Callable, solver_input: Any, warmup: int, repeats: int) -> list[float]:
+    for _ in range(warmup):
+        solver(solver_input)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        solver(solver_input)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def compute_stats(day: int, part: int, timings: list[float], input_bytes: int = 0) -> PartStats:
+    return PartStats(
+        day=day,
+        part=part,
+        runs=len(timings),
+        min=min(timings),
+        median=statistics.median(timings),
+        p95=percentile(timings, 95),
+        stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        input_bytes=input_bytes
+    )
+
+
+def benchmark_part(day: int,
+                   part: int,
+                   solver: Callable,
+                   solver_input: Any,
+                   warmup: int,
+                   repeats: int,
+                   input_bytes: int = 0) -> PartStats:
+    return compute_stats(day, part, time_solver(solver, solver_input, warmup, repeats), input_bytes)
+
+
+def save_results(path: str, results: list[PartStats]) -> None:
+    with open(path, 'w') as file:
+        json.dump([r._asdict() for r in results], file, indent=2)
+
+
+def load_baseline(path: str) -> dict[tuple[int, int], PartStats]:
+    with open(path) as file:
+        return {(entry['day'], entry['part']): PartStats(**entry) for entry in json.load(file)}
+
+
+def find_regressions(results: list[PartStats],
+                     baseline: dict[tuple[int, int], PartStats],
+                     threshold_pct: float) -> list[Regression]:
+    regressions = []
+    for stats in results:
+        reference = baseline.get((stats.day, stats.part))
+        if reference is None or reference.median <= 0:
+            continue
+        change_pct = 100 * (stats.median - reference.median) / reference.median
+        if change_pct > threshold_pct:
+            regressions.append(Regression(stats, reference.median, change_pct))
+    return regressions
+
+
+def print_stats_table(results: list[PartStats]) -> None:
+    print(f'{"day":>3} {"part":>4} {"runs":>4} {"min [s]":>10} {"median [s]":>10} '
+          f'{"p95 [s]":>10} {"stddev [s]":>10} {"MB/s":>10}')
+    for r in results:
+        throughput = f'{r.throughput():>10.2f}' if r.input_bytes else f'{"-":>10}'
+        print(f'{r.day:>3} {r.part:>4} {r.runs:>4} {r.min:>10.4f} {r.median:>10.4f} '
+              f'{r.p95:>10.4f} {r.stddev:>10.4f} {throughput}')
+
+
+def print_regressions(regressions: list[Regression], threshold_pct: float) -> None:
+    for reg in regressions:
+        print(f'REGRESSION day {reg.stats.day} part {reg.stats.part}: '
+              f'median {reg.stats.median:.4f} s vs baseline {reg.baseline_median:.4f} s '
+              f'({reg.change_pct:+.1f}%, allowed {threshold_pct:.1f}%)')
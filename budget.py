@@ -0,0 +1,180 @@
+import json
+import math
+import multiprocessing
+import os
+import resource
+import signal
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+POLL_INTERVAL = 0.05
+# child killed with SIGKILL is taken as out of memory once its sampled resident memory
+# above the baseline reached this share of the budget
+OOM_RSS_FRACTION = 0.9
+
+STATUS_OK = 'ok'
+STATUS_TIMEOUT = 'timeout'
+STATUS_OOM = 'oom'
+STATUS_ERROR = 'error'
+
+
+class Budget(NamedTuple):
+    wall_time: Optional[float] = None
+    memory_mb: Optional[int] = None
+
+
+class BudgetResult(NamedTuple):
+    day: int
+    part: int
+    status: str
+    answer: Any
+    wall_time: float
+    peak_rss_mb: float
+    message: str = ''
+
+
+def load_budgets(path: str) -> dict[str, Budget]:
+    # {"default": {"time": 60, "memory_mb": 2048}, "14": {...}, "14.2": {"time": 300}}
+    with open(path) as file:
+        raw = json.load(file)
+    return {key: Budget(entry.get('time'), entry.get('memory_mb')) for key, entry in raw.items()}
+
+
+def get_budget(budgets: dict[str, Budget], day: int, part: int, fallback: Budget) -> Budget:
+    result = fallback
+    for key in ('default', str(day), f'{day}.{part}'):
+        if key in budgets:
+            override = budgets[key]
+            result = Budget(override.wall_time if override.wall_time is not None else result.wall_time,
+                            override.memory_mb if override.memory_mb is not None else result.memory_mb)
+    return result
+
+
+def read_memory_mb(pid: int, field: int) -> float:
+    # fields of /proc/<pid>/statm: 0 - total virtual memory, 1 - resident set, in pages
+    try:
+        with open(f'/proc/{pid}/statm') as file:
+            pages = int(file.read().split()[field])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def read_rss_mb(pid: int) -> float:
+    return read_memory_mb(pid, field=1)
+
+
+def get_own_peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def apply_limits(budget: Budget) -> None:
+    # hard limits are a backstop in case the parent is unable to stop the child in time;
+    # address space of the interpreter is far bigger than its resident memory, so
+    # the budget is added on top of what is already mapped
+    if budget.memory_mb is not None:
+        limit = int((read_memory_mb(os.getpid(), field=0) + budget.memory_mb) * 2 ** 20)
+        # hard limit is kept, so the child can still report running out of memory
+        resource.setrlimit(resource.RLIMIT_AS, (limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+    if budget.wall_time is not None:
+        cpu_limit = math.ceil(budget.wall_time) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
+
+
+def classify_signal(signum: int, budget: Budget, used_mb: float) -> tuple[str, str]:
+    try:
+        name = signal.Signals(signum).name
+    except ValueError:
+        name = f'signal {signum}'
+    if signum == signal.SIGXCPU:
+        return STATUS_TIMEOUT, f'killed by {name}, CPU time limit exceeded'
+    if (signum == signal.SIGKILL and budget.memory_mb is not None and
+            used_mb >= OOM_RSS_FRACTION * budget.memory_mb):
+        return STATUS_OOM, f'killed by {name} at {used_mb:.0f} MiB of {budget.memory_mb} MiB'
+    return STATUS_ERROR, f'killed by {name}'
+
+
+def run_part_in_child(connection, solve_part: Callable, day: int, part: int, input_file: str,
+                      budget: Budget, use_cache: bool) -> None:
+    try:
+        # memory of the interpreter before solving is not charged to the budget, neither
+        # by RLIMIT_AS nor by the checks of the parent
+        connection.send(read_rss_mb(os.getpid()))
+        apply_limits(budget)
+        result = solve_part(day, part, input_file, use_cache)
+        connection.send((STATUS_OK, result.answer, '', get_own_peak_rss_mb()))
+    except MemoryError:
+        _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (hard_limit, hard_limit))
+        connection.send((STATUS_OOM, None, 'MemoryError raised', get_own_peak_rss_mb()))
+    except Exception as e:
+        connection.send((STATUS_ERROR, None, f'{type(e).__name__}: {e}', get_own_peak_rss_mb()))
+    finally:
+        connection.close()
+
+
+def check_budget(budget: Budget, elapsed: float, used_mb: float) -> Optional[tuple[str, str]]:
+    # status and message when the part went over budget, None otherwise
+    if budget.wall_time is not None and elapsed > budget.wall_time:
+        return STATUS_TIMEOUT, f'exceeded {budget.wall_time} s'
+    if budget.memory_mb is not None and used_mb > budget.memory_mb:
+        return STATUS_OOM, f'used {used_mb:.0f} MiB over {budget.memory_mb} MiB'
+    return None
+
+
+def solve_with_budget(solve_part: Callable, day: int, part: int, input_file: str, budget: Budget,
+                      use_cache: bool = True) -> BudgetResult:
+    # solve_part is runner.solve_part, passed in to avoid circular import
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    child = multiprocessing.Process(target=run_part_in_child,
+                                    args=(sender, solve_part, day, part, input_file, budget, use_cache))
+    start = time.perf_counter()
+    child.start()
+    sender.close()
+    try:
+        baseline_rss = receiver.recv()
+    except EOFError:
+        baseline_rss = 0.0
+
+    status, answer, message = None, None, ''
+    peak_rss = 0.0
+    while status is None:
+        if receiver.poll(POLL_INTERVAL):
+            try:
+                status, answer, message, child_peak_rss = receiver.recv()
+                peak_rss = max(peak_rss, child_peak_rss)
+            except EOFError:
+                # pipe is closed once the child is done, which is left to exit on its own
+                child.join()
+                status, message = STATUS_ERROR, f'child exited with code {child.exitcode}'
+                break
+            # an answer is accepted only within budget, however few samples were taken
+            exceeded = check_budget(budget, time.perf_counter() - start, peak_rss - baseline_rss)
+            if status == STATUS_OK and exceeded is not None:
+                status, message = exceeded
+            break
+
+        peak_rss = max(peak_rss, read_rss_mb(child.pid))
+        exceeded = check_budget(budget, time.perf_counter() - start, peak_rss - baseline_rss)
+        if exceeded is not None:
+            status, message = exceeded
+        elif not child.is_alive() and not receiver.poll():
+            status, message = STATUS_ERROR, f'child exited with code {child.exitcode}'
+
+    wall_time = time.perf_counter() - start
+    if child.is_alive():
+        child.kill()
+    child.join()
+    receiver.close()
+    if status == STATUS_ERROR and child.exitcode is not None and child.exitcode < 0:
+        # killed by a signal: RLIMIT_CPU sends SIGXCPU, the kernel OOM killer SIGKILL
+        status, message = classify_signal(-child.exitcode, budget, peak_rss - baseline_rss)
+    return BudgetResult(day, part, status, answer, wall_time, peak_rss, message)
+
+
+def print_budget_results(results: list[BudgetResult]) -> None:
+    print(f'{"day":>3} {"part":>4} {"status":>8} {"wall [s]":>10} {"rss [MiB]":>10}  answer')
+    for r in results:
+        details = r.answer if r.status == STATUS_OK else r.message
+        print(f'{r.day:>3} {r.part:>4} {r.status:>8} {r.wall_time:>10.3f} {r.peak_rss_mb:>10.1f}  {details}')
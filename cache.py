@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import sys
+import types
+from typing import Any, Callable, Iterable
+
+CACHE_DIR = '.cache'
+PARSED_MODELS_DIR = os.path.join(CACHE_DIR, 'parsed')
+ANSWERS_FILE = os.path.join(CACHE_DIR, 'answers.json')
+DEFAULT_MAX_ANSWERS = 1000
+
+MISSING = object()
+
+# pickle and glob are imported where used, answering from cache should not pay for them
+
+
+def bytes_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    with open(path, 'rb') as file:
+        return bytes_digest(file.read())
+
+
+def local_dependencies(module) -> list[str]:
+    # parsed models may hold instances of shared helpers (e.g. grid.Grid), so sources of
+    # repository modules the day module imports from are part of its digest as well
+    root = os.path.dirname(os.path.abspath(__file__))
+    names = {value.__name__ if isinstance(value, types.ModuleType) else getattr(value, '__module__', None)
+             for value in vars(module).values()}
+    paths = {getattr(sys.modules.get(name), '__file__', None) for name in names - {module.__name__}}
+    return sorted(path for path in paths if path and os.path.dirname(os.path.abspath(path)) == root)
+
+
+def module_digest(module) -> str:
+    sources = [module.__file__] + local_dependencies(module)
+    return bytes_digest(':'.join(map(file_digest, sources)).encode())
+
+
+def day_source_file(day: int, engine: str = None) -> str:
+    name = f'day_{day}_{engine}.py' if engine else f'day_{day}.py'
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+
+def write_atomically(path: str, data: bytes) -> None:
+    # concurrent runners may write the same entry, so never expose a partially written file;
+    # temporary name is unique per process, which is the unit of concurrency here
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_pickle_atomically(path: str, obj: Any) -> None:
+    import pickle
+    write_atomically(path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def parsed_model_path(module, input_digest: str) -> str:
+    key = bytes_digest(f'{input_digest}:{module_digest(module)}'.encode())
+    return os.path.join(PARSED_MODELS_DIR, f'{module.__name__}-{key}.pickle')
+
+
+def load_parsed_model(module, input_file: str, read_lines: Callable[[str], list[str]]) -> Any:
+    import pickle
+    path = parsed_model_path(module, file_digest(input_file))
+    try:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    model = module.parse(read_lines(input_file))
+    write_pickle_atomically(path, model)
+    return model
+
+
+# answers of solved parts keyed by day, part, input hash and hash of solver sources, i.e.
+# of the day (or engine) module and repository modules it depends on; entries are kept
+# in least recently used order and the oldest ones are evicted over max_entries
+class AnswerCache:
+    def __init__(self, path: str = ANSWERS_FILE, max_entries: int = DEFAULT_MAX_ANSWERS):
+        self._path = path
+        self._max_entries = max_entries
+        self._digests = {}
+        self._sources = {}
+        self._entries = self.__load()
+        self._is_modified = False
+
+    def get(self, day: int, part: int, input_file: str, engine: str = None) -> Any:
+        key = self.__make_key(day, part, input_file, engine)
+        if key not in self._entries:
+            return MISSING
+        # re-insert to mark the entry as most recently used; recency alone does not make
+        # the cache modified, it is persisted along with the next put
+        answer = self._entries[key] = self._entries.pop(key)
+        return answer
+
+    def put(self, day: int, part: int, input_file: str, answer: Any, engine: str = None) -> None:
+        key = self.__make_key(day, part, input_file, engine)
+        self._entries.pop(key, None)
+        self._entries[key] = answer
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._is_modified = True
+
+    def invalidate(self, days: Iterable[int]) -> int:
+        prefixes = tuple(f'{day}:' for day in days)
+        stale = [key for key in self._entries if key.startswith(prefixes)]
+        for key in stale:
+            del self._entries[key]
+        self._is_modified = self._is_modified or bool(stale)
+        return len(stale)
+
+    def save(self) -> None:
+        if self._is_modified:
+            write_atomically(self._path, json.dumps(self._entries).encode())
+            self._is_modified = False
+
+    def __make_key(self, day: int, part: int, input_file: str, engine: str = None) -> str:
+        # engines live in their own source files, so their answers get keys of their own
+        if (day, engine) not in self._sources:
+            # registry imports this module, so it is imported only once keys are made
+            import registry
+            sources = registry.source_files(day, engine)
+            self._sources[day, engine] = bytes_digest(':'.join(map(self.__digest, sources)).encode())
+        return f'{day}:{part}:{self.__digest(input_file)}:{self._sources[day, engine]}'
+
+    def __digest(self, path: str) -> str:
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def __load(self) -> dict[str, Any]:
+        try:
+            with open(self._path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+
+def remove_parsed_models(days: Iterable[int]) -> int:
+    import glob
+    removed = 0
+    for day in days:
+        # models of the day module and of its engines
+        for pattern in (f'day_{day}-*.pickle', f'day_{day}_*-*.pickle'):
+            for path in glob.glob(os.path.join(PARSED_MODELS_DIR, pattern)):
+                os.unlink(path)
+                removed += 1
+    return removed
@@ -0,0 +1,89 @@
+import json
+import os
+from typing import Any, NamedTuple, Optional
+
+STATUS_OK = 'ok'
+STATUS_WRONG = 'wrong'
+STATUS_SLOW = 'slow'
+STATUS_UNKNOWN = 'unknown'
+STATUS_ERROR = 'error'
+
+FAILURES = (STATUS_WRONG, STATUS_SLOW, STATUS_ERROR)
+
+# recorded ceilings get headroom over the measured time, and never go below the minimum,
+# since parts finishing in a few milliseconds are dominated by noise
+DEFAULT_CEILING_FACTOR = 3.0
+MIN_CEILING = 0.05
+
+KnownAnswerKey = tuple[int, int, str]
+
+
+class KnownAnswer(NamedTuple):
+    day: int
+    part: int
+    input_sha256: str
+    answer: Any
+    max_time: Optional[float] = None
+
+
+class CheckResult(NamedTuple):
+    day: int
+    part: int
+    status: str
+    answer: Any
+    expected: Any
+    wall_time: float
+    max_time: Optional[float]
+    message: str = ''
+
+
+def load_known_answers(path: str) -> dict[KnownAnswerKey, KnownAnswer]:
+    # [{"day": 9, "part": 1, "input_sha256": "...", "answer": 6330095022244, "max_time": 0.5}, ...]
+    try:
+        with open(path) as file:
+            entries = json.load(file)
+    except FileNotFoundError:
+        return {}
+    return {(entry['day'], entry['part'], entry['input_sha256']): KnownAnswer(**entry) for entry in entries}
+
+
+def save_known_answers(path: str, known: dict[KnownAnswerKey, KnownAnswer]) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump([known[key]._asdict() for key in sorted(known)], file, indent=2)
+
+
+def normalize_answer(answer: Any) -> Any:
+    # expected answers went through JSON, so compare in the same representation
+    return json.loads(json.dumps(answer))
+
+
+def record_answer(day: int, part: int, input_sha256: str, answer: Any, wall_time: float,
+                  ceiling_factor: float = DEFAULT_CEILING_FACTOR) -> KnownAnswer:
+    max_time = round(max(wall_time * ceiling_factor, MIN_CEILING), 3)
+    return KnownAnswer(day, part, input_sha256, normalize_answer(answer), max_time)
+
+
+def check_answer(known: Optional[KnownAnswer], day: int, part: int, answer: Any,
+                 wall_time: float) -> CheckResult:
+    if known is None:
+        return CheckResult(day, part, STATUS_UNKNOWN, answer, None, wall_time, None,
+                           'no known answer for this input')
+    if normalize_answer(answer) != known.answer:
+        return CheckResult(day, part, STATUS_WRONG, answer, known.answer, wall_time, known.max_time,
+                           f'expected {known.answer}')
+    if known.max_time is not None and wall_time > known.max_time:
+        return CheckResult(day, part, STATUS_SLOW, answer, known.answer, wall_time, known.max_time,
+                           f'exceeded ceiling of {known.max_time} s')
+    return CheckResult(day, part, STATUS_OK, answer, known.answer, wall_time, known.max_time)
+
+
+def print_check_results(results: list[CheckResult]) -> None:
+    print(f'{"day":>3} {"part":>4} {"status":>8} {"wall [s]":>10} {"max [s]":>10}  answer')
+    for r in results:
+        max_time = f'{r.max_time:>10.3f}' if r.max_time is not None else f'{"-":>10}'
+        details = f'{r.answer}  ({r.message})' if r.message else r.answer
+        print(f'{r.day:>3} {r.part:>4} {r.status:>8} {r.wall_time:>10.3f} {max_time}  {details}')
+    failed = sum(1 for r in results if r.status in FAILURES)
+    unknown = sum(1 for r in results if r.status == STATUS_UNKNOWN)
+    print(f'{len(results) - failed - unknown} passed, {failed} failed, {unknown} without known answer')
@@ -0,0 +1,130 @@
+import argparse
+from collections import OrderedDict
+import importlib
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from typing import Any
+
+import registry
+import runner
+from solver_client import DEFAULT_SOCKET
+
+MAX_MODELS = 32
+
+
+class WarmSolver:
+    def __init__(self, max_models: int = MAX_MODELS):
+        self._modules = {}
+        self._models = OrderedDict()
+        self._max_models = max_models
+
+    def solve(self, day: int, part: int, input_file: str) -> dict[str, Any]:
+        start = time.perf_counter()
+        daily_module = self.__get_module(day)
+        model = self.__get_model(day, daily_module, input_file)
+        solve_start = time.perf_counter()
+        answer = getattr(daily_module, f'resolve_part{part}')(model)
+        end = time.perf_counter()
+        return {'answer': answer, 'solve_time': end - solve_start, 'total_time': end - start}
+
+    def __get_module(self, day: int):
+        # modules are reloaded when their sources or sources of repository modules they
+        # depend on change, so the daemon can outlive edits of days and shared helpers
+        names = registry.source_modules(day)
+        version = tuple(os.stat(registry.module_file(name)).st_mtime_ns for name in names)
+        if day in self._modules:
+            daily_module, loaded_version = self._modules[day]
+            if loaded_version != version:
+                # dependencies come first, so each module is executed again against fresh ones
+                for name in names:
+                    if name in sys.modules:
+                        importlib.reload(sys.modules[name])
+                daily_module = sys.modules[registry.module_name(day)]
+        else:
+            daily_module = runner.load_day(day)
+        self._modules[day] = (daily_module, version)
+        return daily_module
+
+    def __get_model(self, day: int, daily_module, input_file: str) -> Any:
+        stat = os.stat(input_file)
+        key = (day, input_file)
+        version = (stat.st_mtime_ns, stat.st_size, self._modules[day][1])
+        if key in self._models and self._models[key][0] == version:
+            self._models.move_to_end(key)
+            return self._models[key][1]
+
+        model = runner.load_model(daily_module, input_file)
+        self._models[key] = (version, model)
+        self._models.move_to_end(key)
+        while len(self._models) > self._max_models:
+            self._models.popitem(last=False)
+        return model
+
+
+class SolveRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {'error': f'Malformed request: {e}'}
+            else:
+                response = self.server.dispatch(request)
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    # each connection gets a thread, so an idle client does not hold up the others, but
+    # solving is serialized: solvers may temporarily modify shared parsed models
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        super().__init__(socket_path, SolveRequestHandler)
+        self.solver = WarmSolver()
+        self._solve_lock = threading.Lock()
+
+    def dispatch(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {'error': 'Malformed request: expected JSON object'}
+        command = request.get('command', 'solve')
+        try:
+            if command == 'ping':
+                return {'pong': True}
+            if command == 'shutdown':
+                threading.Thread(target=self.shutdown).start()
+                return {'stopping': True}
+            if command == 'solve':
+                with self._solve_lock:
+                    return self.solver.solve(int(request['day']), int(request['part']), request['input'])
+            return {'error': f'Unknown command {command}'}
+        except Exception as e:
+            return {'error': f'{type(e).__name__}: {e}'}
+
+
+def serve(socket_path: str) -> None:
+    os.makedirs(os.path.dirname(socket_path) or '.', exist_ok=True)
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    with SolverServer(socket_path) as server:
+        print(f'Solver daemon listening on {socket_path}')
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Warm solver daemon for Advent of code 2024')
+    parser.add_argument('--socket', '-s', default=DEFAULT_SOCKET, help='path of unix domain socket')
+    args = parser.parse_args(argv)
+    serve(args.socket)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,6 @@
+from bisect import bisect_left, insort
 from collections import Counter
+from typing import Iterable, Iterator
 
 
 def parse_input_lists(lines: list[str]) -> tuple[list[int], list[int]]:
@@ -20,6 +22,94 @@ def calculate_similarity_score(left_list: list[int], right_list: list[int]) -> i
     return sum(num * c[num] for num in left_list)
 
 
+class SortedCounter:
+    # multiset of values kept as counts along with the distinct values in order, so it is
+    # traversed in sorted order without sorting and a new distinct value costs a bisect
+    def __init__(self, values: Iterable[int] = ()):
+        self.counts = Counter(values)
+        self.values = sorted(self.counts)
+        self.size = sum(self.counts.values())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, value: int) -> None:
+        if not self.counts[value]:
+            insort(self.values, value)
+        self.counts[value] += 1
+        self.size += 1
+
+    def remove(self, value: int) -> None:
+        count = self.counts[value]
+        if not count:
+            raise ValueError(f'{value} is not in the list')
+        if count == 1:
+            del self.counts[value]
+            del self.values[bisect_left(self.values, value)]
+        else:
+            self.counts[value] = count - 1
+        self.size -= 1
+
+    def runs(self) -> Iterator[tuple[int, int]]:
+        for value in self.values:
+            yield value, self.counts[value]
+
+
+def calculate_paired_distance(left: SortedCounter, right: SortedCounter) -> int:
+    # pairs sorted lists a run of equal values at a time, the same as zip of sorted lists
+    total = 0
+    left_runs, right_runs = left.runs(), right.runs()
+    left_value, left_count = next(left_runs, (0, 0))
+    right_value, right_count = next(right_runs, (0, 0))
+    while left_count and right_count:
+        paired = min(left_count, right_count)
+        total += abs(left_value - right_value) * paired
+        left_count -= paired
+        right_count -= paired
+        if not left_count:
+            left_value, left_count = next(left_runs, (0, 0))
+        if not right_count:
+            right_value, right_count = next(right_runs, (0, 0))
+    return total
+
+
+class SimilarityIndex:
+    # Answers of both parts for lists changing over time. Adding or removing a value moves
+    # the similarity score by the value times its count on the other side. Distance depends
+    # on ranks of all values, so it is recomputed from sorted runs when queried after a change.
+    def __init__(self, left_list: Iterable[int] = (), right_list: Iterable[int] = ()):
+        self.left = SortedCounter(left_list)
+        self.right = SortedCounter(right_list)
+        self.similarity_score = sum(value * count * self.right.counts[value]
+                                    for value, count in self.left.counts.items())
+        self._distance = None
+
+    def add_left(self, value: int) -> None:
+        self.left.add(value)
+        self.similarity_score += value * self.right.counts[value]
+        self._distance = None
+
+    def remove_left(self, value: int) -> None:
+        self.left.remove(value)
+        self.similarity_score -= value * self.right.counts[value]
+        self._distance = None
+
+    def add_right(self, value: int) -> None:
+        self.right.add(value)
+        self.similarity_score += value * self.left.counts[value]
+        self._distance = None
+
+    def remove_right(self, value: int) -> None:
+        self.right.remove(value)
+        self.similarity_score -= value * self.left.counts[value]
+        self._distance = None
+
+    def total_distance(self) -> int:
+        if self._distance is None:
+            self._distance = calculate_paired_distance(self.left, self.right)
+        return self._distance
+
+
 def resolve_part1(input):
     l1, l2 = parse_input_lists(input)
     return calculate_total_distance(l1, l2)
@@ -74,8 +74,11 @@ def account_for_conversion_error(configs: list[ClawMachineConfig]) -> list[ClawM
             for c in configs]
 
 
-def resolve_part1(input):
-    return count_tokens_for_wins(parse_input(input))
+def parse(input):
+    return parse_input(input)
 
-def resolve_part2(input):
-    return count_tokens_for_wins(account_for_conversion_error(parse_input(input)))
+def resolve_part1(machines):
+    return count_tokens_for_wins(machines)
+
+def resolve_part2(machines):
+    return count_tokens_for_wins(account_for_conversion_error(machines))
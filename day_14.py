@@ -1,12 +1,13 @@
 import re
-import itertools
 from typing import NamedTuple
-from collections import deque
+
+from grid import Grid, OUTSIDE
 
 
 ROBOT_CONFIG_REGEX = re.compile(r'p=(\d+),(\d+) v=(-?\d+),(-?\d+)')
 
 MAP_SIZE = (101, 103)
+ROBOT = ord('#')
 
 class Robot(NamedTuple):
     position: tuple[int, int]
@@ -46,36 +47,37 @@ def calculate_safety_factor(robots: list[Robot], time: int) -> int:
     return nw * ne * sw * se
 
 
-def is_on_map(point: tuple[int, int]) -> bool:
-    x, y = point
-    return x >= 0 and x < MAP_SIZE[0] and y >= 0 and y < MAP_SIZE[1]
-
-
-def get_closest_robot_distance(positions: set[tuple[int, int]],
-                               point: tuple[int, int]) -> int:
-    dxs = (-1, 0, 1, 1, 1, 0, -1, -1)
-    dys = (-1, -1, -1, 0, 1, 1, 1, 0)
-    queue = deque([(point, 0)])
-    visited = set()
-    while queue:
-        elem, distance = queue.popleft()
-        if distance > 0 and elem in positions:
-            return distance
-        if elem in visited:
-            continue
-        
-        visited.add(elem)
-        x, y = elem
-        for dx, dy in zip(dxs, dys):
-            next_pos = (x + dx, y + dy)
-            if is_on_map(next_pos) and next_pos not in visited:
-                queue.append((next_pos, distance + 1))
+def create_robots_map(positions: list[tuple[int, int]]) -> Grid:
+    robots_map = Grid.filled(*MAP_SIZE)
+    for x, y in positions:
+        robots_map.cells[robots_map.index(x, y)] = ROBOT
+    return robots_map
+
+
+def get_closest_robot_distance(robots_map: Grid, point: int) -> int:
+    cells = robots_map.cells
+    offsets = robots_map.neighbour_offsets + robots_map.diagonal_offsets
+    visited = {point}
+    generation = [point]
+    distance = 0
+    while generation:
+        distance += 1
+        next_generation = []
+        for elem in generation:
+            for offset in offsets:
+                next_pos = elem + offset
+                if next_pos in visited or cells[next_pos] == OUTSIDE:
+                    continue
+                if cells[next_pos] == ROBOT:
+                    return distance
+                visited.add(next_pos)
+                next_generation.append(next_pos)
+        generation = next_generation
     raise RuntimeError('Other robot not found')
 
 
-def get_cluster_indication(positions: list[tuple[int, int]]) -> float:
-    pos_set = set(positions)
-    s = sum(get_closest_robot_distance(pos_set, pt) for pt in positions)
+def get_cluster_indication(robots_map: Grid, positions: list[tuple[int, int]]) -> float:
+    s = sum(get_closest_robot_distance(robots_map, robots_map.index(x, y)) for x, y in positions)
     return s / len(positions)
 
 
@@ -83,33 +85,31 @@ def enumerate_plausible_candidates(robots: list[Robot], max_time: int):
     threshold = 2.0
     for i in range(1, max_time):
         robot_positions = move_robots(robots, time=i)
-        cluster_ind = get_cluster_indication(robot_positions)
+        robots_map = create_robots_map(robot_positions)
+        cluster_ind = get_cluster_indication(robots_map, robot_positions)
         if cluster_ind < threshold:
-            yield i, set(robot_positions)
-
-
-def map_out_region(robots: set[tuple[int, int]],
-                   point: tuple[int, int]) -> set[tuple[int, int]]:
-    dxs = (0, 1, 0, -1)
-    dys = (-1, 0, 1, 0)
-    def dfs(current: tuple[int, int], region: set[tuple[int, int]]):
-        x, y = current
-        for dx, dy in zip(dxs, dys):
-            next_pos = (x + dx, y + dy)
-            if is_on_map(next_pos) and next_pos not in region and next_pos in robots:
-                region.add(next_pos)
-                dfs(next_pos, region)
+            yield i, robots_map
+
+
+def map_out_region(robots_map: Grid, point: int) -> set[int]:
+    cells = robots_map.cells
     region = {point}
-    dfs(point, region)
+    points_for_visit = [point]
+    while points_for_visit:
+        current = points_for_visit.pop()
+        for offset in robots_map.neighbour_offsets:
+            next_pos = current + offset
+            if cells[next_pos] == ROBOT and next_pos not in region:
+                region.add(next_pos)
+                points_for_visit.append(next_pos)
     return region
 
 
-def collect_regions(robots: set[tuple[int, int]],
-                    size_threshold: int) -> list[set[tuple[int, int]]]:
-    rest = set(robots)
+def collect_regions(robots_map: Grid, size_threshold: int) -> list[set[int]]:
+    rest = set(robots_map.find_all(chr(ROBOT)))
     result = []
     while rest:
-        region = map_out_region(robots, next(iter(rest)))
+        region = map_out_region(robots_map, next(iter(rest)))
         rest -= region
         if len(region) >= size_threshold:
             result.append(region)
@@ -117,33 +117,31 @@ def collect_regions(robots: set[tuple[int, int]],
     return result
 
 
-def is_region_symmetrical(region: set[tuple[int, int]]) -> bool:
+def is_region_symmetrical(robots_map: Grid, region: set[int]) -> bool:
+    points = set(map(robots_map.coords, region))
     def is_mirrored(point: tuple[int, int], axis: int) -> bool:
         x, y = point
-        return (2 * axis - x, y) in region
-    x_min = min(x for (x, _) in region)
-    x_max = max(x for (x, _) in region)
+        return (2 * axis - x, y) in points
+    x_min = min(x for (x, _) in points)
+    x_max = max(x for (x, _) in points)
     x_mid = (x_min + x_max) / 2
-    return all(is_mirrored(pt, x_mid) for pt in region)
+    return all(is_mirrored(pt, x_mid) for pt in points)
 
 
-def check_candidate(robots: set[tuple[int, int]]) -> bool:
-    rs = collect_regions(robots, size_threshold=10)
-    return rs and is_region_symmetrical(rs[0])
+def check_candidate(robots_map: Grid) -> bool:
+    rs = collect_regions(robots_map, size_threshold=10)
+    return rs and is_region_symmetrical(robots_map, rs[0])
 
 
-def dump_robots_positions(robots: set[tuple[int, int]]):
-    grid = [list(itertools.repeat('.', MAP_SIZE[0])) for _ in range(MAP_SIZE[1])]
-    for x, y in robots:
-        grid[y][x] = '#'
-    for row in grid:
-        print(''.join(row))
+def dump_robots_positions(robots_map: Grid):
+    for row in robots_map.rows():
+        print(row)
 
 
 def find_plausible_christmas_tree_combination(robots: list[Robot]) -> int:
-    for time, positions_set in enumerate_plausible_candidates(robots, max_time=20000):
-        if check_candidate(positions_set):
-            dump_robots_positions(positions_set)
+    for time, robots_map in enumerate_plausible_candidates(robots, max_time=20000):
+        if check_candidate(robots_map):
+            dump_robots_positions(robots_map)
             return time
     raise RuntimeError('Probably we should not be here')
 
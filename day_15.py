@@ -1,80 +1,58 @@
-import itertools
+from grid import Grid, EAST, NORTH, SOUTH, WEST
 
 
-Grid = list[list[str]]
 Moves = str
-Point = tuple[int, int]
+
+WALL, EMPTY = b'#.'
+LARGE_BOX_LEFT, LARGE_BOX_RIGHT = b'[]'
+
+MOVE_DIRECTIONS = {'^': NORTH, 'v': SOUTH, '>': EAST, '<': WEST}
 
 
 def parse_input(lines: list[str]) -> tuple[Grid, Moves]:
     splitIdx = next(filter(lambda elem: not elem[1], enumerate(lines)))[0]
-    grid = [list(line) for line in lines[:splitIdx]]
+    grid = Grid(lines[:splitIdx])
     moves = ''.join(lines[splitIdx + 1:])
     return grid, moves
 
 
-def get_grid_size(grid: Grid) -> tuple[int, int]:
-    return len(grid[0]), len(grid)
-
-
-def get_object_at(grid: Grid, point: Point) -> str:
-    x, y = point
-    return grid[y][x]
-
-
-def find_robot_position(grid: Grid) -> Point:
-    width, height = get_grid_size(grid)
-    for pos in itertools.product(range(width), range(height)):
-        if get_object_at(grid, pos) == '@':
-            return pos
-    raise RuntimeError('Robot not found')
-
+def find_robot_position(grid: Grid) -> int:
+    try:
+        return grid.find('@')
+    except ValueError:
+        raise RuntimeError('Robot not found')
 
-def get_direction_from_move(move: str) -> tuple[int, int]:
-    if move == '^':
-        return (0, -1)
-    if move == 'v':
-        return (0, 1)
-    if move == '>':
-        return (1, 0)
-    if move == '<':
-        return (-1, 0)
-    raise RuntimeError('Invalid move')
 
+def get_offset_from_move(grid: Grid, move: str) -> int:
+    if move not in MOVE_DIRECTIONS:
+        raise RuntimeError('Invalid move')
+    return grid.neighbour_offsets[MOVE_DIRECTIONS[move]]
 
-def get_next_position(current: Point, move: str) -> Point:
-    x, y = current
-    dx, dy = get_direction_from_move(move)
-    return (x + dx, y + dy)
 
+def move_object(grid: Grid, source: int, target: int) -> None:
+    grid.cells[target] = grid.cells[source]
+    grid.cells[source] = EMPTY
 
-def move_object(grid: Grid, source: Point, target: Point) -> None:
-    obj = get_object_at(grid, source)
-    grid[target[1]][target[0]] = obj
-    grid[source[1]][source[0]] = '.'
 
-
-def try_moving_to_new_position(grid: Grid, current: Point, direction: Point) -> bool:
-    x, y = current
-    dx, dy = direction
-    new_pos = (x + dx, y + dy)
-    obj = get_object_at(grid, new_pos)
-    if obj == '#':
+def try_moving_to_new_position(grid: Grid, current: int, offset: int) -> bool:
+    new_pos = current + offset
+    obj = grid.cells[new_pos]
+    if obj == WALL:
         return False
-    if obj == '.':
+    if obj == EMPTY:
         move_object(grid, source=current, target=new_pos)
         return True
 
-    if try_moving_to_new_position(grid, new_pos, direction):
+    if try_moving_to_new_position(grid, new_pos, offset):
         move_object(grid, source=current, target=new_pos)
         return True
     return False
 
 
-def move_robot(grid: Grid, robot_position: Point, move: str) -> Point:
-    dx, dy = get_direction_from_move(move)
-    if try_moving_to_new_position(grid, robot_position, (dx, dy)):
-        return robot_position[0] + dx, robot_position[1] + dy
+def move_robot(grid: Grid, robot_position: int, move: str) -> int:
+    offset = get_offset_from_move(grid, move)
+    if try_moving_to_new_position(grid, robot_position, offset):
+        return robot_position + offset
     return robot_position
 
 
@@ -85,9 +63,7 @@ def perform_move_sequence(grid: Grid, moves: Moves) -> None:
 
 
 def sum_boxes_gps(grid: Grid, box: str = 'O') -> int:
-    width, height = get_grid_size(grid)
-    boxes = filter(lambda pt: get_object_at(grid, pt) == box,
-                   itertools.product(range(width), range(height)))
+    boxes = map(grid.coords, grid.find_all(box))
     return sum(x + 100 * y for x, y in boxes)
 
 
@@ -98,60 +74,54 @@ def prepare_p2_layout(grid: Grid) -> Grid:
         '.': '..',
         '@': '@.',
     }
-    return [list(''.join(transform[c] for c in row)) for row in grid]
-
-
-def is_move_possible(grid: Grid, current: Point, direction: Point) -> bool:
-    x, y = current
-    dx, dy = direction
-    new_pos = (x + dx, y + dy)
-    obj = get_object_at(grid, new_pos)
-    
-    if obj == '[' or obj == ']':
-        if dy == 0:
-            return is_move_possible(grid, (x + 2 * dx, y), direction)
+    return Grid([''.join(transform[c] for c in row) for row in grid.rows()])
+
+
+def is_move_possible(grid: Grid, current: int, offset: int) -> bool:
+    new_pos = current + offset
+    obj = grid.cells[new_pos]
+
+    if obj == LARGE_BOX_LEFT or obj == LARGE_BOX_RIGHT:
+        if abs(offset) == 1:
+            return is_move_possible(grid, current + 2 * offset, offset)
         else:
-            other_part = (new_pos[0] + (1 if obj == '[' else -1), new_pos[1])
-            return (is_move_possible(grid, new_pos, direction) and
-                    is_move_possible(grid, other_part, direction))
+            other_part = new_pos + (1 if obj == LARGE_BOX_LEFT else -1)
+            return (is_move_possible(grid, new_pos, offset) and
+                    is_move_possible(grid, other_part, offset))
     else:
-        return obj == '.'
-    
-
-def move_element_among_large_boxes(grid: Grid, current: Point, direction: Point) -> Point:
-    x, y = current
-    dx, dy = direction
-    new_pos = (x + dx, y + dy)
-    obj = get_object_at(grid, new_pos)
-    if obj == '[' or obj == ']':
-        large_box = new_pos if obj == '[' else (new_pos[0] - 1, new_pos[1])
-        move_large_box(grid, large_box, direction)
+        return obj == EMPTY
+
+
+def move_element_among_large_boxes(grid: Grid, current: int, offset: int) -> int:
+    new_pos = current + offset
+    obj = grid.cells[new_pos]
+    if obj == LARGE_BOX_LEFT or obj == LARGE_BOX_RIGHT:
+        large_box = new_pos if obj == LARGE_BOX_LEFT else new_pos - 1
+        move_large_box(grid, large_box, offset)
     move_object(grid, source=current, target=new_pos)
     return new_pos
 
 
-def large_box_second_part(box_position: Point) -> Point:
-    x, y = box_position
-    return (x + 1, y)
+def large_box_second_part(box_position: int) -> int:
+    return box_position + 1
 
 
-def move_large_box(grid: Grid, box_position: Point, direction: Point) -> None:
-    dx, dy = direction
-    if dy == 0 and dx < 0:
-        move_element_among_large_boxes(grid, box_position, direction)
-        move_element_among_large_boxes(grid, large_box_second_part(box_position), direction)
-    elif dy == 0 and dx > 0:
-        move_element_among_large_boxes(grid, large_box_second_part(box_position), direction)
-        move_element_among_large_boxes(grid, box_position, direction)
+def move_large_box(grid: Grid, box_position: int, offset: int) -> None:
+    if offset == -1:
+        move_element_among_large_boxes(grid, box_position, offset)
+        move_element_among_large_boxes(grid, large_box_second_part(box_position), offset)
+    elif offset == 1:
+        move_element_among_large_boxes(grid, large_box_second_part(box_position), offset)
+        move_element_among_large_boxes(grid, box_position, offset)
     else:
-        move_element_among_large_boxes(grid, box_position, direction)
-        move_element_among_large_boxes(grid, large_box_second_part(box_position), direction)
+        move_element_among_large_boxes(grid, box_position, offset)
+        move_element_among_large_boxes(grid, large_box_second_part(box_position), offset)
 
 
-def move_robot_among_large_boxes(grid: Grid, robot_position: Point, move: str) -> Point:
-    direction = get_direction_from_move(move)
-    if is_move_possible(grid, robot_position, direction):
-        return move_element_among_large_boxes(grid, robot_position, direction)
+def move_robot_among_large_boxes(grid: Grid, robot_position: int, move: str) -> int:
+    offset = get_offset_from_move(grid, move)
+    if is_move_possible(grid, robot_position, offset):
+        return move_element_among_large_boxes(grid, robot_position, offset)
     return robot_position
 
 
@@ -161,13 +131,18 @@ def perform_move_sequence_p2(grid: Grid, moves: str) -> None:
         robot = move_robot_among_large_boxes(grid, robot, move)
 
 
-def resolve_part1(input):
-    grid, moves = parse_input(input)
+def parse(input):
+    return parse_input(input)
+
+def resolve_part1(parsed):
+    grid, moves = parsed
+    # the parsed model is shared with part 2, so do not move boxes around in it
+    grid = grid.copy()
     perform_move_sequence(grid, moves)
     return sum_boxes_gps(grid)
 
-def resolve_part2(input):
-    grid, moves = parse_input(input)
+def resolve_part2(parsed):
+    grid, moves = parsed
     snd_warehouse = prepare_p2_layout(grid)
     perform_move_sequence_p2(snd_warehouse, moves)
     return sum_boxes_gps(snd_warehouse, box='[')
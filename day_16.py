@@ -1,142 +1,76 @@
-import itertools
-from typing import Optional
-from heapq import heappush, heappop
+from grid import Grid, EAST, turn_left, turn_right
+import search
+import stats
 
-Point = tuple[int, int]
-Direction = tuple[int, int]
-Grid = list[str]
+# nodes of the search are cell index * 4 + direction the reindeer is facing
+Node = int
 
-EAST = (1, 0)
-WEST = (-1, 0)
-NORTH = (0, -1)
-SOUTH = (0, 1)
+WALL = ord('#')
+TURN_COST = 1000
 
 
-def get_grid_size(grid: Grid) -> tuple[int, int]:
-    return len(grid[0]), len(grid)
+def find_start_and_target(grid: Grid) -> tuple[int, int]:
+    return grid.find('S'), grid.find('E')
 
 
-def find_start_and_target(grid: Grid) -> tuple[Point, Point]:
-    width, height = get_grid_size(grid)
-    start = None
-    target = None
-    for x, y in itertools.product(range(width), range(height)):
-        if grid[y][x] == 'S':
-            start = (x, y)
-        elif grid[y][x] == 'E':
-            target = (x, y)
-    return start, target
+def make_node(cell: int, direction: int) -> Node:
+    return cell * 4 + direction
 
 
-def enumerate_free_neighbours(grid: Grid, point: Point):
-    x, y = point
-    dxs = (1, 0, -1, 0)
-    dys = (0, 1, 0, -1)
-    neighbours = ((x + dx, y + dy) for dx, dy in zip(dxs, dys))
-    return filter(lambda p: grid[p[1]][p[0]] != '#', neighbours)
+def enumerate_moves(grid: Grid) -> search.WeightedNeighbours:
+    cells = grid.cells
+    offsets = grid.neighbour_offsets
+    def moves(node: Node) -> list[tuple[Node, int]]:
+        cell, direction = divmod(node, 4)
+        result = []
+        forward = cell + offsets[direction]
+        if cells[forward] != WALL:
+            result.append((make_node(forward, direction), 1))
+        # turning is only worth it when there is a free tile ahead afterwards
+        for turned in (turn_left(direction), turn_right(direction)):
+            if cells[cell + offsets[turned]] != WALL:
+                result.append((make_node(cell, turned), TURN_COST))
+        return result
+    return moves
 
 
-def calc_direction(source: Point, target: Point) -> Direction:
-    dx = target[0] - source[0]
-    dy = target[1] - source[1]
-    return dx, dy
+def traverse_dijkstra(grid: Grid, all_parents: bool) -> tuple[list[Node], search.SearchResult]:
+    start, target = find_start_and_target(grid)
+    target_nodes = [make_node(target, direction) for direction in range(4)]
+    traversal = search.dijkstra(len(grid.cells) * 4,
+                                sources=[make_node(start, EAST)],
+                                neighbours=enumerate_moves(grid),
+                                targets=frozenset(target_nodes),
+                                all_parents=all_parents,
+                                max_weight=TURN_COST)
+    return target_nodes, traversal
 
 
-def is_perpendicular(dir1: Direction, dir2: Direction) -> bool:
-    return dir1[0] * dir2[0] + dir1[1] * dir2[1] == 0
+def get_lowest_score(target_nodes: list[Node], traversal: search.SearchResult) -> int:
+    scores = [traversal.distances[node] for node in target_nodes
+              if traversal.distances[node] != search.UNREACHED]
+    if not scores:
+        raise RuntimeError('Target not reachable')
+    return min(scores)
 
 
-def find_lowest_score(grid: Grid) -> int:
-    start, target = find_start_and_target(grid)
-    visited = set()
-    nodes = [(0, (start, EAST))]
-    while nodes:
-        score, current = heappop(nodes)
-        if current[0] == target:
-            return score
-        if current in visited:
-            continue
-        visited.add(current)
-
-        for x, y in enumerate_free_neighbours(grid, current[0]):
-            direction = calc_direction(source=current[0], target=(x, y))
-            if direction == current[1]:
-                new_node = ((x, y), direction)
-                heappush(nodes, (score + 1, new_node))
-            elif is_perpendicular(current[1], direction):
-                new_node = (current[0], direction)
-                heappush(nodes, (score + 1000, new_node))
-    raise RuntimeError('Target not reachable')
-
-
-Node = tuple[Point, Direction]
-ScoredNodes = tuple[int, list[Node]]
-
-
-def update_scores_bookkeeping(scores: dict[Node, ScoredNodes],
-                              node: Node,
-                              prev: Node,
-                              distance: int) -> None:
-    current_score, nodes = scores[node]
-    if current_score == distance:
-        nodes.append(prev)
-
-
-def traverse_dijkstra(grid: Grid) -> tuple[Point, dict[Node, ScoredNodes]]:
-    start, target = find_start_and_target(grid)
-    visited = {}
-    nodes =[(0, (start, EAST), None)]
-    min_score = None
-    while nodes:
-        score, current, prev = heappop(nodes)
-        if min_score is not None and score > min_score:
-            break
-        if current in visited:
-            update_scores_bookkeeping(visited, current, prev, score)
-            continue
-        visited[current] = (score, [prev] if prev is not None else [])
-
-        if current[0] == target:
-            min_score = score
-            continue
-
-        for x, y in enumerate_free_neighbours(grid, current[0]):
-            direction = calc_direction(source=current[0], target=(x, y))
-            if direction == current[1]:
-                new_node = ((x, y), direction)
-                heappush(nodes, (score + 1, new_node, current))
-            elif is_perpendicular(current[1], direction):
-                new_node = (current[0], direction)
-                heappush(nodes, (score + 1000, new_node, current))
-    return target, visited
-
-
-def extract_paths(node: Node, traversal_data: dict[Node, ScoredNodes]) -> list[list[Node]]:
-    if node not in traversal_data:
-        return []
-    _, parents = traversal_data[node]
-    if not parents:
-        return [[node]]
-
-    paths = list(itertools.chain.from_iterable(extract_paths(parent, traversal_data)
-                                               for parent in parents))
-    for path in paths:
-        path.append(node)
-    return paths
-
-
-def extract_shortest_paths(target: Point,
-                           traversal_data: dict[Node, ScoredNodes]) -> list[list[Node]]:
-    result = []
-    for direction in (EAST, WEST, NORTH, SOUTH):
-        result.append(extract_paths((target, direction), traversal_data))
-    return list(itertools.chain.from_iterable(result))
-
-
-def count_tiles_on_shortest_path(grid: Grid) -> int:
-    target, traversal = traverse_dijkstra(grid)
-    paths = extract_shortest_paths(target, traversal)
-    tiles = {point for point, _ in itertools.chain.from_iterable(paths)}
+def find_lowest_score(lines: list[str]) -> int:
+    target_nodes, traversal = traverse_dijkstra(Grid(lines), all_parents=False)
+    return get_lowest_score(target_nodes, traversal)
+
+
+def extract_shortest_paths(target_nodes: list[Node], traversal: search.SearchResult) -> set[Node]:
+    lowest_score = get_lowest_score(target_nodes, traversal)
+    ends = [node for node in target_nodes if traversal.distances[node] == lowest_score]
+    return search.collect_dag_nodes(traversal.predecessors, ends)
+
+
+def count_tiles_on_shortest_path(lines: list[str]) -> int:
+    with stats.timer('traverse_dijkstra'):
+        target_nodes, traversal = traverse_dijkstra(Grid(lines), all_parents=True)
+    with stats.timer('extract_shortest_paths'):
+        nodes = extract_shortest_paths(target_nodes, traversal)
+    tiles = {node // 4 for node in nodes}
     return len(tiles)
 
 
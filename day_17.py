@@ -95,10 +95,13 @@ def construct_reg_a_value_for_output(code: list[int]) -> str:
     raise RuntimeError('Failed to find proper sequence')
 
 
-def resolve_part1(input):
-    out = Program(*parse_input(input)).run()
+def parse(input):
+    return parse_input(input)
+
+def resolve_part1(parsed):
+    out = Program(*parsed).run()
     return ','.join(map(str, out))
 
-def resolve_part2(input):
-    _, code = parse_input(input)
+def resolve_part2(parsed):
+    _, code = parsed
     return construct_reg_a_value_for_output(code)
\ No newline at end of file
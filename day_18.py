@@ -1,9 +1,12 @@
-from collections import deque
 from typing import Optional
 
+from grid import Grid, OUTSIDE
+import search
+
 Point = tuple[int, int]
 
 GRID_SIZE = 71
+CORRUPTED = ord('#')
 
 
 def parse_bytes_positions(lines: list[str]) -> list[Point]:
@@ -13,36 +16,22 @@ def parse_bytes_positions(lines: list[str]) -> list[Point]:
     return list(map(parse_line, lines))
 
 
-def is_on_grid(point: Point) -> bool:
-    x, y = point
-    return x >= 0 and x < GRID_SIZE and y >= 0 and y < GRID_SIZE
-
-
-def get_neighbours(point: Point) -> [Point]:
-    x, y = point
-    dxs = (1, 0, -1, 0)
-    dys = (0, 1, 0, -1)
-    neighbours = [(x + dx, y + dy) for dx, dy in zip(dxs, dys)]
-    return list(filter(is_on_grid, neighbours))
+def create_memory_map(byte_positions: list[Point]) -> Grid:
+    memory = Grid.filled(GRID_SIZE, GRID_SIZE)
+    for x, y in byte_positions:
+        memory.cells[memory.index(x, y)] = CORRUPTED
+    return memory
 
 
 def get_distance_to_exit(byte_positions: list[Point]) -> Optional[int]:
-    start = (0, 0)
-    target = (GRID_SIZE - 1, GRID_SIZE - 1)
-
-    queue = deque([(start, 0)])
-    recorded = {start}
-    bytes_set = set(byte_positions)
-    while queue:
-        point, distance = queue.popleft()
-        if point == target:
-            return distance
-
-        for neigh in get_neighbours(point):
-            if neigh not in recorded and neigh not in bytes_set:
-                queue.append((neigh, distance + 1))
-                recorded.add(neigh)
-    return None
+    memory = create_memory_map(byte_positions)
+    start = memory.index(0, 0)
+    target = memory.index(GRID_SIZE - 1, GRID_SIZE - 1)
+    traversal = search.bfs(len(memory.cells), [start],
+                           neighbours=search.grid_neighbours(memory, blocked=bytes([CORRUPTED, OUTSIDE])),
+                           targets={target})
+    distance = traversal.distances[target]
+    return distance if distance != search.UNREACHED else None
 
 
 def is_end_reachable(bytes_positions: list[Point]) -> bool:
@@ -1,3 +1,6 @@
+import stats
+
+
 def parse_input(lines: list[str]) -> tuple[list[str], list[str]]:
     return lines[0].split(', '), lines[2:]
 
@@ -13,8 +16,10 @@ class CachedTowelsArrangement:
             return True
 
         if design in self._cache:
+            stats.count('cache_hits')
             return self._cache[design]
 
+        stats.count('cache_misses')
         ret = self.__is_pattern_possible_impl(design)
         self._cache[design] = ret
         return ret
@@ -31,8 +36,10 @@ class CachedTowelsArrangement:
             return 1
 
         if design in self._counts_cache:
+            stats.count('cache_hits')
             return self._counts_cache[design]
         
+        stats.count('cache_misses')
         ret = self.__count_arrangements_impl(design)
         self._counts_cache[design] = ret
         return ret
@@ -55,8 +62,11 @@ def count_all_arrangements(patterns: list[str], designs: list[str]) -> int:
     return sum(obj.count_arrangements(design) for design in designs)
 
 
-def resolve_part1(input):
-    return count_possible_patterns(*parse_input(input))
+def parse(input):
+    return parse_input(input)
+
+def resolve_part1(parsed):
+    return count_possible_patterns(*parsed)
 
-def resolve_part2(input):
-    return count_all_arrangements(*parse_input(input))
+def resolve_part2(parsed):
+    return count_all_arrangements(*parsed)
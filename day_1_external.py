@@ -0,0 +1,147 @@
+from array import array
+from heapq import merge
+from itertools import groupby
+import os
+import tempfile
+from typing import Iterable, Iterator
+
+from input_buffer import InputBuffer
+
+# Out of core engine of day_1 (runner --engine external) for lists which do not fit in
+# memory. Input is streamed from the memory mapped file in bounded chunks, each column is
+# spilled to temporary files as sorted runs of int64 values, and the runs are k-way merged
+# into two sorted streams consumed in lockstep. Memory use stays within a budget given in
+# MiB by DAY_1_MEMORY_MB (DEFAULT_MEMORY_MB when unset), which sizes runs and read buffers.
+
+INPUT_FORMAT = 'buffer'
+
+MEMORY_ENV = 'DAY_1_MEMORY_MB'
+DEFAULT_MEMORY_MB = 256
+
+CHUNK_BYTES = 2 ** 20
+# peak cost of a buffered row while spilling: two int64 slots and a column being sorted
+# as a list of int objects
+BYTES_PER_ROW = 64
+# values read at once from each run while merging; fewer runs than the budget allows for
+# at this size are merged in passes
+MIN_READ_VALUES = 4096
+
+
+def get_memory_budget() -> int:
+    return int(os.environ.get(MEMORY_ENV, DEFAULT_MEMORY_MB)) * 2 ** 20
+
+
+def iterate_column_chunks(buffer: InputBuffer, chunk_bytes: int) -> Iterator[tuple[list[int], list[int]]]:
+    for start, end in buffer.chunk_ranges(chunk_bytes):
+        values = buffer.slice(start, end).split()
+        yield list(map(int, values[0::2])), list(map(int, values[1::2]))
+
+
+def write_run(directory: str, values: array) -> str:
+    run = array('q', sorted(values))
+    fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with os.fdopen(fd, 'wb') as file:
+        run.tofile(file)
+    return path
+
+
+def read_run(path: str, read_values: int) -> Iterator[int]:
+    with open(path, 'rb') as file:
+        while True:
+            block = array('q')
+            try:
+                block.fromfile(file, read_values)
+            except EOFError:
+                # values available before the end of file were still read
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def spill_sorted_runs(buffer: InputBuffer, directory: str, run_rows: int) -> tuple[list[str], list[str]]:
+    left_runs, right_runs = [], []
+    left, right = array('q'), array('q')
+    # text of a chunk expands several times once split into tokens and ints
+    chunk_bytes = min(CHUNK_BYTES, max(run_rows * BYTES_PER_ROW // 16, 4096))
+    for left_chunk, right_chunk in iterate_column_chunks(buffer, chunk_bytes):
+        left.extend(left_chunk)
+        right.extend(right_chunk)
+        while len(left) >= run_rows:
+            left_runs.append(write_run(directory, left[:run_rows]))
+            right_runs.append(write_run(directory, right[:run_rows]))
+            del left[:run_rows], right[:run_rows]
+    if left:
+        left_runs.append(write_run(directory, left))
+        right_runs.append(write_run(directory, right))
+    return left_runs, right_runs
+
+
+def merge_runs(paths: list[str], read_values: int) -> Iterator[int]:
+    return merge(*(read_run(path, read_values) for path in paths))
+
+
+def reduce_runs(paths: list[str], directory: str, fan_in: int) -> list[str]:
+    # merges groups of runs into longer ones until a single pass can merge them all
+    while len(paths) > fan_in:
+        merged = []
+        for start in range(0, len(paths), fan_in):
+            group = paths[start:start + fan_in]
+            fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+            with os.fdopen(fd, 'wb') as file:
+                block = array('q')
+                for value in merge_runs(group, MIN_READ_VALUES):
+                    block.append(value)
+                    if len(block) == MIN_READ_VALUES:
+                        block.tofile(file)
+                        block = array('q')
+                block.tofile(file)
+            for old in group:
+                os.remove(old)
+            merged.append(path)
+        paths = merged
+    return paths
+
+
+def sort_columns(buffer: InputBuffer, directory: str, memory_budget: int) -> tuple[Iterator[int], Iterator[int]]:
+    run_rows = max(memory_budget // BYTES_PER_ROW, MIN_READ_VALUES)
+    left_runs, right_runs = spill_sorted_runs(buffer, directory, run_rows)
+    # both columns are merged at the same time, each run holding one read buffer of int64
+    fan_in = max(memory_budget // (2 * 8 * MIN_READ_VALUES), 2)
+    left_runs = reduce_runs(left_runs, directory, fan_in)
+    right_runs = reduce_runs(right_runs, directory, fan_in)
+    read_values = max(memory_budget // (8 * (len(left_runs) + len(right_runs) or 1)), MIN_READ_VALUES)
+    return merge_runs(left_runs, read_values), merge_runs(right_runs, read_values)
+
+
+def calculate_total_distance(left: Iterable[int], right: Iterable[int]) -> int:
+    return sum(abs(a - b) for a, b in zip(left, right))
+
+
+def count_groups(values: Iterable[int]) -> Iterator[tuple[int, int]]:
+    for value, group in groupby(values):
+        yield value, sum(1 for _ in group)
+
+
+def calculate_similarity_score(left: Iterable[int], right: Iterable[int]) -> int:
+    # merge join of the sorted columns, counting equal values on both sides
+    total = 0
+    right_counts = count_groups(right)
+    current = next(right_counts, None)
+    for value, count in count_groups(left):
+        while current is not None and current[0] < value:
+            current = next(right_counts, None)
+        if current is None:
+            break
+        if current[0] == value:
+            total += value * count * current[1]
+    return total
+
+
+def resolve_part1(input):
+    with tempfile.TemporaryDirectory(prefix='day_1_') as directory:
+        return calculate_total_distance(*sort_columns(input, directory, get_memory_budget()))
+
+def resolve_part2(input):
+    with tempfile.TemporaryDirectory(prefix='day_1_') as directory:
+        return calculate_similarity_score(*sort_columns(input, directory, get_memory_budget()))
@@ -0,0 +1,76 @@
+import numpy as np
+
+from input_buffer import InputBuffer
+
+# Vectorized engine of day_1 (runner --engine numpy). Input is parsed straight from the
+# memory mapped file into int64 columns, one bounded chunk of lines at a time, and the
+# reductions run over bounded row ranges; only the sorted columns are held in full.
+
+INPUT_FORMAT = 'buffer'
+
+CHUNK_BYTES = 64 * 2 ** 20
+CHUNK_ROWS = 2 ** 22
+NEWLINE = ord('\n')
+
+
+def count_rows(buffer: InputBuffer, chunk_bytes: int = CHUNK_BYTES) -> int:
+    data = np.frombuffer(buffer.view, dtype=np.uint8)
+    rows = sum(int(np.count_nonzero(data[start:end] == NEWLINE))
+               for start, end in buffer.chunk_ranges(chunk_bytes))
+    return rows + (len(data) > 0 and data[-1] != NEWLINE)
+
+
+def parse_columns(buffer: InputBuffer, chunk_bytes: int = CHUNK_BYTES) -> tuple[np.ndarray, np.ndarray]:
+    rows = count_rows(buffer, chunk_bytes)
+    left = np.empty(rows, dtype=np.int64)
+    right = np.empty(rows, dtype=np.int64)
+    filled = 0
+    for start, end in buffer.chunk_ranges(chunk_bytes):
+        values = np.fromstring(buffer.slice(start, end), dtype=np.int64, sep=' ').reshape(-1, 2)
+        left[filled:filled + len(values)] = values[:, 0]
+        right[filled:filled + len(values)] = values[:, 1]
+        filled += len(values)
+    # blank lines were counted as rows
+    return left[:filled], right[:filled]
+
+
+def exact_sum(terms: np.ndarray) -> int:
+    # int64 sum of many large terms may overflow, while sums of their 32 bit halves
+    # over a chunk of rows cannot
+    high = int((terms >> 32).sum())
+    low = int((terms & 0xFFFFFFFF).sum())
+    return (high << 32) + low
+
+
+def calculate_total_distance(left: np.ndarray, right: np.ndarray) -> int:
+    # columns are parsed for each part, so they are sorted in place without copies
+    left.sort()
+    right.sort()
+    total = 0
+    for start in range(0, len(left), CHUNK_ROWS):
+        end = start + CHUNK_ROWS
+        total += exact_sum(np.abs(left[start:end] - right[start:end]))
+    return total
+
+
+def calculate_similarity_score(left: np.ndarray, right: np.ndarray) -> int:
+    values, counts = np.unique(right, return_counts=True)
+    if not len(values):
+        return 0
+    # lookups of sorted keys walk the table in order, which is several times faster
+    # than random probes; order of the left list does not matter for the score
+    left.sort()
+    total = 0
+    for start in range(0, len(left), CHUNK_ROWS):
+        chunk = left[start:start + CHUNK_ROWS]
+        idx = np.minimum(np.searchsorted(values, chunk), len(values) - 1)
+        found = values[idx] == chunk
+        total += exact_sum(chunk[found] * counts[idx[found]])
+    return total
+
+
+def resolve_part1(input):
+    return calculate_total_distance(*parse_columns(input))
+
+def resolve_part2(input):
+    return calculate_similarity_score(*parse_columns(input))
@@ -1,4 +1,3 @@
-import itertools
 from typing import Optional
 
 
@@ -6,39 +5,56 @@ def parse_reports(lines: list[str]) -> list[list[int]]:
     return [[int(num) for num in line.split()] for line in lines]
 
 
+DIRECTION_LIMITS = ((1, 3), (-3, -1))
+
+
+def find_bad_step(report: list[int], lower_limit: int, upper_limit: int, start: int = 0) -> Optional[int]:
+    # index of the first level from start whose difference to the next one is out of limits
+    for idx in range(start, len(report) - 1):
+        if not lower_limit <= report[idx + 1] - report[idx] <= upper_limit:
+            return idx
+    return None
+
+
 def find_bad_level_index(report: list[int]) -> Optional[int]:
     if len(report) < 2:
         return None
-    
-    should_increase = report[0] < report[1]
-    lower_limit = 1 if should_increase else -3
-    upper_limit = 3 if should_increase else -1
-    def is_good_level(elem) -> bool:
-        x, y = elem[1]
-        return lower_limit <= y - x <= upper_limit
-    it = itertools.filterfalse(is_good_level, enumerate(itertools.pairwise(report)))
-    ret = next(it, None)
-    return ret[0] if ret is not None else None
+    return find_bad_step(report, *DIRECTION_LIMITS[report[0] >= report[1]])
 
 
 def is_safe(report: list[int]) -> bool:
     if len(report) < 2:
         return None
-    
-    should_increase = report[0] < report[1]
-    lower_limit = 1 if should_increase else -3
-    upper_limit = 3 if should_increase else -1
-    return all(lower_limit <= y - x <= upper_limit for x, y in itertools.pairwise(report))
+    return find_bad_level_index(report) is None
 
 
 def count_safe_reports(reports: list[list[int]]) -> int:
     return sum(1 for r in reports if is_safe(r))
 
 
+def is_safe_without(report: list[int], removed: int, lower_limit: int, upper_limit: int) -> bool:
+    # levels before removed are known to be in limits; the report is not copied
+    if 0 < removed < len(report) - 1:
+        if not lower_limit <= report[removed + 1] - report[removed - 1] <= upper_limit:
+            return False
+    return find_bad_step(report, lower_limit, upper_limit, removed + 1) is None
+
+
 def is_safe_enough(report: list[int]) -> bool:
-    if is_safe(report):
-        return True
-    return any(is_safe(report[:i] + report[i + 1:]) for i in range(len(report)))
+    # With fixed direction, only one of the two levels of the first bad step can be the one
+    # to remove, since any other removal keeps them adjacent. Trying both directions covers
+    # removals of the first levels, which decide the direction of what remains.
+    if len(report) < 2:
+        return False
+    for lower_limit, upper_limit in DIRECTION_LIMITS:
+        bad = find_bad_step(report, lower_limit, upper_limit)
+        if bad is None:
+            return True
+        # at least two levels have to remain
+        if len(report) > 2 and (is_safe_without(report, bad, lower_limit, upper_limit) or
+                                is_safe_without(report, bad + 1, lower_limit, upper_limit)):
+            return True
+    return False
 
 
 def count_safe_reports_with_tolerance(reports: list[list[int]]) -> int:
@@ -1,108 +1,73 @@
-import itertools
-from collections import deque
+from array import array
 from typing import Optional, Callable, Iterator
 
+from grid import Grid
+import search
 
-Point = tuple[int, int]
-CheatEnumerator = Callable[[list[str]], Iterator[int]]
 
+CheatEnumerator = Callable[[Grid], Iterator[int]]
 
-def get_char_at(grid: list[str], point: Point) -> str:
-    x, y = point
-    return grid[y][x]
+WALL = ord('#')
+UNREACHABLE = search.UNREACHED
+MAX_CHEAT_LENGTH = 20
 
 
-def find_position(grid: list[str], value: str) -> Point:
-    width = len(grid[0])
-    height = len(grid)
-    return next(pt for pt in itertools.product(range(width), range(height))
-                if get_char_at(grid, pt) == value)
+def create_target_distance_map(grid: Grid) -> array:
+    target = grid.find('E')
+    traversal = search.bfs(len(grid.cells), [target],
+                           neighbours=search.grid_neighbours(grid, blocked=bytes([WALL])))
+    return traversal.distances
 
 
-def get_neighbours(point: Point) -> [Point]:
-    dxs = (1, 0, -1, 0)
-    dys = (0, 1, 0, -1)
-    x, y = point
-    return [(x + dx, y + dy) for dx, dy in zip(dxs, dys)]
+def enumerate_track(distance_map: array) -> Iterator[int]:
+    return (idx for idx, distance in enumerate(distance_map) if distance != UNREACHABLE)
 
 
-def create_target_distance_map(grid: list[str]) -> dict[Point, int]:
-    target = find_position(grid, value='E')
-    result = {target: 0}
-    queue = deque([(target, 0)])
-    while queue:
-        node, distance = queue.popleft()
-        for point in get_neighbours(node):
-            if get_char_at(grid, point) == '#':
-                continue
-            if point not in result:
-                new_distance = distance + 1
-                result[point] = new_distance
-                queue.append((point, new_distance))
-    return result
-
-
-def is_on_edge(grid: list[str], point: Point) -> bool:
-    width = len(grid[0])
-    height = len(grid)
-    x, y = point
-    return x == 0 or x == width - 1 or y == 0 or y == height - 1
-
-
-def get_direction(point1: Point, point2: Point) -> tuple[int, int]:
-    return point2[0] - point1[0], point2[1] - point1[1]
-
-
-def get_time_safe_for_cheat(grid: list[str],
-                            distance_map: dict[Point, int],
-                            current: Point,
-                            wall: Point) -> Optional[int]:
-    if is_on_edge(grid, wall):
-        return None
-
-    dx, dy = get_direction(current, wall)
-    target_tile = (current[0] + 2 * dx, current[1] + 2 * dy)
-    if get_char_at(grid, target_tile) == '#':
+def get_time_safe_for_cheat(distance_map: array, current: int, offset: int) -> Optional[int]:
+    # walls on the edge of the map are followed by padding walls, so they are never passed
+    target_tile = current + 2 * offset
+    if distance_map[target_tile] == UNREACHABLE:
         return None
     save = distance_map[current] - distance_map[target_tile]
     return save - 2 if save > 2 else None
 
 
-def find_cheats(grid: list[str]):
+def find_cheats(grid: Grid):
+    cells = grid.cells
     distance_map = create_target_distance_map(grid)
-    start = find_position(grid, 'S')
-    visited = set()
-    queue = deque([start])
-    while queue:
-        current = queue.popleft()
-        visited.add(current)
-        for neigh in get_neighbours(current):
-            if get_char_at(grid, neigh) == '#':
-                save = get_time_safe_for_cheat(grid, distance_map, current, neigh)
+    for current in enumerate_track(distance_map):
+        for offset in grid.neighbour_offsets:
+            if cells[current + offset] == WALL:
+                save = get_time_safe_for_cheat(distance_map, current, offset)
                 if save is not None:
                     yield save
-            elif neigh not in visited:
-                queue.append(neigh)
 
 
-def count_cheats_with_save_threshold(grid: list[str],
+def count_cheats_with_save_threshold(lines: list[str],
                                      cheat_func: CheatEnumerator,
                                      threshold: int) -> int:
+    # padding as wide as the longest cheat, so cheat offsets never wrap around a row
+    grid = Grid(lines, padding=MAX_CHEAT_LENGTH, border=WALL)
     return sum(1 for cheat in cheat_func(grid) if cheat >= threshold)
 
 
-def manhattan_distance(point1: Point, point2: Point) -> int:
-    return abs(point2[0] - point1[0]) + abs(point2[1] - point1[1])
+def get_cheat_offsets(grid: Grid) -> list[tuple[int, int]]:
+    return [(grid.offset(dx, dy), abs(dx) + abs(dy))
+            for dx in range(-MAX_CHEAT_LENGTH, MAX_CHEAT_LENGTH + 1)
+            for dy in range(abs(dx) - MAX_CHEAT_LENGTH, MAX_CHEAT_LENGTH - abs(dx) + 1)
+            if abs(dx) + abs(dy) > 1]
 
 
-def find_extended_cheats(grid: list[str]):
+def find_extended_cheats(grid: Grid):
+    # every cheat is reported once, from the tile further away from the target
     distance_map = create_target_distance_map(grid)
-    for pt1, pt2 in itertools.combinations(distance_map.keys(), r=2):
-        dist = manhattan_distance(pt1, pt2)
-        if dist <= 20:
-            time_save = abs(distance_map[pt1] - distance_map[pt2])
-            if time_save > dist:
-                yield time_save - dist
+    cheat_offsets = get_cheat_offsets(grid)
+    for start in enumerate_track(distance_map):
+        start_distance = distance_map[start]
+        for offset, length in cheat_offsets:
+            end_distance = distance_map[start + offset]
+            if end_distance != UNREACHABLE and start_distance - end_distance > length:
+                yield start_distance - end_distance - length
 
 
 def resolve_part1(input):
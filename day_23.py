@@ -60,9 +60,12 @@ def find_largest_interconnected_set(connections: Connections) -> set[str]:
     raise RuntimeError('Error occurred')
 
 
-def resolve_part1(input):
-    return count_computer_sets(parse_network(input))
+def parse(input):
+    return parse_network(input)
 
-def resolve_part2(input):
-    lan_party = find_largest_interconnected_set(parse_network(input))
+def resolve_part1(connections):
+    return count_computer_sets(connections)
+
+def resolve_part2(connections):
+    lan_party = find_largest_interconnected_set(connections)
     return ','.join(sorted(lan_party))
@@ -1,6 +1,8 @@
 from typing import NamedTuple, Optional
 from enum import Enum
 
+import stats
+
 Wires = dict[str, bool]
 
 class LogicalGate(NamedTuple):
@@ -54,6 +56,8 @@ def run_gates(wires: Wires, gates: list[LogicalGate]) -> Optional[Wires]:
     wires = dict(wires)
     left = []
     while gates:
+        stats.count('gate_sweeps')
+        stats.count('gates_visited', len(gates))
         for gate in gates:
             if gate.lhs in wires and gate.rhs in wires:
                 wires[gate.output] = generate_output(wires[gate.lhs],
@@ -169,9 +173,12 @@ def get_incorrectly_attached_wires(wires: Wires, gates: list[LogicalGate]) -> li
     return [gate.output for gate in find_flawed_gates(wires, gates)]
 
 
-def resolve_part1(input):
-    return output_number(*parse_input(input))
+def parse(input):
+    return parse_input(input)
+
+def resolve_part1(parsed):
+    return output_number(*parsed)
 
-def resolve_part2(input):
-    wires = get_incorrectly_attached_wires(*parse_input(input))
+def resolve_part2(parsed):
+    wires = get_incorrectly_attached_wires(*parsed)
     return ','.join(sorted(wires))
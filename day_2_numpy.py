@@ -0,0 +1,132 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from input_buffer import InputBuffer
+
+# Vectorized engine of day_2 (runner --engine numpy). Reports are kept as one flat int64
+# array of levels with offsets of each report, and both checks run over all reports at
+# once: steps come from np.diff of the flat array, and counts of bad steps per report are
+# differences of a cumulative sum at report boundaries. Steps across two reports are ignored.
+
+INPUT_FORMAT = 'buffer'
+
+CHUNK_BYTES = 64 * 2 ** 20
+NEWLINE = ord('\n')
+SPACE = ord(' ')
+DIRECTION_LIMITS = ((1, 3), (-3, -1))
+
+
+class Reports(NamedTuple):
+    levels: np.ndarray
+    # report i is levels[offsets[i]:offsets[i + 1]]
+    offsets: np.ndarray
+
+
+def count_levels_per_line(data: np.ndarray) -> np.ndarray:
+    # whitespace and control characters sort before digits and signs
+    is_space = data <= SPACE
+    token_starts = np.flatnonzero(~is_space & np.concatenate(([True], is_space[:-1])))
+    line_ends = np.flatnonzero(data == NEWLINE)
+    if len(data) and data[-1] != NEWLINE:
+        line_ends = np.append(line_ends, len(data))
+    return np.diff(np.searchsorted(token_starts, line_ends), prepend=0)
+
+
+def parse_reports(buffer: InputBuffer, chunk_bytes: int = CHUNK_BYTES) -> Reports:
+    levels = []
+    sizes = []
+    for start, end in buffer.chunk_ranges(chunk_bytes):
+        chunk = buffer.slice(start, end)
+        sizes.append(count_levels_per_line(np.frombuffer(chunk, dtype=np.uint8)))
+        # chunk of blank lines parses as a single zero
+        levels.append(np.fromstring(chunk, dtype=np.int64, sep=' ')[:sizes[-1].sum()])
+    offsets = np.zeros(sum(map(len, sizes)) + 1, dtype=np.int64)
+    np.cumsum(np.concatenate(sizes or [[]]), out=offsets[1:])
+    return Reports(np.concatenate(levels or [[]]).astype(np.int64), offsets)
+
+
+class Steps(NamedTuple):
+    # bad[i] marks steps from levels[i] to levels[i + 1] out of limits within one report
+    bad: np.ndarray
+    # bad_before[i] is count of bad steps before step i
+    bad_before: np.ndarray
+    bad_count: np.ndarray
+
+
+def find_bad_steps(reports: Reports, steps: np.ndarray, lower_limit: int, upper_limit: int) -> Steps:
+    # padded with a step after the last level, so offsets of every report index into it
+    bad = np.append((steps < lower_limit) | (steps > upper_limit), False)
+    # steps from the last level of a report to the first one of the next
+    boundaries = reports.offsets[1:-1] - 1
+    bad[boundaries[boundaries < len(bad)]] = False
+    bad_before = np.zeros(len(bad) + 1, dtype=np.int64)
+    np.cumsum(bad, out=bad_before[1:])
+    first_steps = reports.offsets[:-1]
+    last_steps = np.maximum(reports.offsets[1:] - 1, first_steps)
+    return Steps(bad, bad_before, bad_before[last_steps] - bad_before[first_steps])
+
+
+def report_sizes(reports: Reports) -> np.ndarray:
+    return np.diff(reports.offsets)
+
+
+def strict_verdicts(reports: Reports) -> np.ndarray:
+    steps = np.diff(reports.levels)
+    sizes = report_sizes(reports)
+    safe = np.zeros(len(sizes), dtype=bool)
+    for limits in DIRECTION_LIMITS:
+        safe |= find_bad_steps(reports, steps, *limits).bad_count == 0
+    return safe & (sizes >= 2)
+
+
+def bad_step_in_report(bad: Steps, idx: np.ndarray, first: np.ndarray, last: np.ndarray) -> np.ndarray:
+    # whether step idx is bad, for idx possibly outside of steps of its report
+    inside = (idx >= first) & (idx < last)
+    return inside & bad.bad[np.clip(idx, 0, len(bad.bad) - 1)]
+
+
+def tolerant_verdicts(reports: Reports) -> np.ndarray:
+    # With fixed direction, only one of the two levels of the first bad step can be the one
+    # to remove, see day_2.is_safe_enough. Removing level k drops steps k - 1 and k and adds
+    # the step from level k - 1 to k + 1, so the rest of the report needs no rescan.
+    steps = np.diff(reports.levels)
+    # padded like bad steps, so every index clipped to it is valid even without levels
+    levels = np.append(reports.levels, 0)
+    sizes = report_sizes(reports)
+    first = reports.offsets[:-1]
+    last = np.maximum(reports.offsets[1:] - 1, first)
+    safe = np.zeros(len(sizes), dtype=bool)
+    for lower_limit, upper_limit in DIRECTION_LIMITS:
+        bad = find_bad_steps(reports, steps, lower_limit, upper_limit)
+        safe |= bad.bad_count == 0
+        candidates = (bad.bad_count > 0) & (sizes > 2)
+        first_bad = np.searchsorted(bad.bad_before, bad.bad_before[first], side='right') - 1
+        for removed in (first_bad, first_bad + 1):
+            bridged = (removed > first) & (removed < last)
+            previous = np.clip(removed - 1, 0, len(levels) - 1)
+            following = np.clip(removed + 1, 0, len(levels) - 1)
+            bridge = levels[following] - levels[previous]
+            bridge_good = ~bridged | ((bridge >= lower_limit) & (bridge <= upper_limit))
+            remaining = (bad.bad_count - bad_step_in_report(bad, removed - 1, first, last)
+                         - bad_step_in_report(bad, removed, first, last))
+            safe |= candidates & bridge_good & (remaining == 0)
+    return safe & (sizes >= 2)
+
+
+def count_safe_reports(reports: Reports) -> int:
+    return int(np.count_nonzero(strict_verdicts(reports)))
+
+
+def count_safe_reports_with_tolerance(reports: Reports) -> int:
+    return int(np.count_nonzero(tolerant_verdicts(reports)))
+
+
+def parse(input):
+    return parse_reports(input)
+
+def resolve_part1(reports):
+    return count_safe_reports(reports)
+
+def resolve_part2(reports):
+    return count_safe_reports_with_tolerance(reports)
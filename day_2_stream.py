@@ -0,0 +1,60 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import os
+from typing import Iterator
+
+import day_2
+from input_buffer import InputBuffer
+
+# Streaming engine of day_2 (runner --engine stream) for report feeds too large to hold
+# as lists. Line aligned chunks of the memory mapped input are fanned out to a process
+# pool which checks reports with day_2.is_safe / is_safe_enough, and counts of safe
+# reports are summed as they arrive. At most IN_FLIGHT_PER_WORKER chunks per worker are
+# pending at a time, so memory does not grow with the input. Size of the pool is taken
+# from DAY_2_WORKERS, all cores by default.
+
+INPUT_FORMAT = 'buffer'
+
+WORKERS_ENV = 'DAY_2_WORKERS'
+CHUNK_BYTES = 2 ** 20
+IN_FLIGHT_PER_WORKER = 2
+
+
+def get_workers() -> int:
+    return int(os.environ.get(WORKERS_ENV, 0)) or os.cpu_count() or 1
+
+
+def iterate_chunks(buffer: InputBuffer, chunk_bytes: int) -> Iterator[bytes]:
+    for start, end in buffer.chunk_ranges(chunk_bytes):
+        yield buffer.slice(start, end)
+
+
+def count_safe_in_chunk(chunk: bytes, tolerant: bool) -> int:
+    is_safe = day_2.is_safe_enough if tolerant else day_2.is_safe
+    return sum(1 for line in chunk.splitlines() if is_safe([int(num) for num in line.split()]))
+
+
+def count_safe_reports(buffer: InputBuffer, tolerant: bool, workers: int = None,
+                       chunk_bytes: int = CHUNK_BYTES) -> int:
+    workers = workers or get_workers()
+    chunks = iterate_chunks(buffer, chunk_bytes)
+    if workers == 1 or len(buffer.view) <= chunk_bytes:
+        # starting a pool costs more than checking a single chunk
+        return sum(count_safe_in_chunk(chunk, tolerant) for chunk in chunks)
+
+    total = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                total += sum(future.result() for future in done)
+            pending.add(executor.submit(count_safe_in_chunk, chunk, tolerant))
+        total += sum(future.result() for future in wait(pending).done)
+    return total
+
+
+def resolve_part1(input):
+    return count_safe_reports(input, tolerant=False)
+
+def resolve_part2(input):
+    return count_safe_reports(input, tolerant=True)
@@ -0,0 +1,103 @@
+import re
+from typing import Iterator, Optional
+
+import day_3
+from input_buffer import InputBuffer
+import stats
+
+# Bytes engine of day_3 (runner --engine bytes) for memory dumps of many GB. Patterns of
+# day_3 are compiled as bytes and run straight over the memory mapped input, so joined
+# memory is never created, multiplications come from findall without match objects, and
+# operands go from bytes to int. Memory is what day_3 sees: lines stripped of trailing
+# (ASCII) whitespace and joined. Each line, cut into windows bounding the size of findall
+# results, is scanned in place, and instructions crossing ends of lines or windows are
+# found in a few bytes around the boundary. Non ASCII digits, which \d matches in str
+# patterns, are not matched.
+
+INPUT_FORMAT = 'buffer'
+
+WINDOW_BYTES = 2 ** 24
+# instructions crossing a boundary start at most this many bytes before it
+LOOKBEHIND = len('mul(999,999)') - 1
+WHITESPACE = b' \t\n\r\x0b\x0c'
+
+MUL_REGEX = re.compile(day_3.MUL_PATTERN.encode())
+TOGGLE_REGEX = re.compile(b'|'.join([day_3.ENABLE_PATTERN.encode(), day_3.DISABLE_PATTERN.encode()]))
+INSTRUCTION_REGEX = re.compile(b'|'.join([MUL_REGEX.pattern, TOGGLE_REGEX.pattern]))
+
+
+def iterate_segments(buffer: InputBuffer, window_bytes: int) -> Iterator[tuple[int, int]]:
+    view = buffer.view
+    start = 0
+    while start < len(view):
+        newline = buffer.find(b'\n', start)
+        line_end = len(view) if newline == -1 else newline
+        end = line_end
+        while end > start and view[end - 1] in WHITESPACE:
+            end -= 1
+        for window_start in range(start, end, window_bytes):
+            yield window_start, min(window_start + window_bytes, end)
+        start = line_end + 1
+
+
+def iterate_scan_ranges(buffer: InputBuffer, window_bytes: int = WINDOW_BYTES
+                       ) -> Iterator[tuple[Optional[re.Match], int, int]]:
+    # Ranges of the buffer to scan in order of memory, each with the instruction crossing
+    # into it, if any. Instructions never overlap, so the crossing one precedes all those
+    # inside the range; one continuing past a short range is reported with the range it
+    # ends in.
+    tail = b''
+    for start, end in iterate_segments(buffer, window_bytes):
+        stats.count('bytes_scanned', end - start)
+        crossing = None
+        if tail:
+            text = tail + buffer.slice(start, min(end, start + LOOKBEHIND))
+            crossing = next((match for match in INSTRUCTION_REGEX.finditer(text)
+                             if match.start() < len(tail) < match.end()), None)
+        yield crossing, start, end
+        tail = (tail + buffer.slice(max(start, end - LOOKBEHIND), end))[-LOOKBEHIND:]
+
+
+def sum_multiplications(buffer: InputBuffer, start: int, end: int) -> int:
+    return sum(int(lhs) * int(rhs) for lhs, rhs in MUL_REGEX.findall(buffer.view, start, end))
+
+
+def is_enabling(toggle: re.Match) -> bool:
+    return not toggle.group().startswith(b"don't")
+
+
+def execute_multiplications(buffer: InputBuffer, window_bytes: int = WINDOW_BYTES) -> int:
+    result = 0
+    for crossing, start, end in iterate_scan_ranges(buffer, window_bytes):
+        if crossing is not None and crossing.group(1) is not None:
+            result += int(crossing.group(1)) * int(crossing.group(2))
+        result += sum_multiplications(buffer, start, end)
+    return result
+
+
+def execute_conditionally(buffer: InputBuffer, window_bytes: int = WINDOW_BYTES) -> int:
+    enabled = True
+    result = 0
+    for crossing, start, end in iterate_scan_ranges(buffer, window_bytes):
+        if crossing is not None:
+            if crossing.group(1) is None:
+                enabled = is_enabling(crossing)
+            elif enabled:
+                result += int(crossing.group(1)) * int(crossing.group(2))
+        # toggles are rare, so multiplications are summed over whole ranges between them,
+        # which spares alternation and a match object per multiplication
+        for toggle in TOGGLE_REGEX.finditer(buffer.view, start, end):
+            if enabled:
+                result += sum_multiplications(buffer, start, toggle.start())
+            enabled = is_enabling(toggle)
+            start = toggle.end()
+        if enabled:
+            result += sum_multiplications(buffer, start, end)
+    return result
+
+
+def resolve_part1(input):
+    return execute_multiplications(input)
+
+def resolve_part2(input):
+    return execute_conditionally(input)
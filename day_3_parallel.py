@@ -0,0 +1,123 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import re
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+import day_3
+from input_buffer import InputBuffer
+
+# Chunked engine of day_3 (runner --engine parallel) for memory dumps of many GB. Memory
+# is split into fixed size chunks scanned in a process pool, each extended by a lookahead
+# long enough for any instruction starting in the chunk, and only matches starting in the
+# chunk are counted. No instruction occurs inside another one, so a scan starting in the
+# middle of an instruction finds nothing extra. Chunks do not know whether they are entered
+# enabled, so they return sums for both cases, and sums of the state at each chunk entry
+# are picked by a prefix scan over states the chunks leave. Size of the pool is taken
+# from DAY_3_WORKERS, all cores by default.
+
+INPUT_FORMAT = 'buffer'
+
+WORKERS_ENV = 'DAY_3_WORKERS'
+CHUNK_BYTES = 2 ** 22
+IN_FLIGHT_PER_WORKER = 2
+# mul(999,999) is the longest instruction
+LOOKAHEAD = len('mul(999,999)') - 1
+
+INSTRUCTION_REGEX = re.compile('|'.join([day_3.MUL_PATTERN, day_3.ENABLE_PATTERN,
+                                         day_3.DISABLE_PATTERN]).encode())
+
+
+class ChunkSums(NamedTuple):
+    total: int
+    # sums of enabled multiplications when the chunk is entered enabled or disabled
+    if_enabled: int
+    if_disabled: int
+    # state after the chunk, None when it contains neither do() nor don't()
+    exit_state: Optional[bool]
+
+
+def get_workers() -> int:
+    return int(os.environ.get(WORKERS_ENV, 0)) or os.cpu_count() or 1
+
+
+def iterate_memory(buffer: InputBuffer, window_bytes: int) -> Iterator[bytes]:
+    carry = b''
+    for start in range(0, len(buffer.view), window_bytes):
+        raw = carry + buffer.slice(start, start + window_bytes)
+        # whitespace at the end may turn out to end a line in the next window
+        content = raw.rstrip()
+        carry = raw[len(content):]
+        # runner strips trailing whitespace of lines which day_3 then joins
+        *lines, last = content.split(b'\n')
+        yield b''.join([line.rstrip() for line in lines] + [last])
+
+
+def iterate_chunks(memory: Iterable[bytes], chunk_bytes: int) -> Iterator[tuple[bytes, bytes]]:
+    # chunks of memory along with LOOKAHEAD bytes which follow them
+    pending = b''
+    for piece in memory:
+        pending += piece
+        while len(pending) > chunk_bytes + LOOKAHEAD:
+            yield pending[:chunk_bytes], pending[chunk_bytes:chunk_bytes + LOOKAHEAD]
+            pending = pending[chunk_bytes:]
+    while pending:
+        yield pending[:chunk_bytes], pending[chunk_bytes:chunk_bytes + LOOKAHEAD]
+        pending = pending[chunk_bytes:]
+
+
+def scan_chunk(chunk: bytes, lookahead: bytes) -> ChunkSums:
+    total = if_enabled = if_disabled = 0
+    state = None
+    for match in INSTRUCTION_REGEX.finditer(chunk + lookahead):
+        if match.start() >= len(chunk):
+            break
+        if match.group(1) is not None:
+            product = int(match.group(1)) * int(match.group(2))
+            total += product
+            if state is None:
+                if_enabled += product
+            elif state:
+                if_enabled += product
+                if_disabled += product
+        else:
+            state = not match.group().startswith(b"don't")
+    return ChunkSums(total, if_enabled, if_disabled, state)
+
+
+def stitch_conditionally(sums: Iterable[ChunkSums]) -> int:
+    enabled = True
+    result = 0
+    for chunk_sums in sums:
+        result += chunk_sums.if_enabled if enabled else chunk_sums.if_disabled
+        if chunk_sums.exit_state is not None:
+            enabled = chunk_sums.exit_state
+    return result
+
+
+def map_in_order(function: Callable, items: Iterable[tuple], workers: int) -> Iterator:
+    # like executor.map, but submits items only as results are consumed to bound memory
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, *item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def scan_memory(buffer: InputBuffer, workers: int = None, chunk_bytes: int = CHUNK_BYTES) -> Iterator[ChunkSums]:
+    workers = workers or get_workers()
+    chunks = iterate_chunks(iterate_memory(buffer, chunk_bytes), chunk_bytes)
+    if workers == 1 or len(buffer.view) <= chunk_bytes:
+        # starting a pool costs more than scanning a single chunk
+        return (scan_chunk(*chunk) for chunk in chunks)
+    return map_in_order(scan_chunk, chunks, workers)
+
+
+def resolve_part1(input):
+    return sum(chunk_sums.total for chunk_sums in scan_memory(input))
+
+def resolve_part2(input):
+    return stitch_conditionally(scan_memory(input))
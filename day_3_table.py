@@ -0,0 +1,59 @@
+from tokenizer import Instruction, InstructionTable, Operands
+
+# Table driven engine of day_3 (runner --engine table). Memory is tokenized in a single
+# pass by tokenizer.InstructionTable and each instruction is executed by the handler at
+# its id. New instructions take an entry in INSTRUCTIONS and a handler in each table.
+
+MUL, DO, DONT = range(3)
+
+INSTRUCTIONS = InstructionTable([
+    Instruction('mul', arity=2),
+    Instruction('do', arity=0),
+    Instruction("don't", arity=0),
+])
+
+
+class Machine:
+    def __init__(self):
+        self.enabled = True
+        self.result = 0
+
+
+def multiply(machine: Machine, operands: Operands) -> None:
+    machine.result += operands[0] * operands[1]
+
+
+def multiply_if_enabled(machine: Machine, operands: Operands) -> None:
+    if machine.enabled:
+        machine.result += operands[0] * operands[1]
+
+
+def enable(machine: Machine, operands: Operands) -> None:
+    machine.enabled = True
+
+
+def disable(machine: Machine, operands: Operands) -> None:
+    machine.enabled = False
+
+
+def ignore(machine: Machine, operands: Operands) -> None:
+    pass
+
+
+# handlers by instruction id
+UNCONDITIONAL_HANDLERS = (multiply, ignore, ignore)
+CONDITIONAL_HANDLERS = (multiply_if_enabled, enable, disable)
+
+
+def execute(memory: bytes, handlers) -> int:
+    machine = Machine()
+    for instruction_id, operands in INSTRUCTIONS.tokenize(memory):
+        handlers[instruction_id](machine, operands)
+    return machine.result
+
+
+def resolve_part1(input):
+    return execute(''.join(input).encode(), UNCONDITIONAL_HANDLERS)
+
+def resolve_part2(input):
+    return execute(''.join(input).encode(), CONDITIONAL_HANDLERS)
@@ -1,98 +1,41 @@
-import re
-import itertools
+from grid import Grid
 
-XMAS_REGEX = re.compile('XMAS|SAMX')
+WORD = b'XMAS'
+MAS_ENDS = frozenset(b'MS')
 
 
-def count_xmas_occurrences(text: str) -> int:
+def count_xmas_starting_at(grid: Grid, idx: int) -> int:
+    cells = grid.cells
+    m, a, s = WORD[1:]
     result = 0
-    idx = 0
-    while (m := XMAS_REGEX.search(text, idx)) is not None:
-        result += 1
-        idx = m.start() + 1
+    for offset in grid.neighbour_offsets + grid.diagonal_offsets:
+        if cells[idx + offset] == m and cells[idx + 2 * offset] == a and cells[idx + 3 * offset] == s:
+            result += 1
     return result
 
 
-def count_horizontal_occurrences(lines: list[str]) -> int:
-    return sum(map(count_xmas_occurrences, lines))
-
-
-def count_vertical_occurrences(lines: list[str]) -> int:
-    width = len(lines[0])
-    columns = (''.join(line[i] for line in lines) for i in range(width))
-    return sum(map(count_xmas_occurrences, columns))
-
-
-def get_dimensions(lines: list[str]) -> tuple[int, int]:
-    return len(lines[0]), len(lines)
-
-
-def north_west_diagonal(starting_point: tuple[int, int], lines: list[str]) -> str:
-    width, height = get_dimensions(lines)
-    point = starting_point
-    result = ''
-    while point[0] < width and point[1] < height:
-        x, y = point
-        result += lines[y][x]
-        point = (x + 1, y + 1)
-    return result
-
-
-def count_north_west_diagonal_occurrences(lines: list[str]) -> int:
-    width, height = get_dimensions(lines)
-    points = itertools.chain(
-        ((x, 0) for x in range(width)),
-        ((0, y) for y in range(1, height))
-    )
-    return sum(count_xmas_occurrences(north_west_diagonal(p, lines)) for p in points)
-
-
-def north_east_diagonal(starting_point: tuple[int, int], lines: list[str]) -> str:
-    width, height = get_dimensions(lines)
-    point = starting_point
-    result = ''
-    while point[0] >= 0 and point[1] < height:
-        x, y = point
-        result += lines[y][x]
-        point = (x - 1, y + 1)
-    return result
-
-
-def count_north_east_diagonal_occurrences(lines: list[str]) -> int:
-    width, height = get_dimensions(lines)
-    points = itertools.chain(
-        ((x, 0) for x in range(width)),
-        ((width - 1, y) for y in range(1, height))
-    )
-    return sum(count_xmas_occurrences(north_east_diagonal(p, lines)) for p in points)
-
-
 def count_all_occurrences(lines: list[str]) -> int:
-    return (
-        count_horizontal_occurrences(lines) +
-        count_vertical_occurrences(lines) +
-        count_north_west_diagonal_occurrences(lines) +
-        count_north_east_diagonal_occurrences(lines)
-    )
+    # padding wide enough for the rest of the word to never leave the array
+    grid = Grid(lines, padding=len(WORD) - 1)
+    return sum(count_xmas_starting_at(grid, idx) for idx in grid.find_all('X'))
 
 
-def is_center_of_x_mas(lines: list[str], point: tuple[int, int]) -> bool:
-    x, y = point
+def is_center_of_x_mas(grid: Grid, idx: int) -> bool:
+    cells = grid.cells
+    south_east, south_west, north_west, north_east = grid.diagonal_offsets
     return (
-        lines[y][x] == 'A' and
-        {lines[y - 1][x - 1], lines[y + 1][x + 1]} == {'M', 'S'} and
-        {lines[y - 1][x + 1], lines[y + 1][x - 1]} == {'M', 'S'}
+        {cells[idx + north_west], cells[idx + south_east]} == MAS_ENDS and
+        {cells[idx + north_east], cells[idx + south_west]} == MAS_ENDS
     )
 
 
 def count_all_x_mas_occurrences(lines: list[str]) -> int:
-    width, height = get_dimensions(lines)
-    points = itertools.product(range(1, width - 1), range(1, height - 1))
-    return sum(1 for point in points if is_center_of_x_mas(lines, point))
+    grid = Grid(lines)
+    return sum(1 for idx in grid.find_all('A') if is_center_of_x_mas(grid, idx))
 
 
 def resolve_part1(input):
     return count_all_occurrences(input)
 
 def resolve_part2(input):
-    return count_all_x_mas_occurrences(input)
\ No newline at end of file
+    return count_all_x_mas_occurrences(input)
@@ -73,10 +73,13 @@ def sum_middle_pages_for_fixed_updates(updates: list[Update], rules: list[Rule])
     return sum(item[len(item) // 2] for item in fixed_updates)
 
 
-def resolve_part1(input):
-    rules, updates = parse_input(input)
+def parse(input):
+    return parse_input(input)
+
+def resolve_part1(parsed):
+    rules, updates = parsed
     return sum_middle_pages_for_correct_updates(updates, rules)
 
-def resolve_part2(input):
-    rules, updates = parse_input(input)
+def resolve_part2(parsed):
+    rules, updates = parsed
     return sum_middle_pages_for_fixed_updates(updates, rules)
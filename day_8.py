@@ -2,35 +2,30 @@ from collections import defaultdict
 from typing import Callable
 import itertools
 
+from grid import Grid
+
 Point = tuple[int, int]
 AntennasMap = dict[str, list[Point]]
-AntinodesFunc = Callable[[list[str], Point, Point], list[Point]]
+AntinodesFunc = Callable[[Grid, Point, Point], list[Point]]
 
-def collect_antennas_positions(grid: list[str]) -> AntennasMap:
+def collect_antennas_positions(grid: Grid) -> AntennasMap:
     result = defaultdict(list)
-    for y, row in enumerate(grid):
-        for x, c in enumerate(row):
-            if c != '.':
-                result[c].append((x, y))
+    for idx in grid.indices():
+        c = grid.cells[idx]
+        if c != ord('.'):
+            result[chr(c)].append(grid.coords(idx))
     return result
 
 
-def is_in_range(grid: list[str], pos: Point) -> bool:
-    x, y = pos
-    width = len(grid[0])
-    height = len(grid)
-    return x >= 0 and x < width and y >= 0 and y < height
-
-
-def get_antinodes(grid: list[str], pos1: Point, pos2: Point) -> list[Point]:
+def get_antinodes(grid: Grid, pos1: Point, pos2: Point) -> list[Point]:
     dx = pos2[0] - pos1[0]
     dy = pos2[1] - pos1[1]
     p1 = (pos2[0] + dx, pos2[1] + dy)
     p2 = (pos1[0] - dx, pos1[1] - dy)
-    return list(filter(lambda p: is_in_range(grid, p), [p1, p2]))
+    return list(filter(lambda p: grid.contains(*p), [p1, p2]))
 
 
-def collect_antinodes(grid: list[str],
+def collect_antinodes(grid: Grid,
                       antennas: list[Point],
                       antinodes_generator: AntinodesFunc) -> set[Point]:
     antinodes = set()
@@ -39,7 +34,8 @@ def collect_antinodes(grid: list[str],
     return antinodes
 
 
-def count_all_antinodes(grid: list[str], antinodes_generator: AntinodesFunc):
+def count_all_antinodes(lines: list[str], antinodes_generator: AntinodesFunc):
+    grid = Grid(lines)
     antennas = collect_antennas_positions(grid)
     antinodes = set()
     for freq, positions in antennas.items():
@@ -47,16 +43,16 @@ def count_all_antinodes(grid: list[str], antinodes_generator: AntinodesFunc):
     return len(antinodes)
 
 
-def get_antinodes_p2(grid: list[str], pos1: Point, pos2: Point) -> list[Point]:
+def get_antinodes_p2(grid: Grid, pos1: Point, pos2: Point) -> list[Point]:
     result = [pos1, pos2]
     dx = pos2[0] - pos1[0]
     dy = pos2[1] - pos1[1]
     antinode = (pos2[0] + dx, pos2[1] + dy)
-    while is_in_range(grid, antinode):
+    while grid.contains(*antinode):
         result.append(antinode)
         antinode = (antinode[0] + dx, antinode[1] + dy)
     antinode = (pos1[0] - dx, pos1[1] - dy)
-    while is_in_range(grid, antinode):
+    while grid.contains(*antinode):
         result.append(antinode)
         antinode = (antinode[0] - dx, antinode[1] - dy)
     return result
@@ -1,17 +1,21 @@
 import itertools
 from collections import OrderedDict
+from typing import Union
+
+INPUT_FORMAT = 'buffer'
 
 
 class DiskMapper:
-    def __init__(self, disk_map: str):
+    def __init__(self, disk_map: Union[str, bytes, memoryview]):
         self._blocks = []
         self._free_space = OrderedDict()
         self._org_files_mapping = []
         self.__initialize(disk_map)
 
-    def __initialize(self, disk_map: str):
-        for idx, c in enumerate(disk_map):
-            size = ord(c) - ord('0')
+    def __initialize(self, disk_map: Union[str, bytes, memoryview]):
+        digits = disk_map.encode() if isinstance(disk_map, str) else disk_map
+        for idx, c in enumerate(digits):
+            size = c - ord('0')
             next_block = len(self._blocks)
             if idx % 2 == 0:
                 self._blocks.extend(itertools.repeat(idx // 2, size))
@@ -71,11 +75,11 @@ class DiskMapper:
 
 
 def resolve_part1(input):
-    mapper = DiskMapper(input[0])
+    mapper = DiskMapper(input.line(0))
     mapper.pack_blocks()
     return mapper.checksum()
 
 def resolve_part2(input):
-    mapper = DiskMapper(input[0])
+    mapper = DiskMapper(input.line(0))
     mapper.pack_files()
     return mapper.checksum()
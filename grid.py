@@ -0,0 +1,91 @@
+from typing import Iterator, Sequence, Union
+
+# Cells are kept row after row in one flat bytearray. Every row is padded with `padding`
+# border cells on both sides and there are `padding` border rows above and below the map,
+# so a cell is addressed by a single integer index, moving is one addition of an offset and
+# stepping off the map lands on a border cell instead of raising or wrapping around.
+
+OUTSIDE = 0
+
+EAST = 0
+SOUTH = 1
+WEST = 2
+NORTH = 3
+
+Row = Union[str, bytes]
+
+
+def turn_right(direction: int) -> int:
+    return (direction + 1) % 4
+
+
+def turn_left(direction: int) -> int:
+    return (direction - 1) % 4
+
+
+class Grid:
+    def __init__(self, rows: Sequence[Row], padding: int = 1, border: int = OUTSIDE):
+        self.width = len(rows[0]) if rows else 0
+        self.height = len(rows)
+        self.padding = padding
+        self.stride = self.width + 2 * padding
+        self.cells = bytearray([border]) * (self.stride * (self.height + 2 * padding))
+        for y, row in enumerate(rows):
+            # slice assignment of another length would resize cells and shift every row after
+            if len(row) != self.width:
+                raise ValueError(f'row {y} has width {len(row)}, expected {self.width}')
+            start = self.index(0, y)
+            self.cells[start:start + self.width] = row.encode() if isinstance(row, str) else row
+        stride = self.stride
+        # indexed with EAST, SOUTH, WEST, NORTH
+        self.neighbour_offsets = (1, stride, -1, -stride)
+        self.diagonal_offsets = (stride + 1, stride - 1, -stride - 1, -stride + 1)
+
+    @classmethod
+    def filled(cls, width: int, height: int, value: str = '.',
+               padding: int = 1, border: int = OUTSIDE) -> 'Grid':
+        return cls([value * width] * height, padding, border)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.padding) * self.stride + x + self.padding
+
+    def coords(self, idx: int) -> tuple[int, int]:
+        y, x = divmod(idx, self.stride)
+        return x - self.padding, y - self.padding
+
+    def offset(self, dx: int, dy: int) -> int:
+        return dy * self.stride + dx
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def indices(self) -> Iterator[int]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find_all(self, value: str) -> list[int]:
+        # plain search over the whole array, so border value should not be looked for
+        code = value.encode()
+        result = []
+        idx = self.cells.find(code)
+        while idx != -1:
+            result.append(idx)
+            idx = self.cells.find(code, idx + 1)
+        return result
+
+    def find(self, value: str) -> int:
+        idx = self.cells.find(value.encode())
+        if idx == -1:
+            raise ValueError(f'{value!r} not found in grid')
+        return idx
+
+    def rows(self) -> list[str]:
+        starts = (self.index(0, y) for y in range(self.height))
+        return [self.cells[start:start + self.width].decode() for start in starts]
+
+    def copy(self) -> 'Grid':
+        result = object.__new__(Grid)
+        result.__dict__.update(self.__dict__)
+        result.cells = bytearray(self.cells)
+        return result
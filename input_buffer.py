@@ -0,0 +1,74 @@
+from array import array
+import mmap
+from typing import Iterator, Union
+
+# day modules setting INPUT_FORMAT to this value get InputBuffer instead of list[str]
+BUFFER_FORMAT = 'buffer'
+
+
+class InputBuffer:
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        self._data = data
+        self.view = memoryview(data)
+        self._line_starts = None
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> 'InputBuffer':
+        return cls('\n'.join(lines).encode() + b'\n' if lines else b'')
+
+    def __len__(self) -> int:
+        return len(self.line_starts)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return (self.line(idx) for idx in range(len(self)))
+
+    @property
+    def line_starts(self) -> array:
+        # offsets are computed lazily, modules treating input as one blob never pay for it
+        if self._line_starts is None:
+            starts = array('q')
+            pos = 0
+            size = len(self._data)
+            while pos < size:
+                starts.append(pos)
+                newline = self._data.find(b'\n', pos)
+                pos = size if newline == -1 else newline + 1
+            self._line_starts = starts
+        return self._line_starts
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        return self._data.find(sub, start)
+
+    def slice(self, start: int, end: int) -> bytes:
+        # copy of the range, for consumers which do not take memoryview
+        return self._data[start:end]
+
+    def chunk_ranges(self, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+        # byte ranges of about chunk_bytes extended to the end of the line they cut, so
+        # large inputs can be consumed in bounded pieces without computing line offsets
+        size = len(self._data)
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                newline = self._data.find(b'\n', end - 1)
+                end = size if newline == -1 else newline + 1
+            yield start, end
+            start = end
+
+    def line(self, idx: int) -> memoryview:
+        starts = self.line_starts
+        start = starts[idx]
+        end = starts[idx + 1] - 1 if idx + 1 < len(starts) else len(self._data)
+        while end > start and self.view[end - 1] in b'\r\n':
+            end -= 1
+        return self.view[start:end]
+
+
+def open_input_buffer(input_file: str) -> InputBuffer:
+    with open(input_file, 'rb') as file:
+        try:
+            return InputBuffer(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:
+            # empty files cannot be mapped
+            return InputBuffer(b'')
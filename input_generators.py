@@ -0,0 +1,427 @@
+import argparse
+import itertools
+import math
+import random
+import string
+import sys
+from typing import Callable
+
+DEFAULT_SEED = 2024
+
+Generator = Callable[[random.Random, float], list[str]]
+
+LONG_REPORT_LENGTH = 10 ** 5
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def scaled_side(base: int, scale: float) -> int:
+    # grids grow in both dimensions, so scaling the area means scaling the side by sqrt
+    return max(5, round(base * math.sqrt(scale)))
+
+
+def generate_day_1(rng: random.Random, scale: float) -> list[str]:
+    return [f'{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}'
+            for _ in range(scaled(1000, scale))]
+
+
+def generate_report(rng: random.Random, length: int = None) -> list[int]:
+    length = length or rng.randint(5, 8)
+    sign = rng.choice((-1, 1))
+    report = [rng.randint(10, 90)]
+    for _ in range(length - 1):
+        report.append(report[-1] + sign * rng.randint(1, 3))
+    if rng.random() < 0.5:
+        report[rng.randrange(length)] += rng.randint(-4, 4)
+    return report
+
+
+def generate_day_2(rng: random.Random, scale: float) -> list[str]:
+    return [' '.join(map(str, generate_report(rng))) for _ in range(scaled(1000, scale))]
+
+
+def generate_day_2_long_reports(rng: random.Random, scale: float) -> list[str]:
+    # few reports of LONG_REPORT_LENGTH levels, for checks whose cost grows with report length;
+    # each has at least one level out of limits, so tolerance is always exercised
+    reports = []
+    for _ in range(scaled(10, scale)):
+        report = generate_report(rng, LONG_REPORT_LENGTH)
+        report[rng.randrange(LONG_REPORT_LENGTH)] += rng.choice((-10, 10))
+        reports.append(' '.join(map(str, report)))
+    return reports
+
+
+def generate_corrupted_memory(rng: random.Random, length: int) -> str:
+    junk = string.ascii_letters + string.digits + "()[]{},'!@#$%^&*+-_?<> "
+    pieces = []
+    size = 0
+    while size < length:
+        roll = rng.random()
+        if roll < 0.05:
+            piece = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+        elif roll < 0.06:
+            piece = 'do()'
+        elif roll < 0.07:
+            piece = "don't()"
+        elif roll < 0.08:
+            piece = f'mul({rng.randint(1, 999)}, {rng.randint(1, 999)}]'
+        else:
+            piece = rng.choice(junk)
+        pieces.append(piece)
+        size += len(piece)
+    return ''.join(pieces)
+
+
+def generate_day_3(rng: random.Random, scale: float) -> list[str]:
+    return [generate_corrupted_memory(rng, scaled(3000, scale)) for _ in range(6)]
+
+
+def generate_day_4(rng: random.Random, scale: float) -> list[str]:
+    side = scaled_side(140, scale)
+    return [''.join(rng.choice('XMAS') for _ in range(side)) for _ in range(side)]
+
+
+def generate_day_5(rng: random.Random, scale: float) -> list[str]:
+    pages = rng.sample(range(11, 100), 49)
+    rules = [f'{lhs}|{rhs}' for lhs, rhs in itertools.combinations(pages, r=2)]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(scaled(200, scale)):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(map(str, update)))
+    return rules + [''] + updates
+
+
+def generate_day_6(rng: random.Random, scale: float) -> list[str]:
+    side = scaled_side(130, scale)
+    grid = [['#' if rng.random() < 0.05 else '.' for _ in range(side)] for _ in range(side)]
+    grid[rng.randrange(side // 4, side)][rng.randrange(side)] = '^'
+    return [''.join(row) for row in grid]
+
+
+def generate_equation(rng: random.Random) -> str:
+    numbers = [rng.randint(1, 999 if rng.random() < 0.2 else 9) for _ in range(rng.randint(3, 12))]
+    value = numbers[0]
+    for num in numbers[1:]:
+        op = rng.choice('+*|')
+        if op == '+':
+            value += num
+        elif op == '*':
+            value *= num
+        else:
+            value = int(f'{value}{num}')
+    if rng.random() < 0.4:
+        value += rng.randint(1, 10)
+    return f'{value}: {" ".join(map(str, numbers))}'
+
+
+def generate_day_7(rng: random.Random, scale: float) -> list[str]:
+    return [generate_equation(rng) for _ in range(scaled(850, scale))]
+
+
+def generate_day_8(rng: random.Random, scale: float) -> list[str]:
+    side = scaled_side(50, scale)
+    grid = [['.'] * side for _ in range(side)]
+    frequencies = string.ascii_letters + string.digits
+    for _ in range(scaled(200, scale)):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return [''.join(row) for row in grid]
+
+
+def generate_day_9(rng: random.Random, scale: float) -> list[str]:
+    files = scaled(10000, scale)
+    digits = []
+    for _ in range(files - 1):
+        digits.append(str(rng.randint(1, 9)))
+        digits.append(str(rng.randint(0, 9)))
+    digits.append(str(rng.randint(1, 9)))
+    return [''.join(digits)]
+
+
+def generate_day_10(rng: random.Random, scale: float) -> list[str]:
+    side = scaled_side(45, scale)
+    # diagonal bands of increasing height make trails, random noise breaks some of them
+    return [''.join(str(rng.randint(0, 9) if rng.random() < 0.1 else (x + y) % 10) for x in range(side))
+            for y in range(side)]
+
+
+def generate_day_11(rng: random.Random, scale: float) -> list[str]:
+    return [' '.join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(scaled(8, scale)))]
+
+
+def generate_day_12(rng: random.Random, scale: float) -> list[str]:
+    side = scaled_side(140, scale)
+    grid = [[''] * side for _ in range(side)]
+    for y, x in itertools.product(range(side), range(side)):
+        roll = rng.random()
+        if roll < 0.45 and x > 0:
+            grid[y][x] = grid[y][x - 1]
+        elif roll < 0.9 and y > 0:
+            grid[y][x] = grid[y - 1][x]
+        else:
+            grid[y][x] = rng.choice(string.ascii_uppercase)
+    return [''.join(row) for row in grid]
+
+
+def generate_claw_machine(rng: random.Random) -> list[str]:
+    while True:
+        xa, ya, xb, yb = (rng.randint(10, 99) for _ in range(4))
+        if xa * yb != ya * xb:
+            break
+    if rng.random() < 0.5:
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        prize = (a * xa + b * xb, a * ya + b * yb)
+    else:
+        prize = (rng.randint(1000, 20000), rng.randint(1000, 20000))
+    return [f'Button A: X+{xa}, Y+{ya}',
+            f'Button B: X+{xb}, Y+{yb}',
+            f'Prize: X={prize[0]}, Y={prize[1]}']
+
+
+def generate_day_13(rng: random.Random, scale: float) -> list[str]:
+    machines = [generate_claw_machine(rng) for _ in range(scaled(320, scale))]
+    return list(itertools.chain.from_iterable(m + [''] for m in machines))[:-1]
+
+
+def generate_day_14(rng: random.Random, scale: float) -> list[str]:
+    # day_14 uses a fixed map size, so only the number of robots is scaled; a symmetric
+    # tree is planted at a random time so that part 2 has an answer
+    width, height = 101, 103
+    tree_time = rng.randint(100, 1000)
+    tree = [(50 + dx, 30 + row) for row in range(16) for dx in range(-row, row + 1)]
+    near_tree = {(x + dx, y + dy) for x, y in tree for dx, dy in itertools.product((-1, 0, 1), repeat=2)}
+    noise = []
+    while len(noise) < scaled(30, scale):
+        point = (rng.randrange(width), rng.randrange(height))
+        if point not in near_tree:
+            noise.append(point)
+    robots = []
+    for x, y in tree + noise:
+        vx, vy = rng.randint(-100, 100), rng.randint(-100, 100)
+        robots.append(f'p={(x - tree_time * vx) % width},{(y - tree_time * vy) % height} v={vx},{vy}')
+    rng.shuffle(robots)
+    return robots
+
+
+def generate_day_15(rng: random.Random, scale: float) -> list[str]:
+    side = scaled_side(50, scale)
+    grid = [['#'] * side] + [['#'] + ['.'] * (side - 2) + ['#'] for _ in range(side - 2)] + [['#'] * side]
+    for y, x in itertools.product(range(1, side - 1), range(1, side - 1)):
+        roll = rng.random()
+        if roll < 0.05:
+            grid[y][x] = '#'
+        elif roll < 0.35:
+            grid[y][x] = 'O'
+    grid[side // 2][side // 2] = '@'
+    moves = ''.join(rng.choice('<>^v') for _ in range(scaled(20000, scale)))
+    return [''.join(row) for row in grid] + [''] + [moves[i:i + 1000] for i in range(0, len(moves), 1000)]
+
+
+def generate_day_16(rng: random.Random, scale: float) -> list[str]:
+    # binary tree maze: every cell opens either north or east, so the shortest path from
+    # the bottom left to the top right corner stays short; extra openings add loops
+    side = scaled_side(141, scale) | 1
+    grid = [['#'] * side for _ in range(side)]
+    for y, x in itertools.product(range(1, side - 1, 2), range(1, side - 1, 2)):
+        grid[y][x] = '.'
+        can_go_north = y > 1
+        can_go_east = x < side - 2
+        if can_go_north and (not can_go_east or rng.random() < 0.5):
+            grid[y - 1][x] = '.'
+        elif can_go_east:
+            grid[y][x + 1] = '.'
+    for _ in range(side * side // 100):
+        y, x = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (x + y) % 2 == 1:
+            grid[y][x] = '.'
+    grid[side - 2][1] = 'S'
+    grid[1][side - 2] = 'E'
+    return [''.join(row) for row in grid]
+
+
+def generate_day_17(rng: random.Random, scale: float) -> list[str]:
+    # register A is consumed three bits per output, so its length drives part 1 runtime
+    import day_17
+
+    reg_a = rng.getrandbits(3 * scaled(16, scale)) | 1
+    while True:
+        program = [2, 4, 1, rng.randint(1, 7), 7, 5, 1, rng.randint(1, 7), 4, 0, 0, 3, 5, 5, 3, 0]
+        try:
+            # part 2 requires the program to be able to output its own code
+            day_17.construct_reg_a_value_for_output(program)
+            break
+        except RuntimeError:
+            continue
+    return [f'Register A: {reg_a}',
+            'Register B: 0',
+            'Register C: 0',
+            '',
+            f'Program: {",".join(map(str, program))}']
+
+
+def generate_day_18(rng: random.Random, scale: float) -> list[str]:
+    # day_18 works on a fixed 71x71 grid, so the scale cannot change the input size
+    size = 71
+    cells = [(x, y) for x, y in itertools.product(range(size), range(size))
+             if (x, y) not in ((0, 0), (size - 1, size - 1))]
+    rng.shuffle(cells)
+    return [f'{x},{y}' for x, y in cells[:3450]]
+
+
+def generate_day_19(rng: random.Random, scale: float) -> list[str]:
+    colours = 'wubrg'
+    patterns = sorted({''.join(rng.choice(colours) for _ in range(rng.randint(1, 8)))
+                       for _ in range(450)} - {'g'})
+    designs = []
+    for _ in range(scaled(400, scale)):
+        if rng.random() < 0.6:
+            design = ''
+            while len(design) < 40:
+                design += rng.choice(patterns)
+        else:
+            design = ''.join(rng.choice(colours) for _ in range(rng.randint(40, 60)))
+        designs.append(design)
+    return [', '.join(patterns), ''] + designs
+
+
+def generate_day_20(rng: random.Random, scale: float) -> list[str]:
+    # serpentine single track: rows separated by one wall thickness allow for cheats
+    side = scaled_side(141, scale) | 1
+    grid = [['#'] * side for _ in range(side)]
+    rows = list(range(1, side - 1, 2))
+    for idx, y in enumerate(rows):
+        for x in range(1, side - 1):
+            grid[y][x] = '.'
+        if idx + 1 < len(rows):
+            grid[y + 1][side - 2 if idx % 2 == 0 else 1] = '.'
+    grid[rows[0]][1] = 'S'
+    grid[rows[-1]][1 if len(rows) % 2 == 0 else side - 2] = 'E'
+    return [''.join(row) for row in grid]
+
+
+def generate_day_21(rng: random.Random, scale: float) -> list[str]:
+    return [f'{rng.randint(1, 999):03}A' for _ in range(scaled(5, scale))]
+
+
+def generate_day_22(rng: random.Random, scale: float) -> list[str]:
+    return [str(rng.randint(1, 16777215)) for _ in range(scaled(2000, scale))]
+
+
+def make_names(rng: random.Random, count: int, length: int, forbidden: str = '') -> list[str]:
+    alphabet = [c for c in string.ascii_lowercase if c not in forbidden]
+    names = set()
+    while len(names) < count:
+        names.add(''.join(rng.choice(alphabet) for _ in range(length)))
+    return sorted(names)
+
+
+def generate_day_23(rng: random.Random, scale: float) -> list[str]:
+    count = scaled(520, scale)
+    names = make_names(rng, count, length=2 if count <= 26 * 26 // 2 else 3)
+    edges = set()
+    for node in names:
+        for other in rng.sample(names, 6):
+            if other != node:
+                edges.add(tuple(sorted((node, other))))
+    edges.update(itertools.combinations(sorted(rng.sample(names, 13)), r=2))
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return [f'{a}-{b}' for a, b in edges]
+
+
+def generate_day_24(rng: random.Random, scale: float) -> list[str]:
+    # ripple carry adder with four pairs of swapped outputs which day_24 is able to detect
+    bits = max(12, scaled(45, scale))
+    names = iter(make_names(rng, 4 * bits, length=3, forbidden='xyz'))
+    x = lambda i: f'x{str(i).zfill(2)}'
+    y = lambda i: f'y{str(i).zfill(2)}'
+    z = lambda i: f'z{str(i).zfill(2)}'
+
+    gates = [[x(0), 'XOR', y(0), z(0)]]
+    carry = next(names)
+    gates.append([x(0), 'AND', y(0), carry])
+    by_bit = {}
+    for i in range(1, bits):
+        half_sum, half_carry, partial_carry = next(names), next(names), next(names)
+        new_carry = next(names) if i < bits - 1 else z(bits)
+        bit_gates = {
+            'xor_in': [x(i), 'XOR', y(i), half_sum],
+            'and_in': [x(i), 'AND', y(i), half_carry],
+            'xor_out': [half_sum, 'XOR', carry, z(i)],
+            'and_out': [half_sum, 'AND', carry, partial_carry],
+            'or_out': [half_carry, 'OR', partial_carry, new_carry],
+        }
+        by_bit[i] = bit_gates
+        gates.extend(bit_gates.values())
+        carry = new_carry
+
+    swaps = [('xor_in', 'and_in'), ('xor_out', 'or_out'), ('xor_out', 'and_out'), ('xor_out', 'and_in')]
+    swapped_bits = rng.sample(range(2, bits - 1, 2), 4)
+    for bit, (first, second) in zip(swapped_bits, rng.sample(swaps, 4)):
+        g1, g2 = by_bit[bit][first], by_bit[bit][second]
+        g1[3], g2[3] = g2[3], g1[3]
+
+    rng.shuffle(gates)
+    inputs = [f'{x(i)}: {rng.randint(0, 1)}' for i in range(bits)]
+    inputs += [f'{y(i)}: {rng.randint(0, 1)}' for i in range(bits)]
+    return inputs + [''] + [f'{lhs} {op} {rhs} -> {out}' for lhs, op, rhs, out in gates]
+
+
+def generate_schematic(rng: random.Random, is_lock: bool) -> list[str]:
+    heights = [rng.randint(0, 5) for _ in range(5)]
+    rows = []
+    for row in range(1, 6):
+        level = row if is_lock else 6 - row
+        rows.append(''.join('#' if h >= level else '.' for h in heights))
+    full, empty = '#####', '.....'
+    return [full] + rows + [empty] if is_lock else [empty] + rows + [full]
+
+
+def generate_day_25(rng: random.Random, scale: float) -> list[str]:
+    items = [generate_schematic(rng, is_lock=rng.random() < 0.5) for _ in range(scaled(500, scale))]
+    return list(itertools.chain.from_iterable(item + [''] for item in items))[:-1]
+
+
+GENERATORS: dict[int, Generator] = {
+    day: globals()[f'generate_day_{day}'] for day in range(1, 26)
+}
+
+# inputs of unusual shape for stressing particular code paths, selected with --variant
+VARIANTS: dict[tuple[int, str], Generator] = {
+    (2, 'long'): generate_day_2_long_reports,
+}
+
+
+def generate_input(day: int, scale: float = 1.0, seed: int = DEFAULT_SEED, variant: str = None) -> list[str]:
+    generator = VARIANTS[day, variant] if variant else GENERATORS[day]
+    return generator(random.Random(seed), scale)
+
+
+def write_input(path: str, day: int, scale: float = 1.0, seed: int = DEFAULT_SEED, variant: str = None) -> None:
+    with open(path, 'w') as file:
+        file.write('\n'.join(generate_input(day, scale, seed, variant)))
+        file.write('\n')
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Generate synthetic puzzle inputs')
+    parser.add_argument('--day', '-d', type=int, required=True, choices=range(1, 26), metavar='DAY')
+    parser.add_argument('--scale', '-s', type=float, default=1.0,
+                        help='size of generated input relative to a real puzzle input')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--variant', choices=sorted({name for _, name in VARIANTS}),
+                        help='generate input of unusual shape instead of a puzzle-like one')
+    parser.add_argument('--output', '-o', help='output file, defaults to day_<DAY>.in')
+    args = parser.parse_args(argv)
+    if args.variant and (args.day, args.variant) not in VARIANTS:
+        parser.error(f'day {args.day} has no {args.variant} variant')
+    write_input(args.output or f'day_{args.day}.in', args.day, args.scale, args.seed, args.variant)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
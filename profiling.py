@@ -0,0 +1,111 @@
+import cProfile
+from collections import Counter
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from typing import Any, Callable, NamedTuple
+
+
+class MemoryReport(NamedTuple):
+    peak: int
+    top_sites: list[tuple[str, int, int]]
+
+
+def run_with_cprofile(func: Callable, arg: Any, stats_path: str,
+                      sort_key: str = 'cumulative', limit: int = 25) -> tuple[Any, str]:
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, arg)
+    os.makedirs(os.path.dirname(stats_path) or '.', exist_ok=True)
+    profiler.dump_stats(stats_path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort_key).print_stats(limit)
+    return result, out.getvalue()
+
+
+def run_with_tracemalloc(func: Callable, arg: Any, top: int = 10,
+                         interval: float = 0.01) -> tuple[Any, MemoryReport]:
+    # most of the memory is released by the time solver returns, so a background thread
+    # takes a snapshot whenever traced memory grows noticeably above the last snapshot
+    snapshots = []
+    done = threading.Event()
+
+    def watch_peak():
+        last_size = 0
+        while not done.wait(interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > 1.1 * last_size:
+                snapshots[:] = [tracemalloc.take_snapshot()]
+                last_size = current
+
+    tracemalloc.start()
+    watcher = threading.Thread(target=watch_peak, daemon=True)
+    watcher.start()
+    try:
+        result = func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+        if not snapshots:
+            snapshots.append(tracemalloc.take_snapshot())
+    finally:
+        done.set()
+        watcher.join()
+        tracemalloc.stop()
+
+    snapshot = snapshots[0].filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ])
+    sites = [(f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}', stat.size, stat.count)
+             for stat in snapshot.statistics('lineno')[:top]]
+    return result, MemoryReport(peak, sites)
+
+
+def format_frame_stack(frame, stop_code=None) -> str:
+    names = []
+    while frame is not None and frame.f_code is not stop_code:
+        code = frame.f_code
+        names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def run_with_stack_sampling(func: Callable, arg: Any, folded_path: str,
+                            interval: float = 0.001) -> tuple[Any, int]:
+    # a background thread samples the stack of the solving thread and writes them in
+    # the collapsed format ('frame;frame;frame count') understood by flamegraph tools
+    target_id = threading.get_ident()
+    samples = Counter()
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target_id)
+            if frame is not None:
+                samples[format_frame_stack(frame, stop_code=run_with_stack_sampling.__code__)] += 1
+
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(old_interval, interval))
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func(arg)
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(old_interval)
+
+    os.makedirs(os.path.dirname(folded_path) or '.', exist_ok=True)
+    with open(folded_path, 'w') as file:
+        for stack, count in samples.most_common():
+            file.write(f'{stack} {count}\n')
+    return result, sum(samples.values())
+
+
+def print_memory_report(day: int, part: int, report: MemoryReport) -> None:
+    print(f'Day {day} part {part}: peak traced memory {report.peak / 2 ** 20:.2f} MiB, '
+          f'allocation sites near peak:')
+    for site, size, count in report.top_sites:
+        print(f'  {size / 2 ** 10:>10.1f} KiB {count:>8} blocks  {site}')
@@ -0,0 +1,177 @@
+from importlib import import_module
+import json
+import os
+import time
+from typing import NamedTuple, Optional
+
+import cache
+
+# Days are discovered from day_<N>.py sources with ast, without importing the solvers.
+# Scanned entries are kept in a manifest under the cache directory and rescanned only
+# when size or modification time of the source changes, so ast is imported only then.
+# Entries also list repository modules each source imports, which key cached answers.
+
+MANIFEST_FILE = os.path.join(cache.CACHE_DIR, 'registry.json')
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# wall time of importing each day (or engine) module in this process by module name, in seconds
+import_times = {}
+
+
+class DayInfo(NamedTuple):
+    day: int
+    parts: tuple[int, ...]
+    input_format: str
+    has_parse: bool
+    # writes nothing to stdout, so it may run where stdout carries JSON lines
+    is_batch_safe: bool
+    # alternative implementations in day_<N>_<engine>.py, selected with runner --engine
+    engines: tuple[str, ...] = ()
+
+    def capabilities(self) -> list[str]:
+        flags = (('buffer', self.input_format == 'buffer'),
+                 ('parse', self.has_parse),
+                 ('batch', self.is_batch_safe))
+        return [name for name, enabled in flags if enabled]
+
+
+def scan_source(day: int, tree) -> DayInfo:
+    import ast
+    functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    input_format = 'lines'
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and
+                any(isinstance(t, ast.Name) and t.id == 'INPUT_FORMAT' for t in node.targets)):
+            input_format = node.value.value
+    prints = any(isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'print'
+                 for node in ast.walk(tree))
+    parts = tuple(part for part in (1, 2) if f'resolve_part{part}' in functions)
+    return DayInfo(day, parts, input_format, 'parse' in functions, not prints)
+
+
+def scan_dependencies(tree) -> list[str]:
+    # repository modules imported anywhere in the source, including imports in functions
+    import ast
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return sorted(name for name in names if os.path.isfile(module_file(name)))
+
+
+def find_day_sources() -> tuple[dict[int, str], dict[int, list[str]]]:
+    sources = {}
+    engines = {}
+    for name in sorted(os.listdir(ROOT_DIR)):
+        stem, ext = os.path.splitext(name)
+        day, _, engine = stem[4:].partition('_')
+        if ext != '.py' or not stem.startswith('day_') or not day.isdigit():
+            continue
+        if engine:
+            engines.setdefault(int(day), []).append(engine)
+        else:
+            sources[int(day)] = os.path.join(ROOT_DIR, name)
+    return sources, engines
+
+
+def module_name(day: int, engine: Optional[str] = None) -> str:
+    return f'day_{day}_{engine}' if engine else f'day_{day}'
+
+
+def module_file(name: str) -> str:
+    return os.path.join(ROOT_DIR, f'{name}.py')
+
+
+def base_day(name: str) -> Optional[int]:
+    # day of a day_<N> module, None for engines and helpers
+    day = name[len('day_'):]
+    return int(day) if name.startswith('day_') and day.isdigit() else None
+
+
+def load_manifest() -> dict[str, dict]:
+    try:
+        with open(MANIFEST_FILE) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict[str, dict], loaded: dict[str, dict]) -> None:
+    if manifest != loaded:
+        try:
+            cache.write_atomically(MANIFEST_FILE, json.dumps(manifest).encode())
+        except OSError:
+            pass
+
+
+def read_entry(manifest: dict[str, dict], name: str) -> dict:
+    # manifest entry of a module, rescanned when its source changed; entries of day_<N>
+    # modules also hold their DayInfo
+    stat = os.stat(module_file(name))
+    version = [stat.st_mtime_ns, stat.st_size]
+    entry = manifest.get(name)
+    if entry is not None and entry['version'] == version:
+        return entry
+    import ast
+    with open(module_file(name)) as file:
+        tree = ast.parse(file.read())
+    entry = {'version': version, 'dependencies': scan_dependencies(tree)}
+    day = base_day(name)
+    if day is not None:
+        entry['info'] = scan_source(day, tree)._asdict()
+    return entry
+
+
+def read_registry() -> dict[int, DayInfo]:
+    manifest = load_manifest()
+    # entries of engines and helpers are kept for source_files as long as their sources exist
+    updated = {name: entry for name, entry in manifest.items() if os.path.isfile(module_file(name))}
+    result = {}
+    sources, engines = find_day_sources()
+    for day in sorted(sources):
+        entry = updated[module_name(day)] = read_entry(manifest, module_name(day))
+        info = {**entry['info'], 'parts': tuple(entry['info']['parts'])}
+        info.pop('engines', None)
+        result[day] = DayInfo(**info, engines=tuple(engines.get(day, ())))
+    save_manifest(updated, manifest)
+    return result
+
+
+def source_modules(day: int, engine: Optional[str] = None) -> list[str]:
+    # the day (or engine) module and repository modules it imports, directly or through
+    # other ones, dependencies first, as recorded in the manifest, so nothing is imported
+    manifest = load_manifest()
+    updated = dict(manifest)
+    order = []
+    visited = set()
+
+    def visit(name: str) -> None:
+        visited.add(name)
+        updated[name] = read_entry(manifest, name)
+        for dependency in updated[name]['dependencies']:
+            if dependency not in visited:
+                visit(dependency)
+        order.append(name)
+
+    visit(module_name(day, engine))
+    save_manifest(updated, manifest)
+    return order
+
+
+def source_files(day: int, engine: Optional[str] = None) -> list[str]:
+    return sorted(map(module_file, source_modules(day, engine)))
+
+
+def load_day(day: int, engine: Optional[str] = None):
+    start = time.perf_counter()
+    try:
+        daily_module = import_module(module_name(day, engine))
+    except ModuleNotFoundError as e:
+        # engines may depend on optional packages, e.g. numpy
+        if engine is None or e.name == module_name(day, engine):
+            raise
+        raise ImportError(f"engine '{engine}' of day {day} requires '{e.name}', which is not installed") from e
+    import_times.setdefault(module_name(day, engine), time.perf_counter() - start)
+    return daily_module
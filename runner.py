@@ -1,29 +1,493 @@
 import argparse
-from importlib import import_module
+import functools
+import itertools
+import json
+import os
+from typing import Any, Callable, NamedTuple, Optional
 import sys
+import time
 
-parser = argparse.ArgumentParser(description='Advent of code 2023')
-parser.add_argument('--day', '-d', help='day in advent', type=int, required=True)
-parser.add_argument('--part', '-p', help='part of puzzle to solve', choices=['1', '2', 'both'], default='both')
-parser.add_argument('--input', '-i', help='input file')
+import cache
+import registry
 
+# process pools, profilers, budget enforcement and the like are imported by the modes
+# using them, so listing days and answering from cache only pay for what they need
 
-args = vars(parser.parse_args())
+ALL_DAYS = range(1, 26)
 
-day = args['day']
-input_file = args['input'] if args['input'] is not None else f'day_{day}.in'
 
-with open(input_file) as file:
-    lines = [line.rstrip() for line in file]
+class PartResult(NamedTuple):
+    day: int
+    part: int
+    answer: Any
+    wall_time: float
+    cpu_time: float
+    is_cached: bool = False
+    # set instead of answer when solving the part raised
+    error: Optional[str] = None
 
-try:
-    daily_module = import_module(f'day_{day}')
-except ImportError:
-    print('Specified day is invalid')
-    sys.exit(1)
 
-part_to_solve = args['part']
-if part_to_solve in ('1', 'both'):
-    print('Part 1 solution:', getattr(daily_module, 'resolve_part1')(lines))
-if part_to_solve in ('2', 'both'):
-    print('Part 2 solution:', getattr(daily_module, 'resolve_part2')(lines))
+def parse_days(text: str) -> list[int]:
+    if text == 'all':
+        return list(ALL_DAYS)
+    days = []
+    for token in text.split(','):
+        if '-' in token:
+            first, last = token.split('-')
+            days.extend(range(int(first), int(last) + 1))
+        else:
+            days.append(int(token))
+    return days
+
+
+def parse_parts(text: str) -> list[int]:
+    return [1, 2] if text == 'both' else [int(text)]
+
+
+def positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f'expected a positive number, got {value}')
+    return value
+
+
+def get_input_file(day: int, input_pattern: str = None) -> str:
+    return input_pattern.format(day=day) if input_pattern is not None else f'day_{day}.in'
+
+
+def read_input(input_file: str) -> list[str]:
+    with open(input_file) as file:
+        return [line.rstrip() for line in file]
+
+
+def load_day(day: int, engine: str = None):
+    return registry.load_day(day, engine)
+
+
+def accepts_buffer(daily_module) -> bool:
+    import input_buffer
+    return getattr(daily_module, 'INPUT_FORMAT', None) == input_buffer.BUFFER_FORMAT
+
+
+def read_module_input(daily_module, input_file: str) -> Any:
+    # modules declaring buffer input get memory mapped file instead of list of lines
+    if accepts_buffer(daily_module):
+        import input_buffer
+        return input_buffer.open_input_buffer(input_file)
+    return read_input(input_file)
+
+
+def load_model(daily_module, input_file: str, use_cache: bool = True) -> Any:
+    # modules defining parse hook get the parsed model shared between both parts,
+    # the rest gets raw input
+    if not hasattr(daily_module, 'parse'):
+        return read_module_input(daily_module, input_file)
+    if use_cache:
+        return cache.load_parsed_model(daily_module, input_file,
+                                       lambda path: read_module_input(daily_module, path))
+    return daily_module.parse(read_module_input(daily_module, input_file))
+
+
+def input_size(daily_module, module_input: Any) -> int:
+    # bytes the solver scans: the mapped file for buffer input, stripped lines otherwise
+    if accepts_buffer(daily_module):
+        return len(module_input.view)
+    return sum(len(line) for line in module_input)
+
+
+def get_module_solver(daily_module, part: int) -> Callable[[Any], Any]:
+    # solver taking input from read_module_input, parse hook included
+    resolve = getattr(daily_module, f'resolve_part{part}')
+    if hasattr(daily_module, 'parse'):
+        return lambda module_input: resolve(daily_module.parse(module_input))
+    return resolve
+
+
+def get_solver(daily_module, part: int) -> Callable[[list[str]], Any]:
+    # solver taking input lines regardless of parse hook or input format of the module
+    solver = get_module_solver(daily_module, part)
+    if accepts_buffer(daily_module):
+        import input_buffer
+        return lambda lines: solver(input_buffer.InputBuffer.from_lines(lines))
+    return solver
+
+
+def solve_part(day: int, part: int, input_file: str, use_cache: bool = True,
+               engine: str = None) -> PartResult:
+    daily_module = load_day(day, engine)
+    model = load_model(daily_module, input_file, use_cache)
+    solver = getattr(daily_module, f'resolve_part{part}')
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    answer = solver(model)
+    return PartResult(day, part, answer,
+                      wall_time=time.perf_counter() - wall_start,
+                      cpu_time=time.process_time() - cpu_start)
+
+
+def solve_part_with_parse(day: int, part: int, input_file: str, engine: str = None) -> PartResult:
+    # parse hook, if any, is timed along with the solver, the way benchmarks time parts;
+    # parsed models are not cached
+    daily_module = load_day(day, engine)
+    module_input = read_module_input(daily_module, input_file)
+    solver = get_module_solver(daily_module, part)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    answer = solver(module_input)
+    return PartResult(day, part, answer,
+                      wall_time=time.perf_counter() - wall_start,
+                      cpu_time=time.process_time() - cpu_start)
+
+
+def solve_in_parallel(jobs: list[tuple[int, int, str]],
+                      workers: int = None,
+                      use_cache: bool = True,
+                      engine: str = None) -> list[PartResult]:
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(solve_part, *job, use_cache, engine): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # a failing part does not discard results of the others
+                day, part, _ = futures[future]
+                results.append(PartResult(day, part, None, wall_time=0.0, cpu_time=0.0,
+                                          error=f'{type(e).__name__}: {e}'))
+    results.sort(key=lambda r: (r.day, r.part))
+    return results
+
+
+def print_results_table(results: list[PartResult], total_wall_time: float) -> None:
+    print(f'{"day":>3} {"part":>4} {"wall [s]":>10} {"cpu [s]":>10}  answer')
+    for r in results:
+        cached = ' (cached)' if r.is_cached else ''
+        answer = f'error: {r.error}' if r.error is not None else r.answer
+        print(f'{r.day:>3} {r.part:>4} {r.wall_time:>10.3f} {r.cpu_time:>10.3f}  {answer}{cached}')
+    print(f'total wall time: {total_wall_time:.3f} s, '
+          f'sum of parts: {sum(r.wall_time for r in results):.3f} s')
+
+
+def run_single_day(day: int, parts: list[int], input_file: str, answers: cache.AnswerCache,
+                   engine: str = None) -> None:
+    solutions = {}
+    if answers is not None:
+        solutions = {part: answers.get(day, part, input_file, engine) for part in parts}
+
+    # solver module is imported only when some answer is not cached
+    if any(solutions.get(part, cache.MISSING) is cache.MISSING for part in parts):
+        daily_module = load_day(day, engine)
+        model = load_model(daily_module, input_file, use_cache=answers is not None)
+        for part in parts:
+            if solutions.get(part, cache.MISSING) is cache.MISSING:
+                solutions[part] = getattr(daily_module, f'resolve_part{part}')(model)
+                if answers is not None:
+                    answers.put(day, part, input_file, solutions[part], engine)
+
+    for part in parts:
+        print(f'Part {part} solution:', solutions[part])
+
+
+def run_many_days(days: list[int],
+                  parts: list[int],
+                  input_pattern: str,
+                  workers: int,
+                  answers: cache.AnswerCache,
+                  engine: str = None) -> int:
+    start = time.perf_counter()
+    results = []
+    jobs = []
+    for day, part in itertools.product(days, parts):
+        input_file = get_input_file(day, input_pattern)
+        try:
+            answer = answers.get(day, part, input_file, engine) if answers is not None else cache.MISSING
+        except OSError:
+            # e.g. missing input, which the job then reports
+            answer = cache.MISSING
+        if answer is cache.MISSING:
+            jobs.append((day, part, input_file))
+        else:
+            results.append(PartResult(day, part, answer, wall_time=0.0, cpu_time=0.0, is_cached=True))
+
+    if jobs:
+        solved = solve_in_parallel(jobs, workers, use_cache=answers is not None, engine=engine)
+        if answers is not None:
+            input_files = {(day, part): input_file for day, part, input_file in jobs}
+            for r in solved:
+                if r.error is None:
+                    answers.put(r.day, r.part, input_files[(r.day, r.part)], r.answer, engine)
+        results.extend(solved)
+    results.sort(key=lambda r: (r.day, r.part))
+    print_results_table(results, time.perf_counter() - start)
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+def invalidate_caches(days: list[int]) -> None:
+    answers = cache.AnswerCache()
+    removed_answers = answers.invalidate(days)
+    answers.save()
+    removed_models = cache.remove_parsed_models(days)
+    print(f'Removed {removed_answers} cached answers and {removed_models} parsed models')
+
+
+def run_benchmark(days: list[int], parts: list[int], input_pattern: str, args: dict) -> int:
+    import benchmark
+    results = []
+    for day in days:
+        daily_module = load_day(day, args['engine'])
+        # input is read (or mapped) once outside of timed runs, buffer engines scan the mapping
+        module_input = read_module_input(daily_module, get_input_file(day, input_pattern))
+        for part in parts:
+            solver = get_module_solver(daily_module, part)
+            results.append(benchmark.benchmark_part(day, part, solver, module_input,
+                                                    args['warmup'], args['repeats'],
+                                                    input_size(daily_module, module_input)))
+    benchmark.print_stats_table(results)
+
+    if args['json'] is not None:
+        benchmark.save_results(args['json'], results)
+    if args['baseline'] is not None:
+        regressions = benchmark.find_regressions(results,
+                                                 benchmark.load_baseline(args['baseline']),
+                                                 args['max_regression'])
+        benchmark.print_regressions(regressions, args['max_regression'])
+        if regressions:
+            return 2
+    return 0
+
+
+def run_check(days: list[int], parts: list[int], input_pattern: str, args: dict) -> int:
+    # answer cache is bypassed on purpose, every part is solved from scratch, and ceilings
+    # cover parsing as well, so a slower parse hook trips them too
+    import check
+    known = check.load_known_answers(args['check'])
+    results = []
+    for day, part in itertools.product(days, parts):
+        input_file = get_input_file(day, input_pattern)
+        try:
+            # a missing input fails its own parts only
+            key = (day, part, cache.file_digest(input_file))
+            result = solve_part_with_parse(day, part, input_file, args['engine'])
+        except Exception as e:
+            results.append(check.CheckResult(day, part, check.STATUS_ERROR, None, None, 0.0, None,
+                                             f'{type(e).__name__}: {e}'))
+            continue
+        if args['record']:
+            known[key] = check.record_answer(*key, result.answer, result.wall_time, args['ceiling_factor'])
+        results.append(check.check_answer(known.get(key), day, part, result.answer, result.wall_time))
+    check.print_check_results(results)
+
+    if args['record']:
+        check.save_known_answers(args['check'], known)
+        print(f'Known answers saved to {args["check"]}')
+    return 4 if any(r.status in check.FAILURES for r in results) else 0
+
+
+def run_watch(days: list[int], parts: list[int], input_pattern: str, engine: str = None) -> int:
+    import watch
+    if len(days) != 1:
+        print('Watch mode supports a single day')
+        return 1
+    watch.SolverWatch(days[0], parts, get_input_file(days[0], input_pattern),
+                      functools.partial(load_day, engine=engine), load_model).run()
+    return 0
+
+
+def run_profiled(days: list[int], parts: list[int], input_pattern: str, args: dict) -> None:
+    import profiling
+    profile_parts = parse_parts(args['profile']) if args['profile'] else []
+    memory_parts = parse_parts(args['memory']) if args['memory'] else []
+    flame_parts = parse_parts(args['flame']) if args['flame'] else []
+    output_dir = args['profile_dir']
+
+    for day in days:
+        daily_module = load_day(day, args['engine'])
+        model = load_model(daily_module, get_input_file(day, input_pattern), not args['no_cache'])
+        for part in parts:
+            solver = getattr(daily_module, f'resolve_part{part}')
+            name = os.path.join(output_dir, f'day_{day}_part_{part}')
+            if part in profile_parts:
+                answer, report = profiling.run_with_cprofile(solver, model, f'{name}.prof')
+                print(f'Day {day} part {part}: {answer}, stats saved to {name}.prof')
+                print(report)
+            if part in memory_parts:
+                answer, report = profiling.run_with_tracemalloc(solver, model)
+                profiling.print_memory_report(day, part, report)
+            if part in flame_parts:
+                answer, samples = profiling.run_with_stack_sampling(solver, model, f'{name}.folded')
+                print(f'Day {day} part {part}: {samples} stack samples saved to {name}.folded')
+
+
+def run_with_budgets(days: list[int], parts: list[int], input_pattern: str, args: dict) -> int:
+    import budget
+    budgets = budget.load_budgets(args['budgets']) if args['budgets'] is not None else {}
+    fallback = budget.Budget(args['time_limit'], args['memory_limit'])
+    solve_engine_part = functools.partial(solve_part, engine=args['engine'])
+    results = []
+    for day, part in itertools.product(days, parts):
+        part_budget = budget.get_budget(budgets, day, part, fallback)
+        results.append(budget.solve_with_budget(solve_engine_part, day, part,
+                                                get_input_file(day, input_pattern), part_budget,
+                                                use_cache=not args['no_cache']))
+    budget.print_budget_results(results)
+    return 0 if all(r.status == budget.STATUS_OK for r in results) else 3
+
+
+def run_with_stats(days: list[int], parts: list[int], input_pattern: str, args: dict) -> None:
+    import stats
+    stats.enable()
+    reports = []
+    for day in days:
+        daily_module = load_day(day, args['engine'])
+        model = load_model(daily_module, get_input_file(day, input_pattern), not args['no_cache'])
+        for part in parts:
+            stats.reset()
+            answer = getattr(daily_module, f'resolve_part{part}')(model)
+            reports.append({'day': day, 'part': part, 'answer': answer, **stats.snapshot()})
+
+    if args['stats'] == 'json':
+        print(json.dumps(reports, indent=2))
+        return
+    for report in reports:
+        print(f'Day {report["day"]} part {report["part"]}: {report["answer"]}')
+        for name, value in sorted(report['counters'].items()):
+            print(f'  {name:<30} {value:>15}')
+        for name, value in sorted(report['timers'].items()):
+            print(f'  {name:<30} {value:>14.4f}s')
+
+
+def print_registry(infos: list[registry.DayInfo]) -> None:
+    print(f'{"day":>3} {"parts":>5}  {"capabilities":<20}  engines')
+    for info in infos:
+        parts = ','.join(map(str, info.parts))
+        capabilities = ' '.join(info.capabilities()) or '-'
+        print(f'{info.day:>3} {parts:>5}  {capabilities:<20}  {" ".join(info.engines) or "-"}')
+
+
+def print_import_times(days: list[int], engine: str = None) -> None:
+    # like -X importtime, shared dependencies are charged to the first day importing them
+    print(f'{"day":>3} {"import [ms]":>12}  newly imported modules')
+    for day in days:
+        name = registry.module_name(day, engine)
+        before = set(sys.modules)
+        load_day(day, engine)
+        pulled_in = sorted(set(sys.modules) - before - {name})
+        import_time = registry.import_times[name] * 1000
+        print(f'{day:>3} {import_time:>12.2f}  {" ".join(pulled_in) or "-"}')
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Advent of code 2024')
+    parser.add_argument('--day', '-d',
+                        help="day in advent: a number, a range like '1-10', a list like '1,5,7' or 'all'")
+    parser.add_argument('--list', action='store_true',
+                        help='list available days with their parts and capabilities, without importing them')
+    parser.add_argument('--import-times', action='store_true',
+                        help='import selected day modules (or their --engine) and report time spent '
+                             'and modules pulled in')
+    parser.add_argument('--part', '-p', help='part of puzzle to solve', choices=['1', '2', 'both'], default='both')
+    parser.add_argument('--input', '-i',
+                        help="input file; with multiple days may contain '{day}' placeholder")
+    parser.add_argument('--engine', '-e',
+                        help='alternative implementation of selected days, see --list for available ones')
+    parser.add_argument('--workers', '-w', type=int, help='size of process pool when solving multiple days')
+    parser.add_argument('--no-cache', action='store_true', help='do not use nor populate on-disk caches')
+    parser.add_argument('--invalidate-cache', action='store_true',
+                        help='remove cached answers and parsed models of selected days and exit')
+    parser.add_argument('--cache-size', type=int, default=cache.DEFAULT_MAX_ANSWERS,
+                        help='maximum number of cached answers, least recently used are evicted')
+    parser.add_argument('--time-limit', type=float, help='wall clock budget of each part in seconds')
+    parser.add_argument('--memory-limit', type=int, help='resident memory budget of each part in MiB')
+    parser.add_argument('--budgets',
+                        help="JSON file with per day ('14') or per part ('14.2') time and memory_mb budgets")
+    parser.add_argument('--stats', nargs='?', const='text', choices=['text', 'json'],
+                        help='collect hot path counters and timers of day modules for each part')
+    parser.add_argument('--watch', action='store_true',
+                        help='re-solve parts affected by changes of the input file or the day module')
+    parser.add_argument('--check', metavar='FILE',
+                        help='solve selected parts and fail when an answer differs from the known answers '
+                             'file or a part exceeds its latency ceiling')
+    parser.add_argument('--record', action='store_true',
+                        help='with --check, store current answers and latency ceilings instead of checking')
+    parser.add_argument('--ceiling-factor', type=float, default=3.0,
+                        help='latency ceiling recorded with --record as a multiple of the measured time')
+    parser.add_argument('--profile', nargs='?', const='both', choices=['1', '2', 'both'],
+                        help='run selected parts under cProfile and print sorted stats')
+    parser.add_argument('--memory', nargs='?', const='both', choices=['1', '2', 'both'],
+                        help='report tracemalloc peak memory and top allocation sites of selected parts')
+    parser.add_argument('--flame', nargs='?', const='both', choices=['1', '2', 'both'],
+                        help='sample stacks of selected parts into collapsed stacks for flamegraph tools')
+    parser.add_argument('--profile-dir', default='profiles', help='directory for profiling output files')
+    parser.add_argument('--benchmark', '-b', action='store_true',
+                        help='time solvers with warmup and repeated runs instead of printing answers')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs before benchmarking a part')
+    parser.add_argument('--repeats', '-r', type=positive_int, default=5, help='timed runs per part')
+    parser.add_argument('--json', help='file to write benchmark results to')
+    parser.add_argument('--baseline', help='benchmark results file to compare against')
+    parser.add_argument('--max-regression', type=float, default=10.0,
+                        help='allowed slowdown of median time against baseline, in percent')
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    parser = create_parser()
+    args = vars(parser.parse_args(argv))
+    if args['day'] is None and not args['list']:
+        parser.error('the following arguments are required: --day/-d')
+    available = registry.read_registry()
+    try:
+        days = parse_days(args['day']) if args['day'] is not None else list(available)
+    except ValueError:
+        print('Specified day is invalid')
+        return 1
+    # checked against the registry before any input is read or solver imported
+    if any(day not in ALL_DAYS or day not in available for day in days):
+        print('Specified day is invalid')
+        return 1
+
+    if args['list']:
+        print_registry([available[day] for day in days])
+        return 0
+    if args['engine'] is not None:
+        missing = [day for day in days if args['engine'] not in available[day].engines]
+        if missing:
+            print(f"Engine '{args['engine']}' is not available for day {', '.join(map(str, missing))}")
+            return 1
+    if args['import_times']:
+        print_import_times(days, args['engine'])
+        return 0
+
+    if args['invalidate_cache']:
+        invalidate_caches(days)
+        return 0
+
+    parts = parse_parts(args['part'])
+    if args['watch']:
+        return run_watch(days, parts, args['input'], args['engine'])
+    if args['check'] is not None:
+        return run_check(days, parts, args['input'], args)
+    if args['benchmark']:
+        return run_benchmark(days, parts, args['input'], args)
+    if args['time_limit'] is not None or args['memory_limit'] is not None or args['budgets'] is not None:
+        return run_with_budgets(days, parts, args['input'], args)
+    if args['stats']:
+        run_with_stats(days, parts, args['input'], args)
+        return 0
+    if args['profile'] or args['memory'] or args['flame']:
+        run_profiled(days, parts, args['input'], args)
+        return 0
+
+    answers = None if args['no_cache'] else cache.AnswerCache(max_entries=args['cache_size'])
+    status = 0
+    if len(days) == 1 and args['workers'] is None:
+        run_single_day(days[0], parts, get_input_file(days[0], args['input']), answers, args['engine'])
+    else:
+        status = run_many_days(days, parts, args['input'], args['workers'], answers, args['engine'])
+    if answers is not None:
+        answers.save()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import argparse
+import math
+import sys
+from typing import NamedTuple, Optional
+
+import benchmark
+import input_generators
+from runner import get_solver, load_day, parse_days, parse_parts
+
+# growth of solve time with input size, as expected from the algorithms used in day modules;
+# None marks parts whose cost does not depend on the input size (fixed grids, puzzle-specific
+# search driven by the answer rather than the input length)
+EXPECTED_EXPONENTS: dict[tuple[int, int], Optional[float]] = {
+    (1, 1): 1.0, (1, 2): 1.0,
+    (2, 1): 1.0, (2, 2): 1.0,
+    (3, 1): 1.0, (3, 2): 1.0,
+    (4, 1): 1.0, (4, 2): 1.0,
+    (5, 1): 1.0, (5, 2): 1.0,
+    (6, 1): 0.5, (6, 2): 1.5,
+    (7, 1): 1.0, (7, 2): 1.0,
+    (8, 1): 2.0, (8, 2): 2.0,
+    (9, 1): 1.0, (9, 2): 2.0,
+    (10, 1): 1.0, (10, 2): 1.0,
+    (11, 1): 1.0, (11, 2): 1.0,
+    (12, 1): 1.0, (12, 2): 1.0,
+    (13, 1): 1.0, (13, 2): 1.0,
+    (14, 1): 1.0, (14, 2): None,
+    (15, 1): 1.5, (15, 2): 1.5,
+    (16, 1): 1.0, (16, 2): 1.0,
+    (17, 1): 1.0, (17, 2): None,
+    (18, 1): None, (18, 2): None,
+    (19, 1): 1.0, (19, 2): 1.0,
+    (20, 1): 1.0, (20, 2): 2.0,
+    (21, 1): 1.0, (21, 2): 1.0,
+    (22, 1): 1.0, (22, 2): 1.0,
+    (23, 1): 1.0, (23, 2): 1.0,
+    (24, 1): 2.0, (24, 2): 1.0,
+    (25, 1): 2.0, (25, 2): None,
+}
+
+
+class ScalingResult(NamedTuple):
+    day: int
+    part: int
+    scales: list[float]
+    timings: list[float]
+    exponent: float
+    expected: float
+    is_flagged: bool
+
+
+def fit_exponent(scales: list[float], timings: list[float]) -> float:
+    # least squares slope of log(time) against log(scale)
+    xs = [math.log(s) for s in scales]
+    ys = [math.log(max(t, 1e-9)) for t in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return covariance / variance
+
+
+def measure_scaling(day: int,
+                    part: int,
+                    scales: list[float],
+                    repeats: int,
+                    seed: int,
+                    tolerance: float) -> ScalingResult:
+    solver = get_solver(load_day(day), part)
+    timings = []
+    for scale in scales:
+        lines = input_generators.generate_input(day, scale, seed)
+        timings.append(min(benchmark.time_solver(solver, lines, warmup=0, repeats=repeats)))
+    exponent = fit_exponent(scales, timings)
+    expected = EXPECTED_EXPONENTS[(day, part)]
+    return ScalingResult(day, part, scales, timings, exponent, expected,
+                         is_flagged=exponent > expected + tolerance)
+
+
+def print_report(results: list[ScalingResult]) -> None:
+    scales = results[0].scales if results else []
+    header = ' '.join(f'{f"x{s:g} [s]":>10}' for s in scales)
+    print(f'{"day":>3} {"part":>4} {header} {"exponent":>8} {"expected":>8}')
+    for r in results:
+        timings = ' '.join(f'{t:>10.4f}' for t in r.timings)
+        flag = '  SCALES WORSE THAN EXPECTED' if r.is_flagged else ''
+        print(f'{r.day:>3} {r.part:>4} {timings} {r.exponent:>8.2f} {r.expected:>8.2f}{flag}')
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure empirical complexity on synthetic inputs')
+    parser.add_argument('--day', '-d', default='all', help="day number, range like '1-10' or 'all'")
+    parser.add_argument('--part', '-p', choices=['1', '2', 'both'], default='both')
+    parser.add_argument('--scales', '-s', default='0.25,0.5,1,2',
+                        help='comma separated input sizes relative to a real puzzle input')
+    parser.add_argument('--repeats', '-r', type=int, default=3, help='timed runs per size, minimum is taken')
+    parser.add_argument('--seed', type=int, default=input_generators.DEFAULT_SEED)
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='allowed excess of fitted exponent over expected one')
+    args = parser.parse_args(argv)
+
+    scales = [float(s) for s in args.scales.split(',')]
+    results = []
+    for day in parse_days(args.day):
+        for part in parse_parts(args.part):
+            if EXPECTED_EXPONENTS[(day, part)] is None:
+                print(f'day {day} part {part}: cost does not depend on input size, skipped')
+                continue
+            results.append(measure_scaling(day, part, scales, args.repeats, args.seed, args.tolerance))
+    print_report(results)
+    return 2 if any(r.is_flagged for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+from typing import Callable, Collection, Iterable, NamedTuple, Optional
+
+from grid import Grid
+import stats
+
+# Searches run over integer node ids in range(node_count), e.g. grid cell indices or
+# cell index * 4 + direction, so distances and parents live in flat arrays instead of
+# tuple keyed dicts. Neighbours are supplied by the caller as a function of a node.
+
+UNREACHED = -1
+NO_PARENT = -1
+
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+Heuristic = Callable[[int], int]
+
+
+class SearchResult(NamedTuple):
+    distances: array
+    parents: array
+    # all predecessors on shortest paths, only collected with all_parents=True
+    predecessors: Optional[dict[int, list[int]]] = None
+
+
+class HeapQueue:
+    def __init__(self):
+        self._heap = []
+
+    def push(self, priority: int, node: int) -> None:
+        heappush(self._heap, (priority, node))
+
+    def pop(self) -> tuple[int, int]:
+        return heappop(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+# Dial's bucket queue for small integer edge weights: popped priorities never decrease and
+# pending ones lie within [current, current + max_weight], so max_weight + 1 buckets used
+# as a ring hold all of them and popping only scans forward
+class BucketQueue:
+    def __init__(self, max_weight: int):
+        self._buckets = [[] for _ in range(max_weight + 1)]
+        self._current = 0
+        self._size = 0
+
+    def push(self, priority: int, node: int) -> None:
+        self._buckets[priority % len(self._buckets)].append(node)
+        self._size += 1
+
+    def pop(self) -> tuple[int, int]:
+        if not self._size:
+            raise IndexError('pop from empty bucket queue')
+        ring_size = len(self._buckets)
+        while not self._buckets[self._current % ring_size]:
+            self._current += 1
+        self._size -= 1
+        return self._current, self._buckets[self._current % ring_size].pop()
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def create_storage(node_count: int, all_parents: bool) -> SearchResult:
+    return SearchResult(distances=array('q', [UNREACHED]) * node_count,
+                        parents=array('q', [NO_PARENT]) * node_count,
+                        predecessors={} if all_parents else None)
+
+
+def bfs(node_count: int,
+        sources: Iterable[int],
+        neighbours: Neighbours,
+        targets: Collection[int] = (),
+        all_parents: bool = False) -> SearchResult:
+    # with targets the search stops once every node as close as the nearest target is settled
+    result = create_storage(node_count, all_parents)
+    distances, parents, predecessors = result
+    queue = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+    limit = None
+    while queue:
+        node = queue.popleft()
+        stats.count('nodes_popped')
+        distance = distances[node]
+        if limit is not None and distance > limit:
+            break
+        if limit is None and node in targets:
+            limit = distance
+
+        for neighbour in neighbours(node):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = distance + 1
+                parents[neighbour] = node
+                if predecessors is not None:
+                    predecessors[neighbour] = [node]
+                queue.append(neighbour)
+            elif predecessors is not None and distances[neighbour] == distance + 1:
+                predecessors[neighbour].append(node)
+    return result
+
+
+def dijkstra(node_count: int,
+             sources: Iterable[int],
+             neighbours: WeightedNeighbours,
+             targets: Collection[int] = (),
+             all_parents: bool = False,
+             max_weight: Optional[int] = None) -> SearchResult:
+    # max_weight switches from binary heap to bucket queue, weights must not exceed it
+    result = create_storage(node_count, all_parents)
+    distances, parents, predecessors = result
+    queue = BucketQueue(max_weight) if max_weight is not None else HeapQueue()
+    for source in sources:
+        distances[source] = 0
+        queue.push(0, source)
+    limit = None
+    while queue:
+        distance, node = queue.pop()
+        stats.count('nodes_popped')
+        if distance > distances[node]:
+            continue
+        if limit is not None and distance > limit:
+            break
+        if limit is None and node in targets:
+            limit = distance
+
+        for neighbour, weight in neighbours(node):
+            new_distance = distance + weight
+            current = distances[neighbour]
+            if current == UNREACHED or new_distance < current:
+                distances[neighbour] = new_distance
+                parents[neighbour] = node
+                if predecessors is not None:
+                    predecessors[neighbour] = [node]
+                queue.push(new_distance, neighbour)
+            elif predecessors is not None and new_distance == current:
+                predecessors[neighbour].append(node)
+    return result
+
+
+def astar(node_count: int,
+          sources: Iterable[int],
+          neighbours: WeightedNeighbours,
+          targets: Collection[int],
+          heuristic: Heuristic) -> SearchResult:
+    # heuristic has to be consistent; distances are final only for nodes settled
+    # before the first target was reached, which includes that target
+    result = create_storage(node_count, all_parents=False)
+    distances, parents, _ = result
+    settled = bytearray(node_count)
+    queue = []
+    for source in sources:
+        distances[source] = 0
+        heappush(queue, (heuristic(source), source))
+    while queue:
+        _, node = heappop(queue)
+        stats.count('nodes_popped')
+        if settled[node]:
+            continue
+        settled[node] = True
+        if node in targets:
+            break
+
+        distance = distances[node]
+        for neighbour, weight in neighbours(node):
+            new_distance = distance + weight
+            current = distances[neighbour]
+            if current == UNREACHED or new_distance < current:
+                distances[neighbour] = new_distance
+                parents[neighbour] = node
+                heappush(queue, (new_distance + heuristic(neighbour), neighbour))
+    return result
+
+
+def reconstruct_path(parents: array, target: int) -> list[int]:
+    path = [target]
+    while parents[path[-1]] != NO_PARENT:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def collect_dag_nodes(predecessors: dict[int, list[int]], ends: Iterable[int]) -> set[int]:
+    # nodes lying on any shortest path to one of the ends
+    result = set(ends)
+    pending = list(result)
+    while pending:
+        for predecessor in predecessors.get(pending.pop(), ()):
+            if predecessor not in result:
+                result.add(predecessor)
+                pending.append(predecessor)
+    return result
+
+
+def grid_neighbours(grid: Grid, blocked: bytes) -> Neighbours:
+    cells = grid.cells
+    offsets = grid.neighbour_offsets
+    blocked = frozenset(blocked)
+    def neighbours(node: int) -> list[int]:
+        return [node + offset for offset in offsets if cells[node + offset] not in blocked]
+    return neighbours
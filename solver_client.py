@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+# kept free of solver related imports, so querying the daemon costs only interpreter startup
+DEFAULT_SOCKET = os.path.join('.cache', 'solver.sock')
+
+
+class SolverClient:
+    def __init__(self, socket_path: str = DEFAULT_SOCKET):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(socket_path)
+        self._file = self._socket.makefile('rwb')
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._file.write(json.dumps(payload).encode() + b'\n')
+        self._file.flush()
+        return json.loads(self._file.readline())
+
+    def solve(self, day: int, part: int, input_file: str) -> dict[str, Any]:
+        return self.request({'command': 'solve', 'day': day, 'part': part,
+                             'input': os.path.abspath(input_file)})
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Client of warm solver daemon')
+    parser.add_argument('command', choices=['solve', 'ping', 'stop'], nargs='?', default='solve')
+    parser.add_argument('--socket', '-s', default=DEFAULT_SOCKET, help='path of unix domain socket')
+    parser.add_argument('--day', '-d', type=int, help='day in advent')
+    parser.add_argument('--part', '-p', choices=['1', '2', 'both'], default='both')
+    parser.add_argument('--input', '-i', help='input file, defaults to day_<DAY>.in')
+    args = parser.parse_args(argv)
+
+    with SolverClient(args.socket) as client:
+        if args.command == 'ping':
+            print(client.request({'command': 'ping'}))
+            return 0
+        if args.command == 'stop':
+            print(client.request({'command': 'shutdown'}))
+            return 0
+
+        if args.day is None:
+            parser.error('--day is required for solve')
+        input_file = args.input if args.input is not None else f'day_{args.day}.in'
+        parts = [1, 2] if args.part == 'both' else [int(args.part)]
+        for part in parts:
+            response = client.solve(args.day, part, input_file)
+            if 'error' in response:
+                print(f'Part {part} failed:', response['error'])
+                return 1
+            print(f'Part {part} solution:', response['answer'],
+                  f'({response["solve_time"] * 1000:.1f} ms solve, '
+                  f'{response["total_time"] * 1000:.1f} ms in daemon)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+import time
+from typing import ContextManager
+
+# Day modules call stats.count(...) and stats.timer(...) on their hot paths. Until enable()
+# is called both are bound to no-op functions, so instrumentation costs one call at most;
+# modules must therefore look them up through the module (stats.count), not import them.
+
+_counters = Counter()
+_timers = Counter()
+_NULL_CONTEXT = nullcontext()
+
+
+def _count_noop(name: str, n: int = 1) -> None:
+    pass
+
+
+def _timer_noop(name: str) -> ContextManager:
+    return _NULL_CONTEXT
+
+
+def _count(name: str, n: int = 1) -> None:
+    _counters[name] += n
+
+
+@contextmanager
+def _timer(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timers[name] += time.perf_counter() - start
+
+
+count = _count_noop
+timer = _timer_noop
+
+
+def enable() -> None:
+    global count, timer
+    count, timer = _count, _timer
+
+
+def disable() -> None:
+    global count, timer
+    count, timer = _count_noop, _timer_noop
+
+
+def reset() -> None:
+    _counters.clear()
+    _timers.clear()
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    return {'counters': dict(_counters), 'timers': dict(_timers)}
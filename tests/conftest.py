@@ -0,0 +1,30 @@
+import pytest
+
+import runner
+
+
+@pytest.fixture(autouse=True)
+def working_dir(tmp_path, monkeypatch):
+    # answer cache, parsed models and registry manifest live under the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def write_file(tmp_path):
+    def write(name: str, content: str) -> str:
+        path = tmp_path / name
+        path.write_text(content)
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def solve(write_file):
+    # answer of a part on given lines, with input read from a file the way runner reads it,
+    # so buffer engines get a memory mapped file
+    def solve_part(daily_module, part: int, lines: list[str]):
+        input_file = write_file('input.txt', ''.join(line + '\n' for line in lines))
+        module_input = runner.read_module_input(daily_module, input_file)
+        return runner.get_module_solver(daily_module, part)(module_input)
+    return solve_part
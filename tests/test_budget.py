@@ -0,0 +1,38 @@
+import signal
+
+import budget
+from runner import PartResult
+
+MEMORY_HOG_MB = 64
+
+
+def solve_quickly(day: int, part: int, input_file: str, use_cache: bool) -> PartResult:
+    return PartResult(day, part, 42, wall_time=0.0, cpu_time=0.0)
+
+
+def solve_with_memory_hog(day: int, part: int, input_file: str, use_cache: bool) -> PartResult:
+    hog = bytearray(MEMORY_HOG_MB * 2 ** 20)
+    return PartResult(day, part, len(hog), wall_time=0.0, cpu_time=0.0)
+
+
+def test_answer_within_budget_is_ok():
+    result = budget.solve_with_budget(solve_quickly, 1, 1, 'unused', budget.Budget(60, 4 * MEMORY_HOG_MB))
+    assert (result.status, result.answer) == (budget.STATUS_OK, 42)
+
+
+def test_tiny_time_budget_times_out_even_when_answer_arrives():
+    result = budget.solve_with_budget(solve_quickly, 1, 1, 'unused', budget.Budget(wall_time=1e-6))
+    assert result.status == budget.STATUS_TIMEOUT
+
+
+def test_tiny_memory_budget_runs_out_of_memory():
+    result = budget.solve_with_budget(solve_with_memory_hog, 1, 1, 'unused', budget.Budget(memory_mb=1))
+    assert result.status == budget.STATUS_OOM
+
+
+def test_signals_are_classified():
+    limits = budget.Budget(wall_time=1, memory_mb=100)
+    assert budget.classify_signal(signal.SIGXCPU, limits, 0)[0] == budget.STATUS_TIMEOUT
+    assert budget.classify_signal(signal.SIGKILL, limits, 95)[0] == budget.STATUS_OOM
+    assert budget.classify_signal(signal.SIGKILL, limits, 10) == (budget.STATUS_ERROR, 'killed by SIGKILL')
+    assert budget.classify_signal(signal.SIGSEGV, limits, 95) == (budget.STATUS_ERROR, 'killed by SIGSEGV')
@@ -0,0 +1,89 @@
+import os
+
+import cache
+import registry
+
+
+def test_answers_survive_reload(write_file):
+    input_file = write_file('day_1.in', '3   4\n')
+    answers = cache.AnswerCache()
+    answers.put(1, 1, input_file, 42)
+    answers.save()
+
+    reloaded = cache.AnswerCache()
+    assert reloaded.get(1, 1, input_file) == 42
+    assert reloaded.get(1, 2, input_file) is cache.MISSING
+
+
+def test_answers_are_keyed_by_input_and_engine(write_file):
+    input_file = write_file('day_1.in', '3   4\n')
+    answers = cache.AnswerCache()
+    answers.put(1, 1, input_file, 42)
+
+    assert answers.get(1, 1, input_file, engine='numpy') is cache.MISSING
+    write_file('day_1.in', '3   5\n')
+    assert cache.AnswerCache().get(1, 1, input_file) is cache.MISSING
+
+
+def test_least_recently_used_answer_is_evicted(write_file):
+    input_file = write_file('day_1.in', '3   4\n')
+    answers = cache.AnswerCache(max_entries=2)
+    answers.put(1, 1, input_file, 'first')
+    answers.put(1, 2, input_file, 'second')
+    answers.get(1, 1, input_file)
+    answers.put(2, 1, input_file, 'third')
+
+    assert answers.get(1, 1, input_file) == 'first'
+    assert answers.get(1, 2, input_file) is cache.MISSING
+    assert answers.get(2, 1, input_file) == 'third'
+
+
+def test_hits_do_not_rewrite_answers(write_file):
+    input_file = write_file('day_1.in', '3   4\n')
+    answers = cache.AnswerCache()
+    answers.put(1, 1, input_file, 42)
+    answers.save()
+
+    answers = cache.AnswerCache()
+    os.unlink(cache.ANSWERS_FILE)
+    assert answers.get(1, 1, input_file) == 42
+    answers.save()
+    assert not os.path.exists(cache.ANSWERS_FILE)
+
+
+def test_invalidate_removes_answers_of_given_days(write_file):
+    input_file = write_file('day_1.in', '3   4\n')
+    answers = cache.AnswerCache()
+    answers.put(1, 1, input_file, 42)
+    answers.put(2, 1, input_file, 7)
+
+    assert answers.invalidate([1]) == 1
+    assert answers.get(1, 1, input_file) is cache.MISSING
+    assert answers.get(2, 1, input_file) == 7
+
+
+def test_answers_go_stale_when_local_dependency_changes(write_file, tmp_path, monkeypatch):
+    sources = tmp_path / 'sources'
+    sources.mkdir()
+    (sources / 'day_1.py').write_text('import helper\n')
+    (sources / 'helper.py').write_text('from base import STEP\n')
+    (sources / 'base.py').write_text('STEP = 1\n')
+    monkeypatch.setattr(registry, 'ROOT_DIR', str(sources))
+    input_file = write_file('day_1.in', '3   4\n')
+    answers = cache.AnswerCache()
+    answers.put(1, 1, input_file, 42)
+    answers.save()
+    assert cache.AnswerCache().get(1, 1, input_file) == 42
+
+    (sources / 'base.py').write_text('STEP = 10\n')
+    assert cache.AnswerCache().get(1, 1, input_file) is cache.MISSING
+
+
+def test_remove_parsed_models_of_day_and_its_engines(working_dir):
+    names = ['day_1-a.pickle', 'day_1_numpy-b.pickle', 'day_10-c.pickle', 'day_10_numpy-d.pickle']
+    os.makedirs(cache.PARSED_MODELS_DIR)
+    for name in names:
+        open(os.path.join(cache.PARSED_MODELS_DIR, name), 'wb').close()
+
+    assert cache.remove_parsed_models([1]) == 2
+    assert sorted(os.listdir(cache.PARSED_MODELS_DIR)) == names[2:]
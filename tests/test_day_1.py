@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+import day_1
+import day_1_external
+from input_buffer import InputBuffer
+import input_generators
+
+PARTS = [1, 2]
+
+
+@pytest.fixture(scope='module')
+def lines():
+    return input_generators.generate_input(1, scale=0.5)
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_numpy_engine_matches_reference(solve, lines, part):
+    pytest.importorskip('numpy')
+    import day_1_numpy
+    assert solve(day_1_numpy, part, lines) == solve(day_1, part, lines)
+    assert solve(day_1_numpy, part, []) == solve(day_1, part, [])
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_external_engine_matches_reference(solve, lines, part):
+    assert solve(day_1_external, part, lines) == solve(day_1, part, lines)
+    assert solve(day_1_external, part, []) == solve(day_1, part, [])
+
+
+def test_external_sort_merges_runs_in_passes(tmp_path):
+    # smallest budget: runs of MIN_READ_VALUES rows merged two at a time
+    lines = input_generators.generate_input(1, scale=15)
+    buffer = InputBuffer.from_lines(lines)
+    left, right = day_1_external.sort_columns(buffer, str(tmp_path), memory_budget=0)
+    expected_left, expected_right = map(sorted, day_1.parse_input_lists(lines))
+    assert list(left) == expected_left
+    assert list(right) == expected_right
+
+
+def test_similarity_index_follows_changes_of_lists(lines):
+    left, right = day_1.parse_input_lists(lines)
+    index = day_1.SimilarityIndex(left, right)
+    rng = random.Random(1)
+    for _ in range(200):
+        side = rng.choice([left, right])
+        if side and rng.random() < 0.5:
+            value = side.pop(rng.randrange(len(side)))
+            (index.remove_left if side is left else index.remove_right)(value)
+        else:
+            value = rng.choice(left + right)
+            side.append(value)
+            (index.add_left if side is left else index.add_right)(value)
+        assert index.similarity_score == day_1.calculate_similarity_score(left, right)
+        if len(left) == len(right):
+            assert index.total_distance() == day_1.calculate_total_distance(left, right)
+
+
+def test_similarity_index_rejects_removing_missing_value():
+    index = day_1.SimilarityIndex([1, 2], [2])
+    with pytest.raises(ValueError):
+        index.remove_right(1)
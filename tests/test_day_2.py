@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+import day_2
+import day_2_stream
+from input_buffer import InputBuffer
+import input_generators
+
+PARTS = [1, 2]
+# single levels, blank lines, flat and short reports
+EDGE_CASES = ['1', '', '5 4', '1 1', '1 2 7 8', '9 7 6 2 1', '3 1 2 3 4', '', '']
+
+
+@pytest.fixture(scope='module', params=['generated', 'long', 'edge cases', 'empty'])
+def lines(request):
+    if request.param == 'generated':
+        return input_generators.generate_input(2, scale=0.5)
+    if request.param == 'long':
+        return input_generators.generate_input(2, scale=0.2, variant='long')
+    return EDGE_CASES if request.param == 'edge cases' else []
+
+
+def is_monotonic_within_limits(report: list[int]) -> bool:
+    steps = [y - x for x, y in zip(report, report[1:])]
+    return all(1 <= step <= 3 for step in steps) or all(-3 <= step <= -1 for step in steps)
+
+
+def is_safe_after_any_removal(report: list[int]) -> bool:
+    return bool(day_2.is_safe(report) or
+                any(day_2.is_safe(report[:idx] + report[idx + 1:]) for idx in range(len(report))))
+
+
+def test_strict_check_matches_definition():
+    rng = random.Random(2)
+    for _ in range(5000):
+        report = [rng.randint(1, 9) for _ in range(rng.randint(2, 8))]
+        assert day_2.is_safe(report) == is_monotonic_within_limits(report), report
+
+
+def test_tolerant_check_matches_trying_every_removal():
+    rng = random.Random(1)
+    for _ in range(5000):
+        report = [rng.randint(1, 9) for _ in range(rng.randint(2, 8))]
+        assert day_2.is_safe_enough(report) == is_safe_after_any_removal(report), report
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_numpy_engine_matches_reference(solve, lines, part):
+    pytest.importorskip('numpy')
+    import day_2_numpy
+    assert solve(day_2_numpy, part, lines) == solve(day_2, part, lines)
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_stream_engine_matches_reference(solve, lines, part):
+    assert solve(day_2_stream, part, lines) == solve(day_2, part, lines)
+
+
+@pytest.mark.parametrize('tolerant', [False, True])
+def test_stream_engine_sums_chunks_from_pool(lines, tolerant):
+    # chunks of a few lines with more of them than can be in flight at once
+    reports = day_2.parse_reports(lines)
+    expected = day_2.count_safe_reports_with_tolerance(reports) if tolerant else day_2.count_safe_reports(reports)
+    buffer = InputBuffer.from_lines(lines)
+    assert day_2_stream.count_safe_reports(buffer, tolerant, workers=2, chunk_bytes=256) == expected
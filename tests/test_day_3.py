@@ -0,0 +1,58 @@
+import pytest
+
+import day_3
+import day_3_bytes
+import day_3_parallel
+import day_3_table
+from input_buffer import InputBuffer
+import input_generators
+
+PARTS = [1, 2]
+# instructions and toggles split across lines, lines with trailing whitespace, operands
+# of too many digits
+EDGE_CASES = [
+    "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))",
+    'mul(1', ',2)   ', "don'", "t()mul(3,3)  \t", 'do(', ')mul(4,4)', '',
+    'mul(1234,5)mul(12,34)mul(7,', '  8)',
+]
+
+
+@pytest.fixture(scope='module', params=['generated', 'edge cases', 'empty'])
+def lines(request):
+    if request.param == 'generated':
+        return input_generators.generate_input(3, scale=0.5)
+    return EDGE_CASES if request.param == 'edge cases' else []
+
+
+def solve_reference(lines: list[str], part: int) -> int:
+    return (day_3.resolve_part1 if part == 1 else day_3.resolve_part2)([line.rstrip() for line in lines])
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_parallel_engine_matches_reference(solve, lines, part):
+    assert solve(day_3_parallel, part, lines) == solve(day_3, part, lines)
+
+
+@pytest.mark.parametrize('workers, chunk_bytes', [(1, 5), (2, 64)])
+def test_parallel_engine_stitches_small_chunks(lines, workers, chunk_bytes):
+    buffer = InputBuffer.from_lines(lines)
+    sums = list(day_3_parallel.scan_memory(buffer, workers, chunk_bytes))
+    assert sum(chunk_sums.total for chunk_sums in sums) == solve_reference(lines, part=1)
+    assert day_3_parallel.stitch_conditionally(sums) == solve_reference(lines, part=2)
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_bytes_engine_matches_reference(solve, lines, part):
+    assert solve(day_3_bytes, part, lines) == solve(day_3, part, lines)
+
+
+@pytest.mark.parametrize('window_bytes', [1, 4, 64])
+def test_bytes_engine_finds_instructions_across_windows(lines, window_bytes):
+    buffer = InputBuffer.from_lines(lines)
+    assert day_3_bytes.execute_multiplications(buffer, window_bytes) == solve_reference(lines, part=1)
+    assert day_3_bytes.execute_conditionally(buffer, window_bytes) == solve_reference(lines, part=2)
+
+
+@pytest.mark.parametrize('part', PARTS)
+def test_table_engine_matches_reference(solve, lines, part):
+    assert solve(day_3_table, part, lines) == solve(day_3, part, lines)
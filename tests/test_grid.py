@@ -0,0 +1,55 @@
+import pytest
+
+from grid import Grid, EAST, NORTH, OUTSIDE, SOUTH, WEST, turn_left, turn_right
+
+
+def test_rows_round_trip():
+    rows = ['#.#', '..S']
+    assert Grid(rows).rows() == rows
+    assert Grid([row.encode() for row in rows], padding=2).rows() == rows
+
+
+def test_index_and_coords_are_inverse():
+    grid = Grid(['abc', 'def'], padding=2)
+    for x, y in [(0, 0), (2, 1), (1, 0)]:
+        assert grid.coords(grid.index(x, y)) == (x, y)
+    assert [chr(grid.cells[idx]) for idx in grid.indices()] == list('abcdef')
+
+
+def test_stepping_off_the_map_lands_on_border():
+    grid = Grid(['ab', 'cd'])
+    corner = grid.index(0, 0)
+    assert grid.cells[corner + grid.neighbour_offsets[EAST]] == ord('b')
+    assert grid.cells[corner + grid.neighbour_offsets[SOUTH]] == ord('c')
+    assert grid.cells[corner + grid.neighbour_offsets[WEST]] == OUTSIDE
+    assert grid.cells[corner + grid.neighbour_offsets[NORTH]] == OUTSIDE
+    assert grid.cells[corner + grid.diagonal_offsets[0]] == ord('d')
+
+
+def test_find():
+    grid = Grid(['.#.', '#..'])
+    assert [grid.coords(idx) for idx in grid.find_all('#')] == [(1, 0), (0, 1)]
+    assert grid.coords(grid.find('#')) == (1, 0)
+    with pytest.raises(ValueError):
+        grid.find('S')
+
+
+def test_copy_does_not_share_cells():
+    grid = Grid.filled(2, 2)
+    copy = grid.copy()
+    copy.cells[copy.index(0, 0)] = ord('#')
+    assert grid.rows() == ['..', '..']
+    assert copy.rows() == ['#.', '..']
+
+
+def test_rows_of_different_width_are_rejected():
+    with pytest.raises(ValueError):
+        Grid(['abc', 'de'])
+    with pytest.raises(ValueError):
+        Grid(['ab', 'cde'])
+
+
+def test_turns():
+    assert turn_right(NORTH) == EAST
+    assert turn_left(EAST) == NORTH
+    assert turn_right(turn_left(SOUTH)) == SOUTH
@@ -0,0 +1,28 @@
+from input_buffer import InputBuffer, open_input_buffer
+
+
+def test_lines_of_mapped_file(write_file):
+    buffer = open_input_buffer(write_file('input.txt', 'ab\r\n\ncd'))
+    assert len(buffer) == 3
+    assert [bytes(line) for line in buffer] == [b'ab', b'', b'cd']
+    assert list(buffer.line_starts) == [0, 4, 5]
+
+
+def test_empty_file_gives_empty_buffer(write_file):
+    buffer = open_input_buffer(write_file('input.txt', ''))
+    assert len(buffer) == 0
+    assert list(buffer) == []
+
+
+def test_from_lines_matches_file(write_file):
+    lines = ['3   4', '4   3']
+    buffer = InputBuffer.from_lines(lines)
+    assert bytes(buffer.view) == open_input_buffer(write_file('input.txt', '3   4\n4   3\n')).view.tobytes()
+    assert [bytes(line).decode() for line in buffer] == lines
+    assert len(InputBuffer.from_lines([])) == 0
+
+
+def test_find_and_slice():
+    buffer = InputBuffer(b'mul(1,2)mul(3,4)')
+    assert buffer.find(b'mul', 1) == 8
+    assert buffer.slice(8, 16) == b'mul(3,4)'
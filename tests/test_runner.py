@@ -0,0 +1,12 @@
+import input_generators
+import runner
+
+
+def test_failing_part_does_not_discard_other_results(working_dir, capsys):
+    input_generators.write_input(str(working_dir / 'day_3.in'), 3, scale=0.1)
+    status = runner.run_many_days([3, 4], [1], str(working_dir / 'day_{day}.in'), workers=1, answers=None)
+
+    rows = capsys.readouterr().out.splitlines()
+    assert status == 1
+    assert rows[1].split()[:2] == ['3', '1'] and 'error' not in rows[1]
+    assert rows[2].split()[:2] == ['4', '1'] and 'error: FileNotFoundError' in rows[2]
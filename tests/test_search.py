@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from grid import Grid, OUTSIDE
+import search
+
+MAZE = [
+    'S..#',
+    '.#..',
+    '...E',
+]
+BLOCKED = bytes([ord('#'), OUTSIDE])
+
+
+def random_graph(seed: int, node_count: int, max_weight: int) -> dict[int, list[tuple[int, int]]]:
+    rng = random.Random(seed)
+    return {node: [(rng.randrange(node_count), rng.randint(1, max_weight)) for _ in range(3)]
+            for node in range(node_count)}
+
+
+def test_bfs_finds_shortest_path_on_grid():
+    grid = Grid(MAZE)
+    start, end = grid.find('S'), grid.find('E')
+    result = search.bfs(len(grid.cells), [start], search.grid_neighbours(grid, BLOCKED), targets={end})
+    path = search.reconstruct_path(result.parents, end)
+    assert result.distances[end] == 5
+    assert path[0] == start and path[-1] == end and len(path) == 6
+    assert all(grid.cells[node] not in BLOCKED for node in path)
+
+
+def test_bfs_collects_all_shortest_paths():
+    grid = Grid(MAZE)
+    start, end = grid.find('S'), grid.find('E')
+    result = search.bfs(len(grid.cells), [start], search.grid_neighbours(grid, BLOCKED), all_parents=True)
+    on_paths = {grid.coords(node) for node in search.collect_dag_nodes(result.predecessors, [end])}
+    assert on_paths == {(0, 0), (1, 0), (2, 0), (2, 1), (3, 1), (0, 1), (0, 2), (1, 2), (2, 2), (3, 2)}
+
+
+def test_bucket_queue_matches_binary_heap():
+    graph = random_graph(seed=1, node_count=200, max_weight=5)
+    heap = search.dijkstra(200, [0], graph.__getitem__)
+    buckets = search.dijkstra(200, [0], graph.__getitem__, max_weight=5)
+    assert heap.distances == buckets.distances
+
+
+def test_astar_matches_dijkstra_with_zero_heuristic():
+    graph = random_graph(seed=2, node_count=200, max_weight=9)
+    expected = search.dijkstra(200, [0], graph.__getitem__)
+    target = max(range(200), key=lambda node: expected.distances[node])
+    result = search.astar(200, [0], graph.__getitem__, {target}, heuristic=lambda node: 0)
+    assert result.distances[target] == expected.distances[target]
+
+
+def test_unreachable_nodes_keep_marker():
+    result = search.bfs(3, [0], lambda node: [1] if node == 0 else [])
+    assert list(result.distances) == [0, 1, search.UNREACHED]
+
+
+def test_bucket_queue_pops_in_priority_order():
+    queue = search.BucketQueue(max_weight=3)
+    for priority, node in [(2, 20), (0, 0), (3, 30), (1, 10)]:
+        queue.push(priority, node)
+    assert [queue.pop() for _ in range(len(queue))] == [(0, 0), (1, 10), (2, 20), (3, 30)]
+    with pytest.raises(IndexError):
+        queue.pop()
@@ -0,0 +1,46 @@
+import pytest
+
+from tokenizer import Instruction, InstructionTable
+
+TABLE = InstructionTable([
+    Instruction('mul', arity=2),
+    Instruction('do', arity=0),
+    Instruction("don't", arity=0),
+])
+
+
+def tokenize(memory: bytes) -> list[tuple[str, tuple[int, ...]]]:
+    return [(TABLE.instructions[instruction_id].name, operands)
+            for instruction_id, operands in TABLE.tokenize(memory)]
+
+
+def test_keywords_sharing_prefixes():
+    assert tokenize(b"do()don't()dodon't()") == [('do', ()), ("don't", ()), ("don't", ())]
+
+
+def test_keyword_starting_inside_another_one():
+    assert tokenize(b'mumul(2,3)mmul(4,5)') == [('mul', (2, 3)), ('mul', (4, 5))]
+
+
+def test_invalid_operands_are_skipped():
+    memory = b'mul(1234,5)mul( 1,2)mul(1,2,3)mul()do(1)mul[1,2]mul(7,8'
+    assert tokenize(memory) == []
+
+
+def test_scan_goes_on_after_rejected_operands():
+    assert tokenize(b'mul(1,mul(2,3)do(mul(4,5)') == [('mul', (2, 3)), ('mul', (4, 5))]
+
+
+def test_arity_picks_among_instructions_ending_together():
+    table = InstructionTable([Instruction('ab', arity=1), Instruction('b', arity=2)])
+    assert list(table.tokenize(b'ab(1,2)ab(3)')) == [(1, (1, 2)), (0, (3,))]
+
+
+@pytest.mark.parametrize('instructions', [
+    [Instruction('mul2', arity=2)],
+    [Instruction('', arity=0)],
+    [Instruction('do', arity=0), Instruction('do', arity=1)],
+])
+def test_invalid_instruction_names_are_rejected(instructions):
+    with pytest.raises(ValueError):
+        InstructionTable(instructions)
@@ -0,0 +1,123 @@
+from collections import deque
+from typing import Iterator, NamedTuple, Sequence
+
+# Tokenizer of instructions written as name(operand,...) in corrupted memory, made of an
+# Aho-Corasick automaton over 'name(' of every registered instruction, compiled into a
+# table of transitions by byte, and an operand parser shared by all instructions. Memory
+# is read from left to right without going back: keywords sharing prefixes or overlapping
+# one another are followed by the automaton, bytes which cannot start a keyword are
+# skipped with bytes.find, and operands are parsed once, whichever instructions end with
+# the keyword. Names must not contain digits, commas nor parentheses, so no instruction
+# can start within operands, and the scan may go on right after a keyword whose operands
+# are rejected.
+
+MAX_DIGITS = 3
+FORBIDDEN_IN_NAMES = b'0123456789,()'
+ALPHABET_SIZE = 256
+
+Operands = tuple[int, ...]
+
+
+class Instruction(NamedTuple):
+    name: str
+    arity: int
+
+
+class InstructionTable:
+    def __init__(self, instructions: Sequence[Instruction]):
+        self.instructions = tuple(instructions)
+        keywords = [instruction.name.encode() + b'(' for instruction in self.instructions]
+        for instruction, keyword in zip(self.instructions, keywords):
+            if not instruction.name or any(c in FORBIDDEN_IN_NAMES for c in keyword[:-1]):
+                raise ValueError(f'invalid instruction name: {instruction.name!r}')
+        if len(set(keywords)) < len(keywords):
+            raise ValueError('instruction names must be unique')
+
+        # trie of keywords
+        children = [{}]
+        terminal = [None]
+        for instruction_id, keyword in enumerate(keywords):
+            state = 0
+            for c in keyword:
+                if c not in children[state]:
+                    children[state][c] = len(children)
+                    children.append({})
+                    terminal.append(None)
+                state = children[state][c]
+            terminal[state] = instruction_id
+
+        # transitions by byte of every state, following failure links where the trie has
+        # no child; candidates are instructions whose keyword ends at the state, longest
+        # (i.e. leftmost starting) first
+        rows = [[0] * ALPHABET_SIZE for _ in children]
+        candidates = [()] * len(children)
+        failure = [0] * len(children)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            own = () if terminal[state] is None else (terminal[state],)
+            candidates[state] = own + (candidates[failure[state]] if state else ())
+            row = rows[state]
+            fallback = rows[failure[state]]
+            for c in range(ALPHABET_SIZE):
+                child = children[state].get(c)
+                if child is None:
+                    row[c] = fallback[c] if state else 0
+                else:
+                    failure[child] = fallback[c] if state else 0
+                    row[c] = child
+                    queue.append(child)
+
+        # States are renumbered so that those ending keywords come last, and stored as offsets
+        # of their rows in one flat table, so a step is one lookup and one comparison tells
+        # whether a keyword ended. The initial state stays 0.
+        order = sorted(range(len(children)), key=lambda state: bool(candidates[state]))
+        offsets = [0] * len(children)
+        for idx, state in enumerate(order):
+            offsets[state] = idx * ALPHABET_SIZE
+        self._transitions = [offsets[target] for state in order for target in rows[state]]
+        self._candidates = [candidates[state] for state in order]
+        self._first_ending = sum(1 for state in order if not candidates[state]) * ALPHABET_SIZE
+
+        # bytes which move the automaton out of its initial state, the only ones worth
+        # stopping at while no keyword is in progress
+        self._start_marks = bytes(int(c in children[0]) for c in range(ALPHABET_SIZE))
+        self._arities = [instruction.arity for instruction in self.instructions]
+        self._max_operands_length = max(self._arities, default=0) * (MAX_DIGITS + 1)
+
+    def tokenize(self, memory: bytes) -> Iterator[tuple[int, Operands]]:
+        transitions = self._transitions
+        candidates = self._candidates
+        first_ending = self._first_ending
+        arities = self._arities
+        operands_end = self._max_operands_length + 1
+        find_mark = memory.translate(self._start_marks).find
+        find = memory.find
+        size = len(memory)
+        state = 0
+        pos = 0
+        while True:
+            if not state:
+                pos = find_mark(1, pos)
+                if pos == -1:
+                    return
+            elif pos == size:
+                return
+            state = transitions[state + memory[pos]]
+            pos += 1
+            if state < first_ending:
+                continue
+            ending = candidates[state // ALPHABET_SIZE]
+            state = 0
+
+            closing = find(b')', pos, pos + operands_end)
+            if closing == -1:
+                continue
+            operands = memory[pos:closing].split(b',') if closing > pos else ()
+            if not all(operand.isdigit() and len(operand) <= MAX_DIGITS for operand in operands):
+                continue
+            for instruction_id in ending:
+                if arities[instruction_id] == len(operands):
+                    yield instruction_id, tuple(map(int, operands))
+                    pos = closing + 1
+                    break
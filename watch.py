@@ -0,0 +1,169 @@
+import importlib
+import inspect
+import os
+import sys
+import time
+import traceback
+import types
+from typing import Any, Callable, Optional
+
+import cache
+
+POLL_INTERVAL = 0.5
+
+# Part solvers are fingerprinted by source of every module level function and class they
+# reach through names used in their code, plus repr of other module level values. A change
+# of the day module then re-solves only parts whose fingerprint differs, and the model is
+# parsed again only when the input, a shared helper module or the parse hook changed.
+
+Fingerprint = dict[str, str]
+
+
+def collect_code_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= collect_code_names(const)
+    return names
+
+
+def fingerprint(daily_module, entry: str) -> Fingerprint:
+    result = {}
+    pending = [entry]
+    while pending:
+        name = pending.pop()
+        if name in result or not hasattr(daily_module, name):
+            continue
+        value = getattr(daily_module, name)
+        if isinstance(value, types.ModuleType):
+            continue
+        if isinstance(value, (types.FunctionType, type)) and value.__module__ == daily_module.__name__:
+            result[name] = inspect.getsource(value)
+            functions = vars(value).values() if isinstance(value, type) else [value]
+            for function in functions:
+                if isinstance(function, types.FunctionType):
+                    pending.extend(collect_code_names(function.__code__))
+        else:
+            result[name] = repr(value)
+    return result
+
+
+def file_version(path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def find_module_names(paths: list[str]) -> list[str]:
+    by_path = {os.path.abspath(getattr(module, '__file__', None) or ''): name
+               for name, module in list(sys.modules.items())}
+    return [by_path[os.path.abspath(path)] for path in paths if os.path.abspath(path) in by_path]
+
+
+def format_delta(previous: Optional[float], current: float) -> str:
+    if previous is None or previous <= 0:
+        return ''
+    delta = current - previous
+    return f', {delta:+.3f} s ({delta / previous * 100:+.1f}%) vs previous run'
+
+
+class SolverWatch:
+    def __init__(self, day: int, parts: list[int], input_file: str,
+                 load_day: Callable, load_model: Callable[[Any, str], Any]):
+        # load_day and load_model come from runner, which cannot be imported from here
+        self._day = day
+        self._parts = parts
+        self._input_file = input_file
+        self._load_model = load_model
+        self._module = load_day(day)
+        self._model = None
+        self._fingerprints = {}
+        self._answers = {}
+        self._times = {}
+        self._versions = self.__current_versions()
+
+    def run(self, interval: float = POLL_INTERVAL) -> None:
+        print(f'Watching {os.path.basename(self._module.__file__)} and {self._input_file}, '
+              f'press Ctrl+C to stop')
+        self.__resolve(self._parts, reparse=True)
+        try:
+            while True:
+                time.sleep(interval)
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+
+    def poll(self) -> None:
+        versions = self.__current_versions()
+        changed = [path for path in versions if versions[path] != self._versions.get(path)]
+        if not changed:
+            return
+        self._versions = versions
+        print(f'\n[{time.strftime("%H:%M:%S")}] changed: {", ".join(map(os.path.basename, changed))}')
+
+        input_changed = self._input_file in changed
+        helpers = [path for path in changed if path not in (self._input_file, self._module.__file__)]
+        source_changed = len(changed) > int(input_changed)
+        if source_changed:
+            try:
+                for name in find_module_names(helpers):
+                    importlib.reload(sys.modules[name])
+                self._module = importlib.reload(self._module)
+            except Exception:
+                traceback.print_exc()
+                return
+            # reloaded module may import helpers which were not watched so far
+            self._versions = self.__current_versions()
+
+        reparse = (input_changed or bool(helpers) or self._model is None or
+                   self.__fingerprint('parse') != self._fingerprints.get('parse'))
+        if reparse:
+            parts = self._parts
+        else:
+            parts = [part for part in self._parts
+                     if self.__fingerprint(f'resolve_part{part}') != self._fingerprints.get(part)]
+        if not parts:
+            print('Solvers of watched parts did not change')
+            return
+        self.__resolve(parts, reparse)
+
+    def __current_versions(self) -> dict[str, Optional[tuple[int, int]]]:
+        paths = [self._input_file, self._module.__file__] + cache.local_dependencies(self._module)
+        return {path: file_version(path) for path in paths}
+
+    def __fingerprint(self, entry: str) -> Fingerprint:
+        try:
+            return fingerprint(self._module, entry)
+        except (OSError, TypeError):
+            # source not available, consider it changed
+            return {'': str(time.perf_counter())}
+
+    def __resolve(self, parts: list[int], reparse: bool) -> None:
+        if reparse:
+            try:
+                self._model = self._load_model(self._module, self._input_file)
+            except Exception:
+                traceback.print_exc()
+                return
+            self._fingerprints['parse'] = self.__fingerprint('parse')
+        else:
+            print('Reusing parsed model' if hasattr(self._module, 'parse') else 'Reusing input')
+
+        for part in parts:
+            self._fingerprints[part] = self.__fingerprint(f'resolve_part{part}')
+            start = time.perf_counter()
+            try:
+                answer = getattr(self._module, f'resolve_part{part}')(self._model)
+            except Exception:
+                traceback.print_exc()
+                continue
+            wall_time = time.perf_counter() - start
+            previous_answer = self._answers.get(part)
+            change = (f' (was {previous_answer})'
+                      if part in self._answers and previous_answer != answer else '')
+            print(f'Part {part} solution: {answer}{change}  '
+                  f'[{wall_time:.3f} s{format_delta(self._times.get(part), wall_time)}]')
+            self._answers[part] = answer
+            self._times[part] = wall_time